@@ -0,0 +1,398 @@
+"""
+Anti-Raid Cog - Join-rate detection with automatic lockdown and suspect handling
+"""
+
+import discord
+from discord.ext import commands, tasks
+from discord import app_commands
+from collections import Counter, deque
+import logging
+import os
+import re
+import time
+from config import BotConfig
+from database import close_database, open_database
+
+logger = logging.getLogger(__name__)
+
+NAME_KEY_PATTERN = re.compile(r"[^a-z]+")
+
+
+def create_embed(title=None, description=None, color=discord.Color.orange()):
+    embed = discord.Embed(
+        title=title or "Anti-Raid",
+        description=description or "",
+        color=color
+    )
+    return embed
+
+
+def name_key(name: str) -> str:
+    """Reduce a username to its letters so 'raider_01' and 'Raider22' collide."""
+    key = NAME_KEY_PATTERN.sub("", name.casefold())
+    return key if len(key) >= 3 else None
+
+
+class JoinWindow:
+    """Sliding window over one guild's recent joins.
+
+    Each join is appended once and expired once, and the name and avatar
+    counters are updated alongside, so recording a join is amortised O(1)
+    however many members arrive.
+    """
+
+    __slots__ = ('window', 'joins', 'names', 'avatars')
+
+    def __init__(self, window: float):
+        self.window = window
+        self.joins = deque()
+        self.names = Counter()
+        self.avatars = Counter()
+
+    def expire(self, now: float):
+        cutoff = now - self.window
+        joins = self.joins
+        while joins and joins[0][0] <= cutoff:
+            _, _, _, name, avatar = joins.popleft()
+            if name:
+                self.names[name] -= 1
+                if not self.names[name]:
+                    del self.names[name]
+            if avatar:
+                self.avatars[avatar] -= 1
+                if not self.avatars[avatar]:
+                    del self.avatars[avatar]
+
+    def add(self, now: float, member_id: int, created_at: float, name: str, avatar: str) -> int:
+        """Record a join; returns the number of joins in the window."""
+        self.expire(now)
+        self.joins.append((now, member_id, created_at, name, avatar))
+        if name:
+            self.names[name] += 1
+        if avatar:
+            self.avatars[avatar] += 1
+        return len(self.joins)
+
+    def is_suspicious(self, created_at: float, name: str, avatar: str, now: float,
+                      new_account_age: float, similar_threshold: int) -> bool:
+        return (
+            now - created_at < new_account_age
+            or (name is not None and self.names[name] >= similar_threshold)
+            or (avatar is not None and self.avatars[avatar] >= similar_threshold)
+        )
+
+
+class AntiRaidStore:
+    """Per-guild anti-raid settings and lockdown state in the shared SQLite database."""
+
+    COLUMNS = (
+        'enabled', 'join_threshold', 'window_seconds', 'action',
+        'alert_channel_id', 'lockdown_until', 'previous_verification'
+    )
+
+    def __init__(self, path: str):
+        self.conn = open_database(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS antiraid_settings (
+                guild_id INTEGER PRIMARY KEY,
+                enabled INTEGER NOT NULL DEFAULT 0,
+                join_threshold INTEGER NOT NULL,
+                window_seconds INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                alert_channel_id INTEGER,
+                lockdown_until REAL,
+                previous_verification INTEGER
+            )
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        close_database(self.conn)
+
+    def load_all(self) -> dict:
+        return {
+            row['guild_id']: {column: row[column] for column in self.COLUMNS}
+            for row in self.conn.execute("SELECT * FROM antiraid_settings")
+        }
+
+    def save(self, guild_id: int, settings: dict):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO antiraid_settings (guild_id, enabled, join_threshold, window_seconds, action, "
+                "alert_channel_id, lockdown_until, previous_verification) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (guild_id, *(settings[column] for column in self.COLUMNS))
+            )
+
+
+class AntiRaidCog(commands.Cog):
+    """Cog that watches join rates and locks a server down when a raid starts."""
+
+    antiraid = app_commands.Group(name="antiraid", description="Protect this server from join raids", guild_only=True)
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.config = BotConfig()
+        self.store = AntiRaidStore(os.path.join(self.config.DATA_DIR, self.config.DATABASE_FILE))
+        self.settings = self.store.load_all()
+        self.windows = {}
+        self.suspects = {}
+
+    async def cog_load(self):
+        self.process_raids.start()
+
+    async def cog_unload(self):
+        self.process_raids.cancel()
+        self.store.close()
+
+    def guild_settings(self, guild_id: int) -> dict:
+        settings = self.settings.get(guild_id)
+        if settings is None:
+            settings = {
+                'enabled': 0,
+                'join_threshold': self.config.ANTIRAID_JOIN_THRESHOLD,
+                'window_seconds': self.config.ANTIRAID_WINDOW,
+                'action': self.config.ANTIRAID_DEFAULT_ACTION,
+                'alert_channel_id': None,
+                'lockdown_until': None,
+                'previous_verification': None
+            }
+            self.settings[guild_id] = settings
+        return settings
+
+    def in_lockdown(self, settings: dict) -> bool:
+        return bool(settings['lockdown_until']) and settings['lockdown_until'] > time.time()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        settings = self.settings.get(member.guild.id)
+        if settings is None or not settings['enabled'] or member.bot:
+            return
+
+        window = self.windows.get(member.guild.id)
+        if window is None or window.window != settings['window_seconds']:
+            window = self.windows[member.guild.id] = JoinWindow(settings['window_seconds'])
+
+        now = time.time()
+        created_at = member.created_at.timestamp()
+        name = name_key(member.name)
+        avatar = member.avatar.key if member.avatar else None
+        joins = window.add(now, member.id, created_at, name, avatar)
+
+        if self.in_lockdown(settings):
+            if window.is_suspicious(created_at, name, avatar, now, self.config.ANTIRAID_NEW_ACCOUNT_AGE,
+                                    self.config.ANTIRAID_SIMILAR_THRESHOLD):
+                self.suspects.setdefault(member.guild.id, set()).add(member.id)
+        elif joins >= settings['join_threshold']:
+            # Sweep the joins that tipped the window over, then lock down
+            suspects = self.suspects.setdefault(member.guild.id, set())
+            for _, member_id, joined_created_at, joined_name, joined_avatar in window.joins:
+                if window.is_suspicious(joined_created_at, joined_name, joined_avatar, now,
+                                        self.config.ANTIRAID_NEW_ACCOUNT_AGE, self.config.ANTIRAID_SIMILAR_THRESHOLD):
+                    suspects.add(member_id)
+            await self.start_lockdown(member.guild, f"{joins} joins in {settings['window_seconds']}s")
+
+    async def start_lockdown(self, guild: discord.Guild, trigger: str):
+        """Raise verification and pause invites until the lockdown expires."""
+        settings = self.guild_settings(guild.id)
+        already_locked = self.in_lockdown(settings)
+        settings['lockdown_until'] = time.time() + self.config.ANTIRAID_LOCKDOWN_DURATION
+        if not already_locked:
+            settings['previous_verification'] = guild.verification_level.value
+        self.store.save(guild.id, settings)
+        if already_locked:
+            return
+
+        logger.warning(f"Raid detected in {guild.name} ({guild.id}): {trigger}")
+        try:
+            await guild.edit(
+                verification_level=discord.VerificationLevel.highest,
+                invites_disabled=True,
+                reason=f"Anti-raid lockdown: {trigger}"
+            )
+        except discord.HTTPException as e:
+            logger.error(f"Failed to lock down guild {guild.id}: {e}")
+
+        embed = create_embed(
+            title="🚨 Raid Detected - Server Locked Down",
+            description=f"Trigger: **{trigger}**\nVerification raised to the highest level and invites paused.",
+            color=self.config.COLORS["error"]
+        )
+        embed.add_field(name="Suspect action", value=settings['action'].title(), inline=True)
+        embed.add_field(name="Lifts", value=f"<t:{int(settings['lockdown_until'])}:R>", inline=True)
+        embed.set_footer(text="Use /antiraid lift to end the lockdown early")
+        await self.send_alert(guild, settings, embed)
+
+    async def end_lockdown(self, guild: discord.Guild, reason: str):
+        """Restore the verification level saved when the lockdown started and resume invites."""
+        settings = self.guild_settings(guild.id)
+        previous = settings['previous_verification']
+        settings['lockdown_until'] = None
+        settings['previous_verification'] = None
+        self.store.save(guild.id, settings)
+        self.windows.pop(guild.id, None)
+
+        try:
+            await guild.edit(
+                verification_level=discord.VerificationLevel(previous) if previous is not None else guild.verification_level,
+                invites_disabled=False,
+                reason=f"Anti-raid lockdown lifted: {reason}"
+            )
+        except discord.HTTPException as e:
+            logger.error(f"Failed to lift lockdown in guild {guild.id}: {e}")
+
+        embed = create_embed(
+            title="✅ Lockdown Lifted",
+            description=reason,
+            color=self.config.COLORS["success"]
+        )
+        await self.send_alert(guild, settings, embed)
+
+    async def send_alert(self, guild: discord.Guild, settings: dict, embed: discord.Embed):
+        channel = guild.get_channel(settings['alert_channel_id']) if settings['alert_channel_id'] else guild.system_channel
+        if channel is None:
+            return
+        try:
+            await channel.send(embed=embed)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to send anti-raid alert in guild {guild.id}: {e}")
+
+    @tasks.loop(seconds=5)
+    async def process_raids(self):
+        """Hand gathered suspects to the moderation cog in batches and expire finished lockdowns."""
+        moderation = self.bot.get_cog('ModerationCog')
+        for guild_id, suspects in list(self.suspects.items()):
+            if not suspects:
+                continue
+            guild = self.bot.get_guild(guild_id)
+            settings = self.settings.get(guild_id)
+            self.suspects[guild_id] = set()
+            if guild is None or settings is None or settings['action'] == 'none' or moderation is None:
+                continue
+            duration = self.config.ANTIRAID_TIMEOUT_MINUTES if settings['action'] == 'timeout' else 1
+            job_id = await moderation.queue_automatic_action(
+                guild, settings['alert_channel_id'], settings['action'], sorted(suspects),
+                "Anti-raid: suspicious account joined during a raid", duration
+            )
+            logger.info(f"Queued anti-raid {settings['action']} #{job_id} for {len(suspects)} members in {guild_id}")
+
+        now = time.time()
+        for guild_id, settings in list(self.settings.items()):
+            if settings['lockdown_until'] and settings['lockdown_until'] <= now:
+                guild = self.bot.get_guild(guild_id)
+                if guild is not None:
+                    await self.end_lockdown(guild, "Lockdown period ended")
+
+    @process_raids.before_loop
+    async def before_process_raids(self):
+        await self.bot.wait_until_ready()
+
+    @antiraid.command(name="setup", description="Configure raid detection for this server")
+    @app_commands.describe(
+        enabled="Turn raid detection on or off",
+        join_threshold="Joins within the window that trigger a lockdown",
+        window="Window length in seconds",
+        action="What to do with suspicious accounts that join during a raid",
+        alert_channel="Channel for raid alerts (defaults to the system channel)"
+    )
+    @app_commands.choices(action=[
+        app_commands.Choice(name="Timeout", value="timeout"),
+        app_commands.Choice(name="Ban", value="ban"),
+        app_commands.Choice(name="Alert only", value="none")
+    ])
+    async def setup_antiraid(self, interaction: discord.Interaction, enabled: bool, join_threshold: int = None,
+                             window: int = None, action: str = None, alert_channel: discord.TextChannel = None):
+        """Enable, disable or tune raid detection."""
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("❌ You need the Manage Server permission to configure anti-raid.", ephemeral=True)
+            return
+
+        if join_threshold is not None and join_threshold < 2:
+            await interaction.response.send_message("❌ The join threshold must be at least 2.", ephemeral=True)
+            return
+        if window is not None and not 1 <= window <= self.config.ANTIRAID_MAX_WINDOW:
+            await interaction.response.send_message(
+                f"❌ The window must be between 1 and {self.config.ANTIRAID_MAX_WINDOW} seconds.", ephemeral=True
+            )
+            return
+
+        settings = self.guild_settings(interaction.guild.id)
+        settings['enabled'] = int(enabled)
+        if join_threshold is not None:
+            settings['join_threshold'] = join_threshold
+        if window is not None:
+            settings['window_seconds'] = window
+        if action is not None:
+            settings['action'] = action
+        if alert_channel is not None:
+            settings['alert_channel_id'] = alert_channel.id
+        self.store.save(interaction.guild.id, settings)
+        self.windows.pop(interaction.guild.id, None)
+
+        await interaction.response.send_message(embed=self.status_embed(interaction.guild, settings), ephemeral=True)
+
+    @antiraid.command(name="status", description="Show raid detection settings and lockdown state")
+    async def status(self, interaction: discord.Interaction):
+        """Show the current anti-raid configuration."""
+        settings = self.guild_settings(interaction.guild.id)
+        await interaction.response.send_message(embed=self.status_embed(interaction.guild, settings), ephemeral=True)
+
+    @antiraid.command(name="lockdown", description="Lock the server down manually")
+    async def lockdown(self, interaction: discord.Interaction):
+        """Start a lockdown without waiting for the detector."""
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("❌ You need the Manage Server permission to lock down the server.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        await self.start_lockdown(interaction.guild, f"manual lockdown by {interaction.user}")
+        await interaction.followup.send("🔒 Server locked down.", ephemeral=True)
+
+    @antiraid.command(name="lift", description="End the current lockdown")
+    async def lift(self, interaction: discord.Interaction):
+        """End a lockdown early and restore the previous verification level."""
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("❌ You need the Manage Server permission to lift a lockdown.", ephemeral=True)
+            return
+
+        settings = self.guild_settings(interaction.guild.id)
+        if not self.in_lockdown(settings):
+            await interaction.response.send_message("❌ The server is not locked down.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        self.suspects.pop(interaction.guild.id, None)
+        await self.end_lockdown(interaction.guild, f"Lifted by {interaction.user}")
+        await interaction.followup.send("🔓 Lockdown lifted.", ephemeral=True)
+
+    def status_embed(self, guild: discord.Guild, settings: dict) -> discord.Embed:
+        embed = create_embed(
+            title="🛡️ Anti-Raid Settings",
+            color=self.config.COLORS["info"]
+        )
+        embed.add_field(name="Enabled", value="Yes" if settings['enabled'] else "No", inline=True)
+        embed.add_field(
+            name="Trigger",
+            value=f"{settings['join_threshold']} joins / {settings['window_seconds']}s",
+            inline=True
+        )
+        embed.add_field(name="Suspect action", value=settings['action'].title(), inline=True)
+        channel_id = settings['alert_channel_id']
+        embed.add_field(
+            name="Alerts",
+            value=f"<#{channel_id}>" if channel_id else "System channel",
+            inline=True
+        )
+        if self.in_lockdown(settings):
+            embed.add_field(name="Lockdown", value=f"Active, lifts <t:{int(settings['lockdown_until'])}:R>", inline=True)
+        window = self.windows.get(guild.id)
+        if window is not None:
+            window.expire(time.time())
+            embed.add_field(name="Recent joins", value=str(len(window.joins)), inline=True)
+        return embed
+
+
+async def setup(bot):
+    bot.mark_setup_started(__name__)
+    await bot.add_cog(AntiRaidCog(bot))
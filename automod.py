@@ -0,0 +1,200 @@
+"""
+Automod Cog - Streaming spam filter for message floods, duplicates, mention spam and invite links
+"""
+
+import discord
+from discord.ext import commands
+from discord import app_commands
+import logging
+import os
+import time
+from config import BotConfig
+from database import close_database, open_database
+from spam_filter import SpamFilter
+
+logger = logging.getLogger(__name__)
+
+
+def create_embed(title=None, description=None, color=discord.Color.orange()):
+    embed = discord.Embed(
+        title=title or "Automod",
+        description=description or "",
+        color=color
+    )
+    return embed
+
+
+class AutomodStore:
+    """Per-guild automod settings in the shared SQLite database."""
+
+    def __init__(self, path: str):
+        self.conn = open_database(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS automod_settings (
+                guild_id INTEGER PRIMARY KEY,
+                enabled INTEGER NOT NULL DEFAULT 0,
+                log_channel_id INTEGER
+            )
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        close_database(self.conn)
+
+    def load_enabled(self) -> dict:
+        """guild_id -> log channel id (or None) for every guild with automod on."""
+        return {
+            guild_id: log_channel_id
+            for guild_id, log_channel_id in self.conn.execute(
+                "SELECT guild_id, log_channel_id FROM automod_settings WHERE enabled = 1"
+            )
+        }
+
+    def save(self, guild_id: int, enabled: bool, log_channel_id: int):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO automod_settings (guild_id, enabled, log_channel_id) VALUES (?, ?, ?)",
+                (guild_id, int(enabled), log_channel_id)
+            )
+
+
+class AutomodCog(commands.Cog):
+    """Cog that filters spam as messages arrive and escalates repeat offenders to timeouts."""
+
+    automod = app_commands.Group(name="automod", description="Automatic spam filtering", guild_only=True)
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.config = BotConfig()
+        self.store = AutomodStore(os.path.join(self.config.DATA_DIR, self.config.DATABASE_FILE))
+        self.enabled = self.store.load_enabled()
+        self.filter = SpamFilter(self.config)
+        self.stats = {'checked': 0, 'deleted': 0, 'timeouts': 0}
+
+    async def cog_unload(self):
+        self.store.close()
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.guild is None or message.author.bot or message.guild.id not in self.enabled:
+            return
+
+        now = time.monotonic()
+        self.stats['checked'] += 1
+        state, violation = self.filter.check(message, now)
+        if violation is None:
+            return
+
+        # Permission lookups are comparatively expensive, so only pay for them on a hit
+        author = message.author
+        if not isinstance(author, discord.Member) or author.guild_permissions.manage_messages:
+            return
+
+        try:
+            await message.delete()
+            self.stats['deleted'] += 1
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            logger.info(f"Automod could not delete message {message.id}: {e}")
+
+        if author.is_timed_out():
+            return  # The rest of a burst that was already dealt with
+        minutes = self.filter.strike(state, now)
+        if not minutes:
+            return
+
+        moderation = self.bot.get_cog('ModerationCog')
+        if moderation is None:
+            self.filter.timeout_failed(state)
+            return
+        reason = f"Automod: {violation}"
+        try:
+            case_number = await moderation.auto_timeout(author, minutes, reason)
+            self.stats['timeouts'] += 1
+        except discord.HTTPException as e:
+            logger.warning(f"Automod could not time out {author.id} in {message.guild.id}: {e}")
+            self.filter.timeout_failed(state)
+            return
+
+        await self.log_action(message.guild, author, reason, minutes, case_number)
+
+    async def log_action(self, guild: discord.Guild, member: discord.Member, reason: str, minutes: int, case_number: int):
+        channel_id = self.enabled.get(guild.id)
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if channel is None:
+            return
+        embed = create_embed(
+            title="🤖 Automod Timeout",
+            description=f"{member.mention} was timed out for {minutes} minutes",
+            color=self.config.COLORS["warning"]
+        )
+        embed.add_field(name="Reason", value=reason, inline=True)
+        embed.set_footer(text=f"Case #{case_number}")
+        try:
+            await channel.send(embed=embed)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to send automod log in guild {guild.id}: {e}")
+
+    @automod.command(name="setup", description="Turn the spam filter on or off")
+    @app_commands.describe(
+        enabled="Whether automod filters messages in this server",
+        log_channel="Channel where automatic timeouts are logged"
+    )
+    async def setup_automod(self, interaction: discord.Interaction, enabled: bool, log_channel: discord.TextChannel = None):
+        """Enable or disable the spam filter."""
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("❌ You need the Manage Server permission to configure automod.", ephemeral=True)
+            return
+
+        log_channel_id = log_channel.id if log_channel else self.enabled.get(interaction.guild.id)
+        self.store.save(interaction.guild.id, enabled, log_channel_id)
+        if enabled:
+            self.enabled[interaction.guild.id] = log_channel_id
+        else:
+            self.enabled.pop(interaction.guild.id, None)
+
+        await interaction.response.send_message(
+            f"✅ Automod {'enabled' if enabled else 'disabled'}"
+            + (f", logging to <#{log_channel_id}>." if enabled and log_channel_id else "."),
+            ephemeral=True
+        )
+
+    @automod.command(name="status", description="Show spam filter settings and activity")
+    async def status(self, interaction: discord.Interaction):
+        """Show automod configuration and counters."""
+        config = self.config
+        enabled = interaction.guild.id in self.enabled
+        embed = create_embed(
+            title="🤖 Automod",
+            description="Enabled" if enabled else "Disabled",
+            color=self.config.COLORS["info"]
+        )
+        embed.add_field(
+            name="Limits",
+            value=f"• {config.AUTOMOD_RATE_LIMIT} messages / {config.AUTOMOD_RATE_WINDOW}s\n"
+                  f"• {config.AUTOMOD_DUPLICATE_LIMIT} identical messages in a row\n"
+                  f"• {config.AUTOMOD_MENTION_LIMIT} mentions / {config.AUTOMOD_MENTION_WINDOW}s\n"
+                  f"• No invite links",
+            inline=False
+        )
+        embed.add_field(
+            name="Escalation",
+            value=f"Timeout after {config.AUTOMOD_STRIKES_BEFORE_TIMEOUT} strikes: "
+                  + ", ".join(f"{minutes}m" for minutes in config.AUTOMOD_TIMEOUT_STEPS),
+            inline=False
+        )
+        if enabled and self.enabled[interaction.guild.id]:
+            embed.add_field(name="Log channel", value=f"<#{self.enabled[interaction.guild.id]}>", inline=True)
+        embed.set_footer(
+            text=f"Checked {self.stats['checked']} • deleted {self.stats['deleted']} • "
+                 f"timeouts {self.stats['timeouts']} • tracking {len(self.filter.users)} users"
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot):
+    bot.mark_setup_started(__name__)
+    await bot.add_cog(AutomodCog(bot))
@@ -4,87 +4,238 @@ Discord Bot Core Implementation
 
 import discord
 from discord.ext import commands
+import hashlib
+import json
 import logging
 import asyncio
+import os
+import time
+from collections import Counter
 from config import BotConfig
+from football_api import FootballAPIClient
 
 logger = logging.getLogger(__name__)
 
-class DiscordBot(commands.Bot):
-    """Main Discord Bot class with all core functionality."""
+class DiscordBot(commands.AutoShardedBot):
+    """Main Discord Bot class with all core functionality.
     
-    def __init__(self):
+    Runs every shard Discord recommends by default; set ``SHARD_COUNT`` and
+    ``SHARD_IDS`` (or pass them in, as the cluster launcher does) to have this
+    process own only part of a larger shard range.
+    """
+    
+    def __init__(self, shard_ids: list = None, shard_count: int = None):
         # Set up bot intents
         intents = discord.Intents.default()
         # Enable message content if needed for non-slash commands (optional)
         intents.message_content = True
+        # Member cache is needed for mass-action filters (privileged intent)
+        intents.members = True
 
         super().__init__(
             command_prefix=BotConfig.PREFIX,
             intents=intents,
             help_command=None,  # Custom help command
             case_insensitive=True,
-            strip_after_prefix=True
+            strip_after_prefix=True,
+            shard_count=shard_count or BotConfig.SHARD_COUNT,
+            shard_ids=shard_ids or BotConfig.SHARD_IDS
         )
         
         self.config = BotConfig()
+        self.football_api = FootballAPIClient()
+        self.cog_timings = {}
+        self.setup_started = {}
+        # Set by the cluster launcher to coordinate identifies across processes
+        self.identify_gate = None
         
     async def setup_hook(self):
         """Called when the bot is starting up."""
         logger.info("Setting up bot...")
+        if self.shard_ids is not None:
+            logger.info(f"Running shards {self.shard_ids} of {self.shard_count}")
 
-        # ✅ Load cogs from the same directory
-        cogs_to_load = [
-            'moderation',
-            'server_info',
-            'user_info',
-            'utilities',
-            'roles'
-        ]
-        
-        for cog in cogs_to_load:
-            try:
-                await self.load_extension(cog)
-                logger.info(f"Loaded cog: {cog}")
-            except Exception as e:
-                logger.error(f"Failed to load cog {cog}: {e}")
+        # 🌐 Open shared HTTP clients
+        await self.football_api.start()
+
+        # ✅ Load cogs from the same directory, mapped to the cogs they need loaded first
+        cogs_to_load = {
+            'moderation': [],
+            'server_info': [],
+            'user_info': [],
+            'utilities': [],
+            'roles': [],
+            'live_scores': [],
+            'antiraid': ['moderation'],
+            'automod': ['moderation']
+        }
+        await self.load_cogs(cogs_to_load)
         
         # 🔄 Sync slash commands
+        await self.sync_commands()
+    
+    async def load_cogs(self, cogs: dict):
+        """Load cogs, each one waiting only for the cogs it depends on.
+
+        Importing a cog blocks the loop, so loads only overlap while a cog's
+        setup awaits (e.g. in cog_load).
+        """
+        started = time.perf_counter()
+        self.cog_timings = {}
+        tasks = {}
+        for name, dependencies in cogs.items():
+            tasks[name] = asyncio.create_task(self.load_cog(name, dependencies, tasks))
+        await asyncio.gather(*tasks.values())
+        
+        total = time.perf_counter() - started
+        lines = [f"{'cog':<14}{'import':>10}{'setup':>10}{'total':>10}"]
+        for name, (import_time, setup_time) in sorted(self.cog_timings.items(), key=lambda item: -sum(item[1])):
+            lines.append(
+                f"{name:<14}{import_time * 1000:>8.1f}ms{setup_time * 1000:>8.1f}ms{(import_time + setup_time) * 1000:>8.1f}ms"
+            )
+        logger.info(f"Loaded {len(self.cog_timings)}/{len(cogs)} cogs in {total * 1000:.1f}ms\n" + "\n".join(lines))
+    
+    async def load_cog(self, name: str, dependencies: list, tasks: dict) -> bool:
+        """Load one cog once its dependencies are in, recording how long import and setup took."""
+        for dependency in dependencies:
+            task = tasks.get(dependency)
+            if task is None or not await task:
+                logger.error(f"Skipping cog {name}: dependency {dependency} is not loaded")
+                return False
+        
+        # load_extension executes the module and then calls its setup(), which marks where one ends
+        started = time.perf_counter()
+        try:
+            await self.load_extension(name)
+        except Exception as e:
+            logger.error(f"Failed to load cog {name}: {e}")
+            return False
+        
+        finished = time.perf_counter()
+        setup_started = self.setup_started.pop(name, started)
+        self.cog_timings[name] = (setup_started - started, finished - setup_started)
+        logger.info(f"Loaded cog: {name}")
+        return True
+    
+    def mark_setup_started(self, name: str):
+        """Called first thing in a cog's setup() so its import and setup time can be told apart."""
+        self.setup_started[name] = time.perf_counter()
+    
+    def command_tree_fingerprint(self) -> str:
+        """Stable hash of the global command payload Discord would receive on sync."""
+        payload = sorted(
+            (command.to_dict(self.tree) for command in self.tree.get_commands()),
+            key=lambda command: (command.get('type', 1), command['name'])
+        )
+        serialized = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+    
+    async def sync_commands(self):
+        """Sync slash commands only when the command tree changed since the last successful sync."""
+        if self.shard_ids is not None and 0 not in self.shard_ids:
+            # Global commands are per application, so only the process owning shard 0 syncs them
+            return
+        
+        path = os.path.join(self.config.DATA_DIR, self.config.COMMAND_TREE_HASH_FILE)
+        fingerprint = self.command_tree_fingerprint()
+        key = str(self.application_id)
+        
+        stored = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable command tree fingerprint: {e}")
+        
+        if stored.get(key) == fingerprint and not self.config.FORCE_COMMAND_SYNC:
+            logger.info("Slash commands unchanged since last sync, skipping sync")
+            return
+        
         try:
             synced = await self.tree.sync()
             logger.info(f"Synced {len(synced)} slash commands")
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
+            return
+        
+        stored[key] = fingerprint
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save command tree fingerprint: {e}")
+    
+    async def before_identify_hook(self, shard_id: int, *, initial: bool = False):
+        """Wait for the cluster supervisor's go-ahead before identifying, when running in a cluster."""
+        if self.identify_gate is None:
+            await super().before_identify_hook(shard_id, initial=initial)
+        else:
+            await self.identify_gate(shard_id)
+    
+    def owns_guild(self, guild_id: int) -> bool:
+        """Whether this process's shards receive events for ``guild_id`` (``None`` means DMs, on shard 0)."""
+        if self.shard_ids is None:
+            return True
+        if guild_id is None:
+            return 0 in self.shard_ids
+        return (guild_id >> 22) % self.shard_count in self.shard_ids
+    
+    def health_snapshot(self) -> dict:
+        """Readiness, guild count and per-shard gateway latency for the health endpoint."""
+        shards = {}
+        for shard_id, shard in self.shards.items():
+            latency = shard.latency
+            shards[shard_id] = {
+                'connected': not shard.is_closed(),
+                'latency_ms': round(latency * 1000) if latency == latency and latency != float('inf') else None
+            }
+        return {'ready': self.is_ready(), 'guilds': len(self.guilds), 'shards': shards}
+    
+    async def close(self):
+        """Release shared resources before shutting down."""
+        await self.football_api.close()
+        await super().close()
     
     async def on_ready(self):
         """Called when the bot has successfully connected to Discord."""
         logger.info(f"Bot is ready! Logged in as {self.user}")
         logger.info(f"Bot ID: {self.user.id}")
-        logger.info(f"Connected to {len(self.guilds)} guilds")
+        logger.info(f"Connected to {len(self.guilds)} guilds on {len(self.shards)} shards")
         
-        activity = discord.Activity(
-            type=discord.ActivityType.watching,
-            name=f"{len(self.guilds)} servers | /help"
-        )
-        await self.change_presence(activity=activity, status=discord.Status.online)
+        await self.update_status()
+    
+    async def on_shard_ready(self, shard_id: int):
+        """Called when a shard has identified and received its guilds."""
+        logger.info(f"Shard {shard_id} ready")
+        if self.is_ready():
+            # Shards that reconnect after startup need their presence restored
+            await self.update_status(shard_id)
     
     async def on_guild_join(self, guild):
         """Called when the bot joins a new guild."""
         logger.info(f"Joined guild: {guild.name} (ID: {guild.id})")
-        await self.update_status()
+        await self.update_status(guild.shard_id)
     
     async def on_guild_remove(self, guild):
         """Called when the bot is removed from a guild."""
         logger.info(f"Left guild: {guild.name} (ID: {guild.id})")
-        await self.update_status()
+        await self.update_status(guild.shard_id)
 
-    async def update_status(self):
-        """Update bot presence based on server count."""
-        activity = discord.Activity(
-            type=discord.ActivityType.watching,
-            name=f"{len(self.guilds)} servers | /help"
-        )
-        await self.change_presence(activity=activity, status=discord.Status.online)
+    async def update_status(self, shard_id: int = None):
+        """Update presence on one shard, or every shard in this process, with that shard's server count."""
+        shard_ids = [shard_id] if shard_id is not None else list(self.shards)
+        guild_counts = Counter(guild.shard_id for guild in self.guilds)
+        for shard in shard_ids:
+            name = f"{guild_counts[shard]} servers | /help"
+            if self.shard_count and self.shard_count > 1:
+                name += f" | shard {shard}"
+            activity = discord.Activity(type=discord.ActivityType.watching, name=name)
+            await self.change_presence(activity=activity, status=discord.Status.online, shard_id=shard)
     
     async def on_command_error(self, ctx, error):
         """Global error handler for prefix commands."""
@@ -0,0 +1,121 @@
+"""
+Case Store - Indexed SQLite log of every moderation action
+"""
+
+import time
+from database import close_database, open_database
+
+
+class CaseStore:
+    """Moderation cases numbered per guild, indexed by guild, target and moderator.
+
+    Per-moderator action counts are kept in a side table updated with each
+    insert, so statistics never need to scan the case log.
+    """
+
+    def __init__(self, path: str):
+        self.conn = open_database(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mod_cases (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                case_number INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                target_id INTEGER NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                reason TEXT,
+                duration INTEGER,
+                created_at REAL NOT NULL,
+                UNIQUE (guild_id, case_number)
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_cases_target ON mod_cases (guild_id, target_id, created_at)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_cases_moderator ON mod_cases (guild_id, moderator_id, created_at)")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mod_case_counts (
+                guild_id INTEGER NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, moderator_id, action)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        close_database(self.conn)
+
+    def add_cases(self, guild_id: int, action: str, target_ids: list, moderator_id: int,
+                  reason: str = None, duration: int = None) -> list:
+        """Record one case per target in a single transaction; returns the case numbers."""
+        if not target_ids:
+            return []
+        now = time.time()
+        with self.conn:
+            first = self.conn.execute(
+                "SELECT COALESCE(MAX(case_number), 0) + 1 FROM mod_cases WHERE guild_id = ?", (guild_id,)
+            ).fetchone()[0]
+            numbers = list(range(first, first + len(target_ids)))
+            self.conn.executemany(
+                "INSERT INTO mod_cases (guild_id, case_number, action, target_id, moderator_id, reason, duration, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (guild_id, number, action, target_id, moderator_id, reason, duration, now)
+                    for number, target_id in zip(numbers, target_ids)
+                ]
+            )
+            self.conn.execute(
+                "INSERT INTO mod_case_counts (guild_id, moderator_id, action, count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (guild_id, moderator_id, action) DO UPDATE SET count = count + excluded.count",
+                (guild_id, moderator_id, action, len(target_ids))
+            )
+        return numbers
+
+    def add_case(self, guild_id: int, action: str, target_id: int, moderator_id: int,
+                 reason: str = None, duration: int = None) -> int:
+        """Record a single case; returns its case number."""
+        return self.add_cases(guild_id, action, [target_id], moderator_id, reason, duration)[0]
+
+    def get_case(self, guild_id: int, case_number: int):
+        return self.conn.execute(
+            "SELECT * FROM mod_cases WHERE guild_id = ? AND case_number = ?", (guild_id, case_number)
+        ).fetchone()
+
+    def history(self, guild_id: int, target_id: int, limit: int, offset: int = 0) -> list:
+        """One page of a user's cases, newest first."""
+        return self.conn.execute(
+            "SELECT * FROM mod_cases WHERE guild_id = ? AND target_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (guild_id, target_id, limit, offset)
+        ).fetchall()
+
+    def history_counts(self, guild_id: int, target_id: int) -> dict:
+        """Number of cases per action against a user."""
+        return {
+            row['action']: row['total']
+            for row in self.conn.execute(
+                "SELECT action, COUNT(*) AS total FROM mod_cases WHERE guild_id = ? AND target_id = ? GROUP BY action",
+                (guild_id, target_id)
+            )
+        }
+
+    def action_totals(self, guild_id: int) -> dict:
+        """Total cases per action in a guild."""
+        return {
+            row['action']: row['total']
+            for row in self.conn.execute(
+                "SELECT action, SUM(count) AS total FROM mod_case_counts WHERE guild_id = ? GROUP BY action",
+                (guild_id,)
+            )
+        }
+
+    def top_moderators(self, guild_id: int, limit: int) -> list:
+        """(moderator_id, total cases) for the most active moderators."""
+        return self.conn.execute(
+            "SELECT moderator_id, SUM(count) AS total FROM mod_case_counts WHERE guild_id = ? "
+            "GROUP BY moderator_id ORDER BY total DESC LIMIT ?",
+            (guild_id, limit)
+        ).fetchall()
@@ -0,0 +1,375 @@
+"""
+Cluster Launcher - Runs shard ranges in worker processes under a restarting supervisor
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from config import BotConfig
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_BOT_URL = "https://discord.com/api/v10/gateway/bot"
+IDENTIFY_INTERVAL = 5.0  # Discord allows one identify per rate-limit bucket every 5 seconds
+
+
+async def fetch_gateway_info(token: str) -> tuple:
+    """Ask Discord for the recommended shard count and identify max_concurrency."""
+    import aiohttp  # Only the supervisor needs this, once at startup
+
+    async with aiohttp.ClientSession() as session:
+        async with session.get(GATEWAY_BOT_URL, headers={'Authorization': f"Bot {token}"}) as response:
+            response.raise_for_status()
+            data = await response.json()
+    return data['shards'], data['session_start_limit']['max_concurrency']
+
+
+def split_shards(shard_count: int, processes: int) -> list:
+    """Divide shard ids into ``processes`` contiguous, near-equal ranges."""
+    base, extra = divmod(shard_count, processes)
+    ranges = []
+    start = 0
+    for index in range(processes):
+        size = base + (1 if index < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return [shard_ids for shard_ids in ranges if shard_ids]
+
+
+class IdentifyGate:
+    """Spaces identifies so each of Discord's max_concurrency buckets sees one every 5 seconds."""
+
+    def __init__(self, max_concurrency: int, interval: float = IDENTIFY_INTERVAL):
+        self.max_concurrency = max_concurrency
+        self.interval = interval
+        self.locks = {}
+        self.next_allowed = {}
+
+    async def acquire(self, shard_id: int):
+        bucket = shard_id % self.max_concurrency
+        lock = self.locks.setdefault(bucket, asyncio.Lock())
+        async with lock:
+            delay = self.next_allowed.get(bucket, 0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.next_allowed[bucket] = time.monotonic() + self.interval
+
+
+class Worker:
+    """Supervisor-side record of one worker process and the shards it owns."""
+
+    def __init__(self, cluster_id: int, shard_ids: list):
+        self.cluster_id = cluster_id
+        self.shard_ids = shard_ids
+        self.process = None
+        self.conn = None
+        self.started_at = 0.0
+        self.restarts = 0
+        self.failures = 0
+        self.restart_at = None
+        self.health = None
+        self.last_heartbeat = None
+
+
+class ClusterSupervisor:
+    """Starts one worker process per shard range, restarts crashed ones with backoff and aggregates their health."""
+
+    def __init__(self, shard_count: int, max_concurrency: int, processes: int, fake_gateway: bool = False):
+        self.config = BotConfig()
+        self.shard_count = shard_count
+        self.fake_gateway = fake_gateway
+        self.gate = IdentifyGate(max_concurrency)
+        self.context = multiprocessing.get_context('spawn')
+        self.workers = [
+            Worker(cluster_id, shard_ids)
+            for cluster_id, shard_ids in enumerate(split_shards(shard_count, processes))
+        ]
+        self.stopping = asyncio.Event()
+        self.grants = set()  # Strong references so pending identify grants are not collected
+
+    async def run(self):
+        """Run until SIGINT/SIGTERM, then shut every worker down."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stopping.set)
+            except NotImplementedError:
+                pass  # Windows; KeyboardInterrupt still ends the loop
+
+        logger.info(
+            f"Starting {len(self.workers)} cluster processes for {self.shard_count} shards "
+            f"(max_concurrency {self.gate.max_concurrency})"
+        )
+        for worker in self.workers:
+            self.spawn(worker)
+
+        try:
+            while not self.stopping.is_set():
+                self.check_workers()
+                try:
+                    await asyncio.wait_for(self.stopping.wait(), timeout=1)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.shutdown()
+
+    def spawn(self, worker: Worker):
+        parent_conn, child_conn = self.context.Pipe()
+        worker.process = self.context.Process(
+            target=run_worker,
+            args=(worker.cluster_id, worker.shard_ids, self.shard_count, child_conn, self.fake_gateway),
+            name=f"cluster-{worker.cluster_id}",
+            daemon=False
+        )
+        worker.process.start()
+        child_conn.close()
+        worker.conn = parent_conn
+        worker.started_at = time.monotonic()
+        worker.restart_at = None
+        worker.health = None
+        worker.last_heartbeat = None
+        asyncio.get_running_loop().add_reader(parent_conn.fileno(), self.on_readable, worker, parent_conn)
+        logger.info(f"Cluster {worker.cluster_id} started (pid {worker.process.pid}, shards {worker.shard_ids})")
+
+    def on_readable(self, worker: Worker, conn):
+        """Handle messages from a worker's pipe."""
+        try:
+            while conn.poll():
+                message = conn.recv()
+                if message['type'] == 'identify':
+                    task = asyncio.create_task(self.grant_identify(conn, message['shard_id']))
+                    self.grants.add(task)
+                    task.add_done_callback(self.grants.discard)
+                elif message['type'] == 'health':
+                    worker.health = message['health']
+                    worker.last_heartbeat = time.monotonic()
+        except (EOFError, OSError):
+            # The worker exited; check_workers takes care of restarting it
+            asyncio.get_running_loop().remove_reader(conn.fileno())
+
+    async def grant_identify(self, conn, shard_id: int):
+        await self.gate.acquire(shard_id)
+        try:
+            conn.send({'type': 'identify_ok', 'shard_id': shard_id})
+        except OSError:
+            pass  # The worker died while waiting
+
+    def check_workers(self):
+        """Schedule restarts for workers that exited and start those whose backoff has elapsed."""
+        now = time.monotonic()
+        for worker in self.workers:
+            if worker.process.is_alive():
+                continue
+
+            if worker.restart_at is None:
+                uptime = now - worker.started_at
+                if uptime >= self.config.CLUSTER_STABLE_UPTIME:
+                    worker.failures = 0
+                worker.failures += 1
+                delay = min(
+                    self.config.CLUSTER_RESTART_BACKOFF * 2 ** (worker.failures - 1),
+                    self.config.CLUSTER_MAX_RESTART_BACKOFF
+                )
+                worker.restart_at = now + delay
+                self.close_conn(worker)
+                logger.error(
+                    f"Cluster {worker.cluster_id} exited with code {worker.process.exitcode} "
+                    f"after {uptime:.0f}s; restarting in {delay:.0f}s"
+                )
+            elif now >= worker.restart_at:
+                worker.restarts += 1
+                self.spawn(worker)
+
+    def close_conn(self, worker: Worker):
+        if worker.conn is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(worker.conn.fileno())
+            worker.conn.close()
+        except OSError:
+            pass
+        worker.conn = None
+
+    async def shutdown(self):
+        """Ask workers to close their gateway connections, then terminate any that do not."""
+        logger.info("Stopping cluster...")
+        for worker in self.workers:
+            if worker.process.is_alive() and worker.conn is not None:
+                try:
+                    worker.conn.send({'type': 'shutdown'})
+                except OSError:
+                    pass
+
+        deadline = time.monotonic() + self.config.CLUSTER_SHUTDOWN_TIMEOUT
+        while any(worker.process.is_alive() for worker in self.workers) and time.monotonic() < deadline:
+            await asyncio.sleep(0.5)
+
+        for worker in self.workers:
+            if worker.process.is_alive():
+                logger.warning(f"Cluster {worker.cluster_id} did not stop in time; terminating")
+                worker.process.terminate()
+            worker.process.join(timeout=5)
+            self.close_conn(worker)
+
+    def health(self) -> dict:
+        """Aggregated health of every worker for the keep-alive endpoint."""
+        now = time.monotonic()
+        stale_after = self.config.CLUSTER_HEALTH_INTERVAL * 3
+        processes = {}
+        alive = ready = guilds = 0
+        for worker in self.workers:
+            is_alive = worker.process is not None and worker.process.is_alive()
+            fresh = is_alive and worker.last_heartbeat is not None and now - worker.last_heartbeat < stale_after
+            is_ready = fresh and worker.health['ready']
+            alive += is_alive
+            ready += is_ready
+            if fresh:
+                guilds += worker.health['guilds']
+            processes[worker.cluster_id] = {
+                'pid': worker.process.pid if is_alive else None,
+                'alive': is_alive,
+                'ready': is_ready,
+                'shard_ids': worker.shard_ids,
+                'restarts': worker.restarts,
+                'uptime': round(now - worker.started_at) if is_alive else 0,
+                'heartbeat_age': round(now - worker.last_heartbeat) if worker.last_heartbeat else None,
+                'shards': worker.health['shards'] if fresh else {}
+            }
+
+        if ready == len(self.workers):
+            status = "online"
+        elif not alive:
+            status = "down"
+        elif ready:
+            status = "degraded"
+        else:
+            status = "starting"
+        return {'status': status, 'shard_count': self.shard_count, 'guilds': guilds, 'processes': processes}
+
+
+class SupervisorLink:
+    """Worker-side end of the supervisor pipe: identify permits in, health reports out."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.pending = {}
+        self.closed = asyncio.Event()
+        asyncio.get_running_loop().add_reader(conn.fileno(), self.on_readable)
+
+    def on_readable(self):
+        try:
+            while self.conn.poll():
+                message = self.conn.recv()
+                if message['type'] == 'identify_ok':
+                    future = self.pending.pop(message['shard_id'], None)
+                    if future is not None and not future.done():
+                        future.set_result(None)
+                elif message['type'] == 'shutdown':
+                    self.closed.set()
+        except (EOFError, OSError):
+            # The supervisor is gone; shut down rather than run unsupervised
+            asyncio.get_running_loop().remove_reader(self.conn.fileno())
+            self.closed.set()
+
+    async def request_identify(self, shard_id: int):
+        """Wait until the supervisor allows ``shard_id`` to identify."""
+        future = asyncio.get_running_loop().create_future()
+        self.pending[shard_id] = future
+        self.conn.send({'type': 'identify', 'shard_id': shard_id})
+        await future
+
+    def send_health(self, health: dict):
+        try:
+            self.conn.send({'type': 'health', 'health': health})
+        except OSError:
+            self.closed.set()
+
+
+class FakeGatewayBot:
+    """Stand-in for DiscordBot that connects to no gateway, for exercising the cluster locally.
+
+    Each shard waits for an identify permit, then reports as connected.
+    ``FAKE_GATEWAY_CRASH_AFTER`` makes the worker exit with an error after
+    that many seconds, to exercise restarts.
+    """
+
+    def __init__(self, shard_ids: list, shard_count: int):
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.identify_gate = None
+        self.connected = set()
+        self.ready = False
+
+    async def start(self, token: str):
+        for shard_id in self.shard_ids:
+            await self.identify_gate(shard_id)
+            logger.info(f"Fake shard {shard_id} identified")
+            self.connected.add(shard_id)
+        self.ready = True
+
+        crash_after = float(os.getenv("FAKE_GATEWAY_CRASH_AFTER", "0"))
+        if crash_after:
+            await asyncio.sleep(crash_after)
+            raise RuntimeError("Simulated gateway crash")
+        await asyncio.Event().wait()
+
+    async def close(self):
+        self.connected.clear()
+
+    def health_snapshot(self) -> dict:
+        return {
+            'ready': self.ready,
+            'guilds': 0,
+            'shards': {shard_id: {'connected': True, 'latency_ms': 0} for shard_id in self.connected}
+        }
+
+
+def run_worker(cluster_id: int, shard_ids: list, shard_count: int, conn, fake_gateway: bool):
+    """Process entry point for one cluster worker."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f'%(asctime)s - cluster {cluster_id} - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(f'bot-cluster{cluster_id}.log'),
+            logging.StreamHandler()
+        ],
+        force=True
+    )
+    try:
+        asyncio.run(worker_main(shard_ids, shard_count, conn, fake_gateway))
+    except KeyboardInterrupt:
+        pass  # The supervisor handles Ctrl+C and shuts workers down itself
+
+
+async def worker_main(shard_ids: list, shard_count: int, conn, fake_gateway: bool):
+    link = SupervisorLink(conn)
+    if fake_gateway:
+        bot = FakeGatewayBot(shard_ids, shard_count)
+    else:
+        from bot import DiscordBot
+        bot = DiscordBot(shard_ids=shard_ids, shard_count=shard_count)
+    bot.identify_gate = link.request_identify
+
+    async def report_health():
+        while True:
+            link.send_health(bot.health_snapshot())
+            await asyncio.sleep(BotConfig.CLUSTER_HEALTH_INTERVAL)
+
+    runner = asyncio.create_task(bot.start(os.getenv("DISCORD_BOT_TOKEN", "")))
+    reporter = asyncio.create_task(report_health())
+    closed = asyncio.create_task(link.closed.wait())
+    try:
+        await asyncio.wait([runner, closed], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        reporter.cancel()
+        if not runner.done():
+            await bot.close()
+            await asyncio.wait([runner], timeout=10)
+            runner.cancel()
+        closed.cancel()
+
+    if runner.done() and not runner.cancelled() and runner.exception() is not None:
+        raise runner.exception()
@@ -4,14 +4,68 @@ Bot Configuration Settings
 
 import os
 
+
+def parse_shard_ids(value: str):
+    """Parse "0,1,2" or "0-3,8" into a sorted list of shard ids; empty means all shards."""
+    if not value:
+        return None
+    shard_ids = set()
+    for part in value.split(','):
+        part = part.strip()
+        if '-' in part:
+            first, last = part.split('-', 1)
+            shard_ids.update(range(int(first), int(last) + 1))
+        elif part:
+            shard_ids.add(int(part))
+    return sorted(shard_ids)
+
+
+def check_shard_settings(shard_ids, shard_count):
+    """Reject shard settings AutoShardedBot would only refuse once the bot is constructed."""
+    if shard_ids is None:
+        return
+    if shard_count is None:
+        raise ValueError("SHARD_IDS is set but SHARD_COUNT is not; set SHARD_COUNT to the total number of shards")
+    out_of_range = [shard_id for shard_id in shard_ids if shard_id >= shard_count]
+    if out_of_range:
+        raise ValueError(f"SHARD_IDS {out_of_range} are out of range for SHARD_COUNT={shard_count}")
+
 class BotConfig:
     """Configuration class for the Discord bot."""
     
     # Bot settings
     PREFIX = "!"
     
+    # Sharding: leave both unset to let Discord pick the shard count for one process
+    SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+    SHARD_IDS = parse_shard_ids(os.getenv("SHARD_IDS", ""))  # e.g. "0-3" or "4,5,6,7"
+    check_shard_settings(SHARD_IDS, SHARD_COUNT)
+    
+    # Cluster launcher: more than one process splits the shards across worker processes
+    CLUSTER_PROCESSES = int(os.getenv("CLUSTER_PROCESSES", "1"))
+    CLUSTER_HEALTH_INTERVAL = 15  # seconds between worker health reports
+    CLUSTER_RESTART_BACKOFF = 5  # seconds before the first restart, doubling per crash
+    CLUSTER_MAX_RESTART_BACKOFF = 300
+    CLUSTER_STABLE_UPTIME = 600  # a worker up this long has its crash count reset
+    CLUSTER_SHUTDOWN_TIMEOUT = 30  # seconds workers get to disconnect before being terminated
+    
     # API Keys and tokens (from environment variables)
     # Note: Weather command now uses direct links instead of API
+    FOOTBALL_API_KEY = os.getenv("FOOTBALL_API_KEY")  # football commands are disabled when unset
+    FOOTBALL_API_URL = "https://v3.football.api-sports.io"
+    
+    # Football API client settings
+    FOOTBALL_API_TIMEOUT = 10  # seconds per request
+    FOOTBALL_API_MAX_CONCURRENCY = 8
+    FOOTBALL_API_POOL_SIZE = 20
+    FOOTBALL_API_RATE_PER_MINUTE = 10  # until the provider's headers say otherwise
+    FOOTBALL_API_DAILY_RESERVE = 20  # below this, serve cached live data only
+    FOOTBALL_API_QUOTA_MAX_WAIT = 15  # seconds a request may queue for a token
+    FOOTBALL_API_QUOTA_PROBE_INTERVAL = 15 * 60  # seconds between requests that recheck a spent daily quota
+    FOOTBALL_LIVE_CACHE_TTL = 15  # seconds to reuse a live=all response
+    FOOTBALL_LINEUP_CACHE_SIZE = 512  # fixtures kept in the lineup LRU
+    FOOTBALL_LINEUP_TTL = 6 * 3600  # published lineups
+    FOOTBALL_LINEUP_MISS_TTL = 120  # "not yet announced" answers
     
     # Bot permissions
     MODERATOR_PERMISSIONS = [
@@ -39,9 +93,71 @@ class BotConfig:
         "default": 0x7289da
     }
     
+    # Local storage for persistent bot data
+    DATA_DIR = os.getenv("BOT_DATA_DIR", "data")
+    DATABASE_FILE = "bot.db"
+    
+    # Slash command sync: skipped when the command tree hash matches the last sync
+    COMMAND_TREE_HASH_FILE = "command_tree.json"
+    FORCE_COMMAND_SYNC = os.getenv("FORCE_COMMAND_SYNC", "").lower() in ("1", "true", "yes")
+    
+    # Live score subscriptions
+    LIVE_SCORE_POLL_INTERVAL = 60  # seconds between live feed polls
+    MAX_LIVE_SCORE_SUBSCRIPTIONS = 5  # per channel
+    
+    # Polls
+    POLL_FLUSH_INTERVAL = 30  # seconds between tally writes to disk
+    MAX_POLL_DURATION = 7 * 86400  # 7 days in seconds
+    MAX_POLLS_LISTED = 10
+    POLL_CACHE_SIZE = 1000  # open polls kept in memory; the least recently used are flushed and dropped
+    
+    # Mass moderation actions
+    MASS_ACTION_CONCURRENCY = 5  # workers per job
+    MASS_ACTION_PROGRESS_INTERVAL = 5  # seconds between status message edits
+    MAX_MASS_ACTION_TARGETS = 5000
+    BULK_BAN_CHUNK_SIZE = 200  # Discord's bulk ban endpoint limit
+    MAX_BULK_BAN_FILE_SIZE = 1024 * 1024
+    
+    # Moderation case log
+    CASES_PAGE_SIZE = 10
+    
+    # Anti-raid join detection
+    ANTIRAID_JOIN_THRESHOLD = 10  # joins within the window that trigger a lockdown
+    ANTIRAID_WINDOW = 10  # seconds
+    ANTIRAID_MAX_WINDOW = 600
+    ANTIRAID_DEFAULT_ACTION = "timeout"
+    ANTIRAID_LOCKDOWN_DURATION = 15 * 60  # seconds before a lockdown lifts itself
+    ANTIRAID_NEW_ACCOUNT_AGE = 7 * 86400  # accounts younger than this are suspicious during a raid
+    ANTIRAID_SIMILAR_THRESHOLD = 3  # joins sharing a name pattern or avatar within the window
+    ANTIRAID_TIMEOUT_MINUTES = 60
+    
+    # Automod spam filter
+    AUTOMOD_RATE_LIMIT = 6  # messages allowed per rate window
+    AUTOMOD_RATE_WINDOW = 5  # seconds
+    AUTOMOD_DUPLICATE_LIMIT = 4  # identical messages in a row
+    AUTOMOD_DUPLICATE_WINDOW = 30  # seconds between repeats for them to count as a streak
+    AUTOMOD_MENTION_LIMIT = 8  # user and role mentions per mention window
+    AUTOMOD_MENTION_WINDOW = 10  # seconds
+    AUTOMOD_STRIKES_BEFORE_TIMEOUT = 3
+    AUTOMOD_STRIKE_RESET = 600  # seconds without violations before strikes are forgotten
+    AUTOMOD_TIMEOUT_STEPS = [5, 30, 240]  # minutes, escalating with each automatic timeout
+    AUTOMOD_MAX_TRACKED_USERS = 50000
+    
+    # Moderation DM notifications
+    DM_NOTIFY_CONCURRENCY = 4
+    DM_NOTIFY_TIMEOUT = 10  # seconds before a DM attempt is abandoned
+    DM_NOTIFY_GRACE = 1.5  # max seconds a kick/ban waits for its DM to land first
+    DM_NOTIFY_QUEUE_SIZE = 1000
+    
     # Maximum values
-    MAX_PURGE_AMOUNT = 100
+    MAX_PURGE_AMOUNT = 10000
+    MAX_PURGE_SCAN = 50000  # history messages /clear reads looking for matches
+    PURGE_PROGRESS_INTERVAL = 3  # seconds between progress updates
     MAX_POLL_OPTIONS = 10
-    MAX_REMINDER_TIME = 86400  # 24 hours in seconds
+    MAX_REMINDER_TIME = 365 * 86400  # 1 year in seconds
+    MAX_REMINDERS_PER_USER = 100
+    REMINDERS_PAGE_SIZE = 10
+    REMINDER_BATCH_WINDOW = 2  # seconds to gather reminders due together
+    REMINDER_RETRY_DELAY = 60  # seconds before retrying a delivery that failed transiently
     
 
@@ -0,0 +1,40 @@
+"""
+Database - One shared SQLite connection per database file for every store in the process
+"""
+
+import os
+import sqlite3
+
+# Absolute path -> [connection, number of stores using it]
+_connections = {}
+
+
+def open_database(path: str) -> sqlite3.Connection:
+    """Return the process-wide connection to ``path``, opening it in WAL mode on first use.
+
+    Stores on the same file share the connection; each must hand it back with
+    ``close_database`` instead of closing it.
+    """
+    path = os.path.abspath(path)
+    entry = _connections.get(path)
+    if entry is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        entry = _connections[path] = [conn, 0]
+    entry[1] += 1
+    return entry[0]
+
+
+def close_database(conn: sqlite3.Connection):
+    """Release a connection from ``open_database``; it closes once no store uses it."""
+    for path, entry in list(_connections.items()):
+        if entry[0] is conn:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del _connections[path]
+                conn.close()
+            return
+    conn.close()
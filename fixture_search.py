@@ -0,0 +1,123 @@
+"""
+Fixture Search - Pre-built team-name index over a live fixtures response
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+
+# Words that join team names in a query but never identify a team
+STOPWORDS = {"vs", "v", "versus", "x", "and", "against"}
+MIN_PREFIX_LENGTH = 2
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize(text: str) -> str:
+    """Casefold, strip accents and collapse punctuation to single spaces."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", stripped.casefold()).strip()
+
+
+def tokenize(text: str) -> list:
+    """Split text into normalized search tokens."""
+    return [token for token in normalize(text).split() if token not in STOPWORDS]
+
+
+def phrases(text: str) -> list:
+    """Split a query into the token runs between stopwords, e.g. one per team in "A vs B"."""
+    runs = [[]]
+    for token in normalize(text).split():
+        if token in STOPWORDS:
+            runs.append([])
+        elif token not in runs[-1]:
+            runs[-1].append(token)
+    return [run for run in runs if run]
+
+
+def team_matches(team_name: str, terms: list) -> bool:
+    """Whether every term equals, or is a prefix of, a token of one team name."""
+    team_tokens = tokenize(team_name)
+    return all(
+        any(token == term or (len(term) >= MIN_PREFIX_LENGTH and token.startswith(term)) for token in team_tokens)
+        for term in terms
+    )
+
+
+class FixtureIndex:
+    """Maps team-name tokens and their prefixes to fixture ids for fast, ranked lookups."""
+
+    def __init__(self, fixtures: list):
+        self.fixtures = fixtures
+        self._by_id = {}
+        self._order = {}
+        self._tokens = defaultdict(set)
+        self._prefixes = defaultdict(set)
+
+        for position, fixture in enumerate(fixtures):
+            fixture_id = fixture['fixture']['id']
+            self._by_id[fixture_id] = fixture
+            self._order[fixture_id] = position
+
+            names = f"{fixture['teams']['home']['name']} {fixture['teams']['away']['name']}"
+            for token in set(tokenize(names)):
+                self._tokens[token].add(fixture_id)
+                for end in range(MIN_PREFIX_LENGTH, len(token)):
+                    self._prefixes[token[:end]].add(fixture_id)
+
+    def __len__(self):
+        return len(self.fixtures)
+
+    def get(self, fixture_id: int):
+        """Return a fixture by id, or None."""
+        return self._by_id.get(fixture_id)
+
+    def search(self, query: str) -> list:
+        """Return fixtures matching any query term, best matches first.
+
+        An exact token match scores higher than a prefix match, and fixtures
+        matching more distinct terms rank above those matching fewer. A
+        multi-word phrase whose terms all hit the same team earns a bonus, so
+        "Real Madrid" ranks Real Madrid above Real Sociedad vs Atlético Madrid.
+        """
+        scores = defaultdict(int)
+        for term in dict.fromkeys(tokenize(query)):
+            for fixture_id in self._tokens.get(term, ()):
+                scores[fixture_id] += 2
+            for fixture_id in self._prefixes.get(term, ()):
+                scores[fixture_id] += 1
+
+        for phrase in phrases(query):
+            if len(phrase) < 2:
+                continue
+            for fixture_id in scores:
+                teams = self._by_id[fixture_id]['teams']
+                if team_matches(teams['home']['name'], phrase) or team_matches(teams['away']['name'], phrase):
+                    scores[fixture_id] += 2 * len(phrase)
+
+        ranked = sorted(scores, key=lambda fixture_id: (-scores[fixture_id], self._order[fixture_id]))
+        return [self._by_id[fixture_id] for fixture_id in ranked]
+
+    def find_team(self, query: str) -> list:
+        """Return fixtures in which one team's name matches every query term, in feed order.
+
+        Each term must equal, or be a prefix of, a token of the same team
+        name, so "Manchester United" does not match Manchester City.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        candidates = None
+        for term in terms:
+            ids = self._tokens.get(term, set()) | self._prefixes.get(term, set())
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        return [
+            self._by_id[fixture_id]
+            for fixture_id in sorted(candidates, key=self._order.get)
+            if any(team_matches(self._by_id[fixture_id]['teams'][side]['name'], terms) for side in ('home', 'away'))
+        ]
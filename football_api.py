@@ -0,0 +1,220 @@
+"""
+Football API Client - Shared, pooled async HTTP client for API-Football
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+import aiohttp
+from config import BotConfig
+from fixture_search import FixtureIndex
+from football_quota import FootballAPIError, QuotaExhaustedError, QuotaGovernor
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlightCache:
+    """Holds one value for a short TTL and coalesces concurrent refreshes into one load."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.value = None
+        self.fetched_at = None
+        self._inflight = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the cached value is still within its TTL."""
+        return self.fetched_at is not None and time.monotonic() - self.fetched_at < self.ttl
+
+    def invalidate(self):
+        """Force the next call to reload."""
+        self.fetched_at = None
+
+    async def get(self, loader):
+        """Return the cached value, or await a single shared call to ``loader``."""
+        if self.is_fresh:
+            return self.value
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh(loader))
+        # Shield so one cancelled caller does not cancel the load for everyone else
+        return await asyncio.shield(self._inflight)
+
+    async def _refresh(self, loader):
+        try:
+            value = await loader()
+            self.value = value
+            self.fetched_at = time.monotonic()
+            return value
+        finally:
+            self._inflight = None
+
+
+class LRUCache:
+    """Bounded least-recently-used cache whose entries each carry their own TTL."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return a live entry and mark it recently used; expired entries are dropped."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl: float):
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class FootballAPIClient:
+    """Long-lived aiohttp client owned by the bot and shared by every football command."""
+
+    def __init__(self, api_key: str = None, base_url: str = None, timeout: float = None,
+                 max_concurrency: int = None, pool_size: int = None, live_cache_ttl: float = None):
+        config = BotConfig()
+        self.api_key = api_key or config.FOOTBALL_API_KEY
+        self.enabled = bool(self.api_key)
+        self.base_url = (base_url or config.FOOTBALL_API_URL).rstrip('/')
+        self.timeout = aiohttp.ClientTimeout(total=timeout or config.FOOTBALL_API_TIMEOUT)
+        self.pool_size = pool_size or config.FOOTBALL_API_POOL_SIZE
+        self._semaphore = asyncio.Semaphore(max_concurrency or config.FOOTBALL_API_MAX_CONCURRENCY)
+        self._session = None
+        self._live_cache = SingleFlightCache(live_cache_ttl or config.FOOTBALL_LIVE_CACHE_TTL)
+        self._lineup_cache = LRUCache(config.FOOTBALL_LINEUP_CACHE_SIZE)
+        self._lineup_inflight = {}
+        self.lineup_ttl = config.FOOTBALL_LINEUP_TTL
+        self.lineup_miss_ttl = config.FOOTBALL_LINEUP_MISS_TTL
+        self.quota = QuotaGovernor(
+            config.FOOTBALL_API_RATE_PER_MINUTE,
+            config.FOOTBALL_API_DAILY_RESERVE,
+            config.FOOTBALL_API_QUOTA_MAX_WAIT,
+            probe_interval=config.FOOTBALL_API_QUOTA_PROBE_INTERVAL
+        )
+
+    async def start(self):
+        """Open the pooled session. Safe to call more than once."""
+        if not self.enabled:
+            logger.warning("FOOTBALL_API_KEY is not set; football commands are disabled")
+            return
+        if self._session and not self._session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            ttl_dns_cache=300,
+            keepalive_timeout=30
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={'x-apisports-key': self.api_key}
+        )
+        logger.info(f"Football API client started (pool size {self.pool_size})")
+
+    async def close(self):
+        """Close the session and release pooled connections."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def get(self, endpoint: str, params: dict = None) -> dict:
+        """Perform a GET request against the API and return the decoded JSON body."""
+        if not self.enabled:
+            raise FootballAPIError("FOOTBALL_API_KEY is not set")
+        if self._session is None or self._session.closed:
+            await self.start()
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        await self.quota.acquire()
+        async with self._semaphore:
+            try:
+                async with self._session.get(url, params=params) as response:
+                    self.quota.update(response.headers)
+                    if response.status == 429:
+                        self.quota.exhaust()
+                        raise QuotaExhaustedError(f"{endpoint} was rate limited", response.status)
+                    if response.status != 200:
+                        raise FootballAPIError(f"{endpoint} returned HTTP {response.status}", response.status)
+                    data = await response.json(content_type=None)
+            except asyncio.TimeoutError as e:
+                raise FootballAPIError(f"{endpoint} timed out") from e
+            except aiohttp.ClientError as e:
+                raise FootballAPIError(f"{endpoint} request failed: {e}") from e
+
+        # api-sports reports quota and request errors in the body of a 200 response
+        errors = data.get('errors')
+        if errors:
+            if isinstance(errors, dict) and ('rateLimit' in errors or 'requests' in errors):
+                self.quota.exhaust(daily='requests' in errors)
+                raise QuotaExhaustedError(f"{endpoint} rejected: {errors}")
+            raise FootballAPIError(f"{endpoint} returned errors: {errors}")
+        return data
+
+    async def live_fixtures(self) -> list:
+        """Return every fixture that is currently live, served from a short-lived cache."""
+        index = await self.live_index()
+        return index.fixtures
+
+    async def live_index(self) -> FixtureIndex:
+        """Return the search index over live fixtures, rebuilt once per cache refresh.
+
+        When the daily quota is down to its reserve, or a refresh fails, the
+        last good index is served (stale) rather than failing the command.
+        A scheduled probe still refreshes it now and then so the quota
+        headers, and the scores, catch up.
+        """
+        stale = self._live_cache.value
+        if stale is not None and self.quota.is_low and not self.quota.probe_due:
+            return stale
+        try:
+            return await self._live_cache.get(self._fetch_live_index)
+        except FootballAPIError as e:
+            if stale is None:
+                raise
+            logger.warning(f"Serving stale live fixtures: {e}")
+            return stale
+
+    async def _fetch_live_index(self) -> FixtureIndex:
+        data = await self.get('fixtures', params={'live': 'all'})
+        return FixtureIndex(data.get('response', []))
+
+    async def lineups(self, fixture_id: int) -> list:
+        """Return the lineups published for a fixture.
+
+        Published lineups are kept for a long time; an empty ("not yet
+        announced") answer is only cached briefly so it is retried soon.
+        Concurrent requests for the same fixture share one API call.
+        """
+        cached = self._lineup_cache.get(fixture_id)
+        if cached is not None:
+            return cached
+
+        task = self._lineup_inflight.get(fixture_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_lineups(fixture_id))
+            self._lineup_inflight[fixture_id] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_lineups(self, fixture_id: int) -> list:
+        try:
+            data = await self.get('fixtures/lineups', params={'fixture': fixture_id})
+            lineups = data.get('response', [])
+            ttl = self.lineup_ttl if len(lineups) >= 2 else self.lineup_miss_ttl
+            self._lineup_cache.set(fixture_id, lineups, ttl)
+            return lineups
+        finally:
+            self._lineup_inflight.pop(fixture_id, None)
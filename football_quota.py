@@ -0,0 +1,177 @@
+"""
+Football API Quota - Token bucket and daily budget tracking for API-Football
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+
+class FootballAPIError(Exception):
+    """Raised when the football API cannot be reached or returns an error."""
+
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status
+
+
+class QuotaExhaustedError(FootballAPIError):
+    """Raised when the API quota leaves no budget for another request."""
+
+
+def _header_int(headers, name: str):
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def next_utc_midnight(now: float) -> float:
+    """Timestamp of the next 00:00 UTC, when api-sports resets daily quotas."""
+    today = datetime.fromtimestamp(now, timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (today + timedelta(days=1)).timestamp()
+
+
+class QuotaGovernor:
+    """Token bucket kept in step with api-sports' per-minute and daily rate-limit headers.
+
+    The daily budget is forgotten once its reset time passes (taken from the
+    provider's reset header when present, otherwise the next UTC midnight).
+    While it is low or spent, one probe request is let through every
+    ``probe_interval`` seconds so fresh headers can show it was restored early.
+    """
+
+    def __init__(self, per_minute: int, daily_reserve: int, max_wait: float, probe_interval: float = 900,
+                 clock=time.monotonic, wall_clock=time.time, sleep=asyncio.sleep):
+        self.per_minute = per_minute
+        self.daily_reserve = daily_reserve
+        self.max_wait = max_wait
+        self.probe_interval = probe_interval
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+        self.tokens = float(per_minute)
+        self.updated_at = clock()
+        self.daily_limit = None
+        self.daily_remaining = None
+        self.daily_reset_at = None
+        self.minute_remaining = None
+        self.next_probe_at = 0.0
+        self.requests_made = 0
+        self.requests_throttled = 0
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.per_minute, self.tokens + (now - self.updated_at) * self.per_minute / 60)
+        self.updated_at = now
+
+    def _check_reset(self):
+        if self.daily_reset_at is not None and self.wall_clock() >= self.daily_reset_at:
+            logger.info("Football API daily quota reset")
+            self.daily_remaining = None
+            self.daily_reset_at = None
+            self.next_probe_at = 0.0
+
+    @property
+    def is_low(self) -> bool:
+        """Whether the daily budget is down to the reserve kept for uncached requests."""
+        self._check_reset()
+        return self.daily_remaining is not None and self.daily_remaining <= self.daily_reserve
+
+    @property
+    def is_exhausted(self) -> bool:
+        self._check_reset()
+        return self.daily_remaining is not None and self.daily_remaining <= 0
+
+    @property
+    def probe_due(self) -> bool:
+        """Whether a request sent now would be the scheduled probe; checking does not claim it."""
+        return self.wall_clock() >= self.next_probe_at
+
+    def _take_probe(self) -> bool:
+        if not self.probe_due:
+            return False
+        self.next_probe_at = self.wall_clock() + self.probe_interval
+        return True
+
+    async def acquire(self):
+        """Reserve a token, waiting for it if needed; give up if the wait would exceed ``max_wait``.
+
+        The wait is computed and the token reserved without yielding, so
+        callers queue in order without holding a lock while they sleep.
+        While the daily budget is low, the request claims the probe slot if it
+        is due; once the budget is spent, only that probe may go out.
+        """
+        if self.is_low:
+            probe = self._take_probe()
+            if self.is_exhausted and not probe:
+                self.requests_throttled += 1
+                raise QuotaExhaustedError("Daily API quota exhausted")
+
+        self._refill()
+        wait = 0.0
+        if self.tokens < 1:
+            wait = (1 - self.tokens) * 60 / self.per_minute
+            if wait > self.max_wait:
+                self.requests_throttled += 1
+                raise QuotaExhaustedError(f"Per-minute API quota exhausted, next slot in {wait:.1f}s")
+        # Tokens may go negative: later callers then wait behind the slots already promised
+        self.tokens -= 1
+        self.requests_made += 1
+        if wait:
+            await self.sleep(wait)
+
+    def update(self, headers):
+        """Reconcile the bucket with the limits the provider reports."""
+        minute_limit = _header_int(headers, 'X-RateLimit-Limit')
+        minute_remaining = _header_int(headers, 'X-RateLimit-Remaining')
+        daily_limit = _header_int(headers, 'x-ratelimit-requests-limit')
+        daily_remaining = _header_int(headers, 'x-ratelimit-requests-remaining')
+        daily_reset = _header_int(headers, 'x-ratelimit-requests-reset')
+
+        if minute_limit:
+            self.per_minute = minute_limit
+        if minute_remaining is not None:
+            self.minute_remaining = minute_remaining
+            self._refill()
+            self.tokens = min(self.tokens, minute_remaining)
+        if daily_limit is not None:
+            self.daily_limit = daily_limit
+        if daily_reset is not None:
+            self.daily_reset_at = self.wall_clock() + daily_reset
+        if daily_remaining is not None:
+            if not self.is_low and daily_remaining <= self.daily_reserve:
+                logger.warning(f"Football API daily quota low: {daily_remaining} requests left")
+            self.daily_remaining = daily_remaining
+            if self.daily_reset_at is None:
+                self.daily_reset_at = next_utc_midnight(self.wall_clock())
+
+    def exhaust(self, daily: bool = False):
+        """Drain the bucket after the provider rejects a request for rate limiting."""
+        self._refill()
+        self.tokens = min(self.tokens, 0)
+        if daily:
+            self.daily_remaining = 0
+            if self.daily_reset_at is None:
+                self.daily_reset_at = next_utc_midnight(self.wall_clock())
+            self.next_probe_at = self.wall_clock() + self.probe_interval
+
+    def snapshot(self) -> dict:
+        """Current quota state for operators."""
+        self._refill()
+        self._check_reset()
+        return {
+            'per_minute_limit': self.per_minute,
+            'minute_remaining': self.minute_remaining,
+            'tokens': round(self.tokens, 1),
+            'daily_limit': self.daily_limit,
+            'daily_remaining': self.daily_remaining,
+            'daily_reset_at': self.daily_reset_at,
+            'requests_made': self.requests_made,
+            'requests_throttled': self.requests_throttled,
+            'low': self.is_low
+        }
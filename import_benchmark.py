@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Startup Import Benchmark - Measures module import cost with ``python -X importtime``
+
+Each module is imported in a fresh interpreter so shared dependencies are
+charged to every module that pulls them in, which is what a cold start pays.
+
+Usage:
+    python import_benchmark.py                       # report every cog
+    python import_benchmark.py --save baseline.json  # record a baseline
+    python import_benchmark.py --compare baseline.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    'bot',
+    'moderation',
+    'server_info',
+    'user_info',
+    'utilities',
+    'roles',
+    'live_scores',
+    'antiraid',
+    'automod'
+]
+
+
+def measure(module: str, runs: int) -> dict:
+    """Best-of-``runs`` cumulative import time for ``module`` and its heaviest dependencies, in ms.
+
+    Returns None for modules the interpreter has already loaded at startup
+    (e.g. ``os``), since importing them again costs nothing to measure.
+    """
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import sys; print({module!r} in sys.modules); import {module}"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+        if result.stdout.strip() == "True":
+            return None  # Imported during interpreter startup, before this import ran
+
+        # Lines look like "import time:       123 |        456 |   package.module", children
+        # before their parent and indented two spaces deeper per level
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            name = name.rstrip()
+            imports.append((name.strip(), int(cumulative), len(name) - len(name.lstrip())))
+
+        position = next((i for i in range(len(imports) - 1, -1, -1) if imports[i][0] == module), None)
+        if position is None:
+            return None
+        _, module_total, module_indent = imports[position]
+        total = module_total / 1000
+        if best is None or total < best['total_ms']:
+            dependencies = []
+            for name, cumulative, indent in reversed(imports[:position]):
+                if indent <= module_indent:
+                    break
+                if indent == module_indent + 2:
+                    dependencies.append((name, cumulative / 1000))
+            dependencies.sort(key=lambda item: -item[1])
+            best = {'total_ms': total, 'dependencies': dependencies}
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module; the fastest run counts")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest direct dependencies to list per module")
+    parser.add_argument("--save", metavar="FILE", help="Write the measured totals to FILE as a baseline")
+    parser.add_argument("--compare", metavar="FILE", help="Fail if any module is slower than the baseline in FILE")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown over the baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    totals = {}
+    regressions = []
+    for module in args.modules:
+        try:
+            result = measure(module, args.runs)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 2
+        if result is None:
+            print(f"{module:<14}already loaded")
+            continue
+
+        totals[module] = round(result['total_ms'], 1)
+        line = f"{module:<14}{result['total_ms']:>9.1f}ms"
+        if module in baseline:
+            limit = baseline[module] * (1 + args.tolerance)
+            line += f"  (baseline {baseline[module]:.1f}ms)"
+            if result['total_ms'] > limit:
+                line += "  REGRESSION"
+                regressions.append(module)
+        print(line)
+        for name, cumulative in result['dependencies'][:args.top]:
+            print(f"    {name:<40}{cumulative:>9.1f}ms")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(totals, f, indent=2)
+
+    if regressions:
+        print(f"Import time regressed for: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
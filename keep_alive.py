@@ -13,19 +13,28 @@ logger = logging.getLogger(__name__)
 
 async def health_check(request):
     """Health check endpoint for UptimeRobot"""
-    return web.json_response({
+    body = {
         "status": "online",
         "message": "Discord bot is running",
         "timestamp": str(asyncio.get_event_loop().time())
-    })
+    }
+    
+    # The bot or cluster supervisor can attach a callable reporting shard health
+    health = request.app.get('health')
+    if health is not None:
+        body.update(health())
+    
+    # Let uptime monitors alert when nothing is connected
+    return web.json_response(body, status=503 if body["status"] == "down" else 200)
 
 async def root_handler(request):
     """Root endpoint"""
     return web.Response(text="Discord Bot - Online 24/7")
 
-async def create_app():
+async def create_app(health=None):
     """Create the web application"""
     app = web.Application()
+    app['health'] = health
     
     # Add routes
     app.router.add_get('/', root_handler)
@@ -34,9 +43,13 @@ async def create_app():
     
     return app
 
-async def start_server():
-    """Start the keep-alive web server"""
-    app = await create_app()
+async def start_server(health=None):
+    """Start the keep-alive web server
+    
+    ``health`` is an optional callable returning a dict merged into the
+    /health response, e.g. shard status from the bot or cluster supervisor.
+    """
+    app = await create_app(health)
     
     # Start server on port 5000 (Replit's default)
     runner = web.AppRunner(app)
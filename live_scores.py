@@ -0,0 +1,339 @@
+"""
+Live Scores Cog - Channel subscriptions to live football scores, pushed by one background poller
+"""
+
+import discord
+from discord.ext import commands, tasks
+from discord import app_commands
+import json
+import logging
+import os
+from config import BotConfig
+from database import close_database, open_database
+from football_api import FootballAPIError
+
+logger = logging.getLogger(__name__)
+
+
+def create_embed(title=None, description=None, color=discord.Color.green()):
+    embed = discord.Embed(
+        title=title or "Information",
+        description=description or "",
+        color=color
+    )
+    return embed
+
+
+def score_state(fixture: dict) -> tuple:
+    """The parts of a fixture that warrant editing a subscription message when they change."""
+    return (
+        fixture['goals']['home'],
+        fixture['goals']['away'],
+        fixture['fixture']['status']['elapsed'],
+        fixture['fixture']['status']['short']
+    )
+
+
+def build_score_embed(fixture: dict, finished: bool = False) -> discord.Embed:
+    """Build the embed shown in a subscription's pinned message."""
+    home = fixture['teams']['home']['name']
+    away = fixture['teams']['away']['name']
+    home_score = fixture['goals']['home']
+    away_score = fixture['goals']['away']
+    elapsed = fixture['fixture']['status']['elapsed']
+
+    if finished:
+        status = "No longer live"
+        color = discord.Color.dark_grey()
+    else:
+        status = f"🕐 {elapsed}' • {fixture['fixture']['status']['long']}"
+        color = discord.Color.green()
+
+    embed = create_embed(
+        title=f"⚽ {home} vs {away}",
+        description=f"**{home} {home_score} - {away_score} {away}**\n{status}",
+        color=color
+    )
+    embed.add_field(name="🏆 Competition", value=fixture['league']['name'], inline=True)
+    embed.set_footer(text=f"Fixture {fixture['fixture']['id']} • Data from API-Football")
+    return embed
+
+
+class LiveScoreStore:
+    """Live score subscriptions in the shared SQLite database.
+
+    Every cluster process writes its own rows and ids come from AUTOINCREMENT,
+    so processes never overwrite each other's subscriptions.
+    """
+
+    COLUMNS = ('guild_id', 'channel_id', 'creator', 'kind', 'query', 'fixture_id', 'message_id', 'last_fixture')
+
+    def __init__(self, path: str):
+        self.conn = open_database(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS live_score_subscriptions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                creator INTEGER,
+                kind TEXT NOT NULL,
+                query TEXT,
+                fixture_id INTEGER,
+                message_id INTEGER,
+                last_fixture TEXT
+            )
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        close_database(self.conn)
+
+    @classmethod
+    def _values(cls, sub: dict) -> list:
+        values = [sub.get(column) for column in cls.COLUMNS]
+        values[-1] = json.dumps(values[-1]) if values[-1] is not None else None
+        return values
+
+    def load(self) -> dict:
+        """sub_id -> subscription for every stored subscription."""
+        subscriptions = {}
+        for row in self.conn.execute("SELECT * FROM live_score_subscriptions"):
+            sub = {column: row[column] for column in self.COLUMNS}
+            sub['last_fixture'] = json.loads(sub['last_fixture']) if sub['last_fixture'] else None
+            subscriptions[row['id']] = sub
+        return subscriptions
+
+    def add(self, sub: dict) -> int:
+        """Store a new subscription and return its id."""
+        with self.conn:
+            cursor = self.conn.execute(
+                f"INSERT INTO live_score_subscriptions ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                self._values(sub)
+            )
+        return cursor.lastrowid
+
+    def update_many(self, subscriptions: dict):
+        """Save the state of several subscriptions in one transaction; removed ones are left alone."""
+        assignments = ", ".join(f"{column} = ?" for column in self.COLUMNS)
+        with self.conn:
+            self.conn.executemany(
+                f"UPDATE live_score_subscriptions SET {assignments} WHERE id = ?",
+                [self._values(sub) + [sub_id] for sub_id, sub in subscriptions.items()]
+            )
+
+    def delete(self, sub_id: int):
+        with self.conn:
+            self.conn.execute("DELETE FROM live_score_subscriptions WHERE id = ?", (sub_id,))
+
+
+class LiveScoresCog(commands.Cog):
+    """Cog that polls the live feed once and fans score changes out to subscribed channels."""
+
+    livescores = app_commands.Group(name="livescores", description="Follow live football scores in this channel", guild_only=True)
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.config = BotConfig()
+        self.store = LiveScoreStore(os.path.join(self.config.DATA_DIR, self.config.DATABASE_FILE))
+        # Only the guilds this process serves; other cluster processes poll their own
+        self.subscriptions = {
+            sub_id: sub for sub_id, sub in self.store.load().items() if self.bot.owns_guild(sub['guild_id'])
+        }
+        self.snapshot = {}
+        self.poll_live_scores.change_interval(seconds=self.config.LIVE_SCORE_POLL_INTERVAL)
+
+    async def cog_load(self):
+        self.poll_live_scores.start()
+
+    async def cog_unload(self):
+        self.poll_live_scores.cancel()
+        self.store.close()
+
+    def resolve_fixture(self, sub: dict, index):
+        """Find the live fixture a subscription currently points at, if any."""
+        if sub['kind'] == 'fixture':
+            return index.get(sub['fixture_id'])
+        if sub.get('fixture_id') is not None:
+            fixture = index.get(sub['fixture_id'])
+            if fixture:
+                return fixture
+        matches = index.find_team(sub['query'])
+        return matches[0] if matches else None
+
+    @tasks.loop(seconds=60)
+    async def poll_live_scores(self):
+        """Fetch the live feed once and update every subscription whose score or minute changed."""
+        if not self.subscriptions or not self.bot.football_api.enabled:
+            return
+
+        try:
+            index = await self.bot.football_api.live_index()
+        except FootballAPIError as e:
+            logger.warning(f"Live score poll failed: {e}")
+            return
+
+        previous = self.snapshot
+        self.snapshot = {fixture['fixture']['id']: score_state(fixture) for fixture in index.fixtures}
+        changed = {fixture_id for fixture_id, state in self.snapshot.items() if previous.get(fixture_id) != state}
+
+        dirty = set()
+        for sub_id, sub in list(self.subscriptions.items()):
+            fixture = self.resolve_fixture(sub, index)
+
+            if fixture is None:
+                if not sub.get('last_fixture'):
+                    continue  # Not live yet
+                # The followed fixture has left the live feed
+                if sub.get('message_id'):
+                    await self.push_update(sub, sub['last_fixture'], finished=True)
+                if sub['kind'] == 'fixture':
+                    # The subscription may have been unfollowed while the update was sent
+                    if self.subscriptions.pop(sub_id, None) is not None:
+                        self.store.delete(sub_id)
+                else:
+                    sub.update(fixture_id=None, message_id=None, last_fixture=None)
+                    dirty.add(sub_id)
+                continue
+
+            fixture_id = fixture['fixture']['id']
+            is_new = sub.get('fixture_id') != fixture_id or not sub.get('message_id')
+            if not is_new and fixture_id not in changed:
+                continue
+
+            sub['fixture_id'] = fixture_id
+            sub['last_fixture'] = fixture
+            await self.push_update(sub, fixture)
+            dirty.add(sub_id)
+
+        if dirty:
+            # Skip subscriptions unfollowed while updates were being sent
+            self.store.update_many({sub_id: self.subscriptions[sub_id] for sub_id in dirty if sub_id in self.subscriptions})
+
+    @poll_live_scores.before_loop
+    async def before_poll(self):
+        await self.bot.wait_until_ready()
+
+    async def push_update(self, sub: dict, fixture: dict, finished: bool = False):
+        """Edit the subscription's pinned message in place, posting and pinning a new one if needed."""
+        channel = self.bot.get_channel(sub['channel_id'])
+        if channel is None:
+            return
+
+        embed = build_score_embed(fixture, finished=finished)
+        if sub.get('message_id'):
+            try:
+                await channel.get_partial_message(sub['message_id']).edit(embed=embed)
+                return
+            except discord.NotFound:
+                sub['message_id'] = None
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to edit live score message {sub['message_id']}: {e}")
+                return
+
+        if finished:
+            return
+
+        try:
+            message = await channel.send(embed=embed)
+            sub['message_id'] = message.id
+            try:
+                await message.pin(reason="Live score subscription")
+            except discord.HTTPException:
+                pass  # Missing Manage Messages or pin limit reached; the message still updates
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to post live score message in channel {sub['channel_id']}: {e}")
+
+    @livescores.command(name="follow", description="Follow a team or fixture's live score in this channel")
+    @app_commands.describe(
+        team="Team name to follow (e.g. 'Arsenal')",
+        fixture_id="Specific API-Football fixture ID to follow"
+    )
+    async def follow(self, interaction: discord.Interaction, team: str = None, fixture_id: int = None):
+        """Subscribe this channel to live score updates."""
+        if not interaction.user.guild_permissions.manage_channels:
+            await interaction.response.send_message("❌ You need Manage Channels to set up live scores.", ephemeral=True)
+            return
+
+        if not self.bot.football_api.enabled:
+            await interaction.response.send_message("❌ Football scores are not configured on this bot.", ephemeral=True)
+            return
+
+        if (team is None) == (fixture_id is None):
+            await interaction.response.send_message("❌ Provide either a team or a fixture ID.", ephemeral=True)
+            return
+
+        channel_subs = [sub for sub in self.subscriptions.values() if sub['channel_id'] == interaction.channel.id]
+        if len(channel_subs) >= self.config.MAX_LIVE_SCORE_SUBSCRIPTIONS:
+            await interaction.response.send_message(
+                f"❌ This channel already follows {self.config.MAX_LIVE_SCORE_SUBSCRIPTIONS} matches.", ephemeral=True
+            )
+            return
+
+        sub = {
+            'kind': 'team' if team else 'fixture',
+            'query': team,
+            'fixture_id': fixture_id,
+            'guild_id': interaction.guild.id,
+            'channel_id': interaction.channel.id,
+            'creator': interaction.user.id,
+            'message_id': None,
+            'last_fixture': None
+        }
+        sub_id = self.store.add(sub)
+        self.subscriptions[sub_id] = sub
+
+        embed = create_embed(
+            title="✅ Live Scores Enabled",
+            description=f"This channel now follows **{team or f'fixture {fixture_id}'}**.",
+            color=self.config.COLORS["success"]
+        )
+        embed.add_field(name="Subscription ID", value=str(sub_id), inline=True)
+        embed.add_field(
+            name="How it works",
+            value="A pinned message is edited whenever the score or minute changes.",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed)
+
+    @livescores.command(name="unfollow", description="Stop a live score subscription")
+    @app_commands.describe(subscription_id="The subscription ID shown by /livescores list")
+    async def unfollow(self, interaction: discord.Interaction, subscription_id: int):
+        """Remove a live score subscription."""
+        if not interaction.user.guild_permissions.manage_channels:
+            await interaction.response.send_message("❌ You need Manage Channels to change live scores.", ephemeral=True)
+            return
+
+        sub = self.subscriptions.get(subscription_id)
+        if sub is None or sub['guild_id'] != interaction.guild.id:
+            await interaction.response.send_message("❌ Subscription not found.", ephemeral=True)
+            return
+
+        del self.subscriptions[subscription_id]
+        self.store.delete(subscription_id)
+        await interaction.response.send_message(f"✅ Subscription {subscription_id} removed.", ephemeral=True)
+
+    @livescores.command(name="list", description="List live score subscriptions in this server")
+    async def list_subscriptions(self, interaction: discord.Interaction):
+        """Show this guild's live score subscriptions."""
+        guild_subs = [(sub_id, sub) for sub_id, sub in self.subscriptions.items() if sub['guild_id'] == interaction.guild.id]
+
+        embed = create_embed(
+            title="📺 Live Score Subscriptions",
+            color=self.config.COLORS["info"]
+        )
+        if not guild_subs:
+            embed.description = "No channels in this server follow live scores."
+        else:
+            lines = []
+            for sub_id, sub in guild_subs:
+                target = sub['query'] if sub['kind'] == 'team' else f"fixture {sub['fixture_id']}"
+                lines.append(f"`{sub_id}` • <#{sub['channel_id']}> • {target}")
+            embed.description = "\n".join(lines)[:4096]
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot):
+    bot.mark_setup_started(__name__)
+    await bot.add_cog(LiveScoresCog(bot))
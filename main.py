@@ -3,13 +3,17 @@
 Discord Utility Bot - Main Entry Point
 A comprehensive Discord bot with moderation, server management, and utility features.
 Includes 24/7 uptime support with web server for UptimeRobot monitoring.
+
+Set CLUSTER_PROCESSES above 1 to split the bot's shards across that many
+worker processes under a supervisor. Pass --fake-gateway to run the cluster
+without connecting to Discord.
 """
 
 import asyncio
 import logging
 import os
 import sys
-from bot import DiscordBot
+from config import BotConfig
 from keep_alive import start_server
 
 # Configure logging
@@ -24,23 +28,54 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+async def run_cluster(token: str, processes: int, fake_gateway: bool):
+    """Run the shards across worker processes, serving the supervisor's aggregated health."""
+    from cluster import ClusterSupervisor, fetch_gateway_info
+    
+    if fake_gateway:
+        shard_count, max_concurrency = BotConfig.SHARD_COUNT or processes * 2, 1
+    else:
+        recommended, max_concurrency = await fetch_gateway_info(token)
+        shard_count = BotConfig.SHARD_COUNT or recommended
+    shard_count = max(shard_count, processes)
+    
+    supervisor = ClusterSupervisor(shard_count, max_concurrency, processes, fake_gateway=fake_gateway)
+    
+    logger.info("Starting keep-alive server for 24/7 uptime...")
+    await start_server(health=supervisor.health)
+    
+    await supervisor.run()
+
 async def main():
     """Main function to start the Discord bot with keep-alive server."""
     try:
+        fake_gateway = "--fake-gateway" in sys.argv
+        processes = BotConfig.CLUSTER_PROCESSES
+        
         # Get bot token from environment variables
         token = os.getenv("DISCORD_BOT_TOKEN")
+        if fake_gateway:
+            await run_cluster(token, max(processes, 2), fake_gateway=True)
+            return
         if not token:
             logger.error("DISCORD_BOT_TOKEN environment variable not found!")
             logger.error("Please set your Discord bot token in the environment variables.")
             return
         
-        # Start the keep-alive web server for 24/7 uptime
-        logger.info("Starting keep-alive server for 24/7 uptime...")
-        await start_server()
+        if processes > 1:
+            await run_cluster(token, processes, fake_gateway=False)
+            return
+        
+        # Imported here so the cluster supervisor never loads discord.py and the cogs
+        from bot import DiscordBot
         
-        # Create and start the Discord bot
+        # Create the Discord bot
         bot = DiscordBot()
         
+        # Start the keep-alive web server for 24/7 uptime
+        logger.info("Starting keep-alive server for 24/7 uptime...")
+        await start_server(health=bot.health_snapshot)
+        
         logger.info("Starting Discord Utility Bot...")
         await bot.start(token)
         
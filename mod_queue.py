@@ -0,0 +1,251 @@
+"""
+Moderation Work Queue - Resumable bulk ban/kick/timeout jobs with bounded concurrency
+"""
+
+import asyncio
+import logging
+import re
+import time
+from datetime import datetime, timedelta, timezone
+import discord
+from database import close_database, open_database
+
+logger = logging.getLogger(__name__)
+
+USER_ID_PATTERN = re.compile(r"\b\d{15,20}\b")
+
+ACTION_LABELS = {
+    'ban': ("Banned", "🔨"),
+    'kick': ("Kicked", "👢"),
+    'timeout': ("Timed out", "⏳")
+}
+
+
+def parse_user_ids(text: str) -> list:
+    """Extract unique user ids from pasted text (plain ids or mentions), in order."""
+    return list(dict.fromkeys(int(match) for match in USER_ID_PATTERN.findall(text or "")))
+
+
+class ModerationJobStore:
+    """SQLite storage for mass-action jobs so they can resume after a restart."""
+
+    def __init__(self, path: str):
+        self.conn = open_database(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mod_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                message_id INTEGER,
+                moderator_id INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                reason TEXT NOT NULL,
+                duration INTEGER,
+                status TEXT NOT NULL DEFAULT 'running',
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_mod_jobs_status ON mod_jobs (status)")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mod_job_targets (
+                job_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                error TEXT,
+                PRIMARY KEY (job_id, user_id)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        close_database(self.conn)
+
+    def create_job(self, guild_id: int, channel_id: int, moderator_id: int, action: str,
+                   reason: str, duration: int, user_ids: list) -> int:
+        """Store a job and its targets; returns the job id.
+
+        ``duration`` is the timeout length in minutes, or for bans the days of
+        messages to delete.
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO mod_jobs (guild_id, channel_id, moderator_id, action, reason, duration, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (guild_id, channel_id, moderator_id, action, reason, duration, time.time())
+            )
+            job_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO mod_job_targets (job_id, user_id) VALUES (?, ?)",
+                [(job_id, user_id) for user_id in user_ids]
+            )
+        return job_id
+
+    def get_job(self, job_id: int):
+        return self.conn.execute("SELECT * FROM mod_jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def set_message(self, job_id: int, message_id: int):
+        with self.conn:
+            self.conn.execute("UPDATE mod_jobs SET message_id = ? WHERE id = ?", (message_id, job_id))
+
+    def set_status(self, job_id: int, status: str):
+        with self.conn:
+            self.conn.execute("UPDATE mod_jobs SET status = ? WHERE id = ?", (status, job_id))
+
+    def running_jobs(self) -> list:
+        return self.conn.execute("SELECT id, guild_id FROM mod_jobs WHERE status = 'running' ORDER BY id").fetchall()
+
+    def pending_targets(self, job_id: int) -> list:
+        return [row[0] for row in self.conn.execute(
+            "SELECT user_id FROM mod_job_targets WHERE job_id = ? AND state = 'pending'", (job_id,)
+        )]
+
+    def record_results(self, job_id: int, results: list):
+        """Store (user_id, state, error) outcomes in one transaction."""
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE mod_job_targets SET state = ?, error = ? WHERE job_id = ? AND user_id = ?",
+                [(state, error, job_id, user_id) for user_id, state, error in results]
+            )
+
+    def counts(self, job_id: int) -> dict:
+        """Number of targets in each state."""
+        counts = {'pending': 0, 'done': 0, 'failed': 0}
+        for row in self.conn.execute(
+            "SELECT state, COUNT(*) FROM mod_job_targets WHERE job_id = ? GROUP BY state", (job_id,)
+        ):
+            counts[row[0]] = row[1]
+        return counts
+
+
+class MassActionRunner:
+    """Runs mass-action jobs through a queue drained by a fixed number of workers."""
+
+    def __init__(self, bot, store: ModerationJobStore, concurrency: int, progress_interval: float, cases=None):
+        self.bot = bot
+        self.store = store
+        self.cases = cases
+        self.concurrency = concurrency
+        self.progress_interval = progress_interval
+        self.running = {}
+
+    def start(self, job_id: int):
+        """Run a job in the background."""
+        if job_id not in self.running:
+            self.running[job_id] = asyncio.create_task(self.run(job_id))
+
+    async def cancel(self, job_id: int) -> bool:
+        task = self.running.get(job_id)
+        if task is None:
+            return False
+        task.cancel()
+        self.store.set_status(job_id, 'cancelled')
+        return True
+
+    async def run(self, job_id: int):
+        job = self.store.get_job(job_id)
+        guild = self.bot.get_guild(job['guild_id'])
+        if guild is None:
+            self.store.set_status(job_id, 'failed')
+            self.running.pop(job_id, None)
+            return
+
+        queue = asyncio.Queue()
+        for user_id in self.store.pending_targets(job_id):
+            queue.put_nowait(user_id)
+
+        results = []
+
+        async def worker():
+            while True:
+                try:
+                    user_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await self.apply(guild, job, user_id)
+                    results.append((user_id, 'done', None))
+                except discord.NotFound:
+                    results.append((user_id, 'failed', "User not found"))
+                except discord.Forbidden:
+                    results.append((user_id, 'failed', "Missing permissions"))
+                except discord.HTTPException as e:
+                    results.append((user_id, 'failed', str(e)))
+                except Exception as e:
+                    logger.error(f"Mass action #{job_id} failed on {user_id}: {e}")
+                    results.append((user_id, 'failed', str(e)))
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            while True:
+                await asyncio.wait(workers, timeout=self.progress_interval)
+                self.flush(job, results)
+                if all(w.done() for w in workers):
+                    break
+                await self.report(job)
+            self.store.set_status(job_id, 'done')
+            await self.report(job, finished=True)
+        finally:
+            for w in workers:
+                w.cancel()
+            self.flush(job, results)
+            self.running.pop(job_id, None)
+
+    def flush(self, job, results: list):
+        """Persist worker results and log a moderation case for each success."""
+        if not results:
+            return
+        self.store.record_results(job['id'], results[:])
+        if self.cases is not None:
+            done = [user_id for user_id, state, _ in results if state == 'done']
+            duration = job['duration'] if job['action'] == 'timeout' else None
+            self.cases.add_cases(job['guild_id'], job['action'], done, job['moderator_id'], job['reason'], duration)
+        results.clear()
+
+    async def apply(self, guild: discord.Guild, job, user_id: int):
+        """Perform the job's action on one user."""
+        audit_reason = f"{job['reason']} - Mass action #{job['id']} by {job['moderator_id']}"
+        target = discord.Object(id=user_id)
+        if job['action'] == 'ban':
+            await guild.ban(target, reason=audit_reason, delete_message_seconds=(job['duration'] or 0) * 86400)
+        elif job['action'] == 'kick':
+            await guild.kick(target, reason=audit_reason)
+        elif job['action'] == 'timeout':
+            member = guild.get_member(user_id) or await guild.fetch_member(user_id)
+            until = datetime.now(timezone.utc) + timedelta(minutes=job['duration'])
+            await member.timeout(until, reason=audit_reason)
+
+    def progress_embed(self, job, finished: bool = False) -> discord.Embed:
+        counts = self.store.counts(job['id'])
+        total = sum(counts.values())
+        processed = counts['done'] + counts['failed']
+        label, emoji = ACTION_LABELS[job['action']]
+
+        bar_length = int(processed / total * 10) if total else 10
+        embed = discord.Embed(
+            title=f"{emoji} Mass Action #{job['id']} {'Complete' if finished else 'In Progress'}",
+            description=f"{'█' * bar_length}{'░' * (10 - bar_length)} {processed}/{total}",
+            color=discord.Color.green() if finished else discord.Color.orange()
+        )
+        embed.add_field(name=label, value=str(counts['done']), inline=True)
+        embed.add_field(name="Failed", value=str(counts['failed']), inline=True)
+        embed.add_field(name="Remaining", value=str(counts['pending']), inline=True)
+        embed.add_field(name="Reason", value=job['reason'][:1024], inline=False)
+        embed.set_footer(text=f"Started by moderator {job['moderator_id']}")
+        return embed
+
+    async def report(self, job, finished: bool = False):
+        """Edit the job's single status message with current progress."""
+        job = self.store.get_job(job['id'])
+        if not job['message_id']:
+            return
+        channel = self.bot.get_channel(job['channel_id'])
+        if channel is None:
+            return
+        try:
+            await channel.get_partial_message(job['message_id']).edit(embed=self.progress_embed(job, finished))
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to update mass action #{job['id']} status: {e}")
@@ -6,7 +6,18 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import asyncio
-from datetime import datetime, timedelta
+import io
+import logging
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from mod_queue import ModerationJobStore, MassActionRunner, USER_ID_PATTERN, parse_user_ids
+from notifications import DMNotifier
+from purge import compile_purge_filter, purge_channel
+from cases import CaseStore
+
+logger = logging.getLogger(__name__)
+
 def has_moderation_permissions(user: discord.Member, guild: discord.Guild) -> bool:
     """Check if the user has kick, ban, or manage_roles permissions."""
     perms = user.guild_permissions
@@ -21,12 +32,243 @@ def create_embed(title=None, description=None, color=discord.Color.red()):
     return embed
 from config import BotConfig
 
+MASS_ACTION_PERMISSIONS = {
+    'ban': 'ban_members',
+    'kick': 'kick_members',
+    'timeout': 'moderate_members'
+}
+
+class ConfirmView(discord.ui.View):
+    """Confirm/cancel prompt that only the invoking moderator can answer."""
+    
+    def __init__(self, interaction: discord.Interaction):
+        super().__init__(timeout=60)
+        self.interaction = interaction
+        self.author_id = interaction.user.id
+        self.value = None
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+    
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        try:
+            await self.interaction.edit_original_response(content="Timed out, nothing was done.", view=self)
+        except discord.HTTPException:
+            pass  # The prompt was dismissed
+    
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = True
+        await interaction.response.edit_message(view=None)
+        self.stop()
+    
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = False
+        await interaction.response.edit_message(content="Cancelled.", embed=None, view=None)
+        self.stop()
+
 class ModerationCog(commands.Cog):
     """Cog containing moderation commands."""
     
     def __init__(self, bot):
         self.bot = bot
         self.config = BotConfig()
+        self.jobs = ModerationJobStore(os.path.join(self.config.DATA_DIR, self.config.DATABASE_FILE))
+        self.cases = CaseStore(os.path.join(self.config.DATA_DIR, self.config.DATABASE_FILE))
+        self.mass_runner = MassActionRunner(
+            bot,
+            self.jobs,
+            self.config.MASS_ACTION_CONCURRENCY,
+            self.config.MASS_ACTION_PROGRESS_INTERVAL,
+            cases=self.cases
+        )
+        self.notifier = DMNotifier(
+            self.config.DM_NOTIFY_CONCURRENCY,
+            self.config.DM_NOTIFY_TIMEOUT,
+            self.config.DM_NOTIFY_QUEUE_SIZE
+        )
+    
+    async def cog_load(self):
+        self.notifier.start()
+        self.resume_task = asyncio.create_task(self.resume_mass_actions())
+    
+    async def cog_unload(self):
+        await self.notifier.stop()
+        # Leave interrupted jobs marked as running so they resume on the next start
+        tasks = [self.resume_task, *self.mass_runner.running.values()]
+        for task in tasks:
+            task.cancel()
+        # Let cancelled runners flush their progress before the store closes
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.jobs.close()
+        self.cases.close()
+    
+    async def resume_mass_actions(self):
+        """Resume mass actions that were interrupted by a restart."""
+        await self.bot.wait_until_ready()
+        for row in self.jobs.running_jobs():
+            if not self.bot.owns_guild(row['guild_id']):
+                continue  # Another cluster process runs this guild's shard
+            logger.info(f"Resuming mass action #{row['id']}")
+            self.mass_runner.start(row['id'])
+    
+    def select_mass_targets(self, interaction: discord.Interaction, action: str, user_ids: list,
+                            joined_after: datetime, max_account_age: int, name_pattern) -> tuple:
+        """Resolve ids and filters into (target ids, skipped count)."""
+        guild = interaction.guild
+        moderator = interaction.user
+        member_filters = joined_after is not None or name_pattern is not None
+        account_cutoff = (
+            datetime.now(timezone.utc) - timedelta(days=max_account_age)
+            if max_account_age is not None else None
+        )
+        
+        if user_ids:
+            candidates = [(user_id, guild.get_member(user_id)) for user_id in user_ids]
+        else:
+            candidates = [(member.id, member) for member in guild.members]
+        
+        targets = []
+        skipped = 0
+        for user_id, member in candidates:
+            if user_id in (moderator.id, guild.owner_id, guild.me.id):
+                skipped += 1
+                continue
+            
+            if member is None:
+                # Users outside the server can only be banned, and only member-independent filters apply
+                if action != 'ban' or member_filters:
+                    skipped += 1
+                    continue
+            else:
+                if member.top_role >= guild.me.top_role or (
+                    member.top_role >= moderator.top_role and moderator.id != guild.owner_id
+                ):
+                    skipped += 1
+                    continue
+                if joined_after is not None and (member.joined_at is None or member.joined_at < joined_after):
+                    continue
+                if name_pattern is not None and not (
+                    name_pattern.search(member.name) or name_pattern.search(member.display_name)
+                ):
+                    continue
+            
+            if account_cutoff is not None and discord.utils.snowflake_time(user_id) < account_cutoff:
+                continue
+            targets.append(user_id)
+        
+        return targets, skipped
+    
+    async def start_mass_action(self, interaction: discord.Interaction, action: str, reason: str, duration: int,
+                                user_ids: str, joined_after: str, max_account_age: int, name_pattern: str):
+        """Validate a mass action, ask for confirmation, then queue it."""
+        permission = MASS_ACTION_PERMISSIONS[action]
+        if not getattr(interaction.user.guild_permissions, permission):
+            await interaction.response.send_message("❌ You don't have permission to do that.", ephemeral=True)
+            return
+        
+        ids = parse_user_ids(user_ids)
+        if not ids and joined_after is None and max_account_age is None and name_pattern is None:
+            await interaction.response.send_message("❌ Provide user IDs or at least one filter.", ephemeral=True)
+            return
+        
+        joined_after_dt = None
+        if joined_after is not None:
+            try:
+                joined_after_dt = datetime.strptime(joined_after, "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
+            except ValueError:
+                await interaction.response.send_message("❌ Invalid date. Use `YYYY-MM-DD HH:MM` (UTC).", ephemeral=True)
+                return
+        
+        pattern = None
+        if name_pattern is not None:
+            try:
+                pattern = re.compile(name_pattern, re.IGNORECASE)
+            except re.error as e:
+                await interaction.response.send_message(f"❌ Invalid name pattern: {e}", ephemeral=True)
+                return
+        
+        targets, skipped = self.select_mass_targets(interaction, action, ids, joined_after_dt, max_account_age, pattern)
+        if not targets:
+            await interaction.response.send_message("❌ No members matched.", ephemeral=True)
+            return
+        if len(targets) > self.config.MAX_MASS_ACTION_TARGETS:
+            await interaction.response.send_message(
+                f"❌ {len(targets)} members matched; the limit is {self.config.MAX_MASS_ACTION_TARGETS}. Narrow the filters.",
+                ephemeral=True
+            )
+            return
+        
+        preview = create_embed(
+            title=f"⚠️ Confirm mass {action}",
+            description=f"This will {action} **{len(targets)}** users.",
+            color=self.config.COLORS["warning"]
+        )
+        sample = ", ".join(f"<@{user_id}>" for user_id in targets[:20])
+        if len(targets) > 20:
+            sample += f" and {len(targets) - 20} more"
+        preview.add_field(name="Targets", value=sample, inline=False)
+        preview.add_field(name="Reason", value=reason, inline=False)
+        if skipped:
+            preview.add_field(name="Skipped", value=f"{skipped} protected or unreachable users", inline=False)
+        
+        view = ConfirmView(interaction)
+        await interaction.response.send_message(embed=preview, view=view, ephemeral=True)
+        await view.wait()
+        if not view.value:
+            return
+        
+        job_id = self.jobs.create_job(
+            interaction.guild.id, interaction.channel.id, interaction.user.id, action, reason, duration, targets
+        )
+        # The job is already stored as running, so it starts whether or not its status can be posted
+        try:
+            status_message = await interaction.channel.send(
+                embed=self.mass_runner.progress_embed(self.jobs.get_job(job_id))
+            )
+            self.jobs.set_message(job_id, status_message.id)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to post status for mass action #{job_id}: {e}")
+        self.mass_runner.start(job_id)
+        await interaction.followup.send(f"✅ Mass action #{job_id} started.", ephemeral=True)
+    
+    async def queue_automatic_action(self, guild: discord.Guild, channel_id: int, action: str,
+                                     user_ids: list, reason: str, duration: int = None) -> int:
+        """Queue a mass action on behalf of the bot itself, e.g. from raid or spam detection.
+        
+        Returns the job id. Progress is posted to ``channel_id`` when it can be resolved.
+        """
+        job_id = self.jobs.create_job(guild.id, channel_id or 0, self.bot.user.id, action, reason, duration, user_ids)
+        channel = self.bot.get_channel(channel_id) if channel_id else None
+        if channel is not None:
+            try:
+                status_message = await channel.send(embed=self.mass_runner.progress_embed(self.jobs.get_job(job_id)))
+                self.jobs.set_message(job_id, status_message.id)
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to post status for automatic action #{job_id}: {e}")
+        self.mass_runner.start(job_id)
+        return job_id
+    
+    async def auto_timeout(self, member: discord.Member, duration: int, reason: str) -> int:
+        """Time a member out on behalf of the bot and notify them; returns the case number.
+        
+        Raises ``discord.HTTPException`` if Discord refuses the timeout.
+        """
+        until = datetime.now(timezone.utc) + timedelta(minutes=duration)
+        await member.timeout(until, reason=f"{reason} - Automatic action")
+        case_number = self.cases.add_case(member.guild.id, 'timeout', member.id, self.bot.user.id, reason, duration)
+        
+        dm_embed = create_embed(
+            title="You have been timed out",
+            description=f"You were automatically timed out in **{member.guild.name}** for {duration} minutes",
+            color=discord.Color.orange()
+        )
+        dm_embed.add_field(name="Reason", value=reason, inline=False)
+        self.notifier.notify(member, dm_embed)
+        return case_number
     
     @app_commands.command(name="kick", description="Kick a member from the server")
     @app_commands.describe(
@@ -48,20 +290,18 @@ class ModerationCog(commands.Cog):
             return
         
         try:
-            # Send DM to the member before kicking
-            try:
-                dm_embed = create_embed(
-                    title="You have been kicked",
-                    description=f"You were kicked from **{interaction.guild.name}**",
-                    color=discord.Color.orange()
-                )
-                dm_embed.add_field(name="Reason", value=reason, inline=False)
-                dm_embed.add_field(name="Kicked by", value=interaction.user.mention, inline=True)
-                await member.send(embed=dm_embed)
-            except:
-                pass  # Member might have DMs disabled
+            # Queue the DM and give it a short head start, since it can't be delivered once they've left
+            dm_embed = create_embed(
+                title="You have been kicked",
+                description=f"You were kicked from **{interaction.guild.name}**",
+                color=discord.Color.orange()
+            )
+            dm_embed.add_field(name="Reason", value=reason, inline=False)
+            dm_embed.add_field(name="Kicked by", value=interaction.user.mention, inline=True)
+            await self.notifier.wait(self.notifier.notify(member, dm_embed), self.config.DM_NOTIFY_GRACE)
             
             await member.kick(reason=f"{reason} - Kicked by {interaction.user}")
+            case_number = self.cases.add_case(interaction.guild.id, 'kick', member.id, interaction.user.id, reason)
             
             embed = create_embed(
                 title="Member Kicked",
@@ -70,6 +310,7 @@ class ModerationCog(commands.Cog):
             )
             embed.add_field(name="Reason", value=reason, inline=False)
             embed.add_field(name="Kicked by", value=interaction.user.mention, inline=True)
+            embed.set_footer(text=f"Case #{case_number}")
             
             await interaction.response.send_message(embed=embed)
             
@@ -103,20 +344,18 @@ class ModerationCog(commands.Cog):
             return
         
         try:
-            # Send DM to the member before banning
-            try:
-                dm_embed = create_embed(
-                    title="You have been banned",
-                    description=f"You were banned from **{interaction.guild.name}**",
-                    color=self.config.COLORS["error"]
-                )
-                dm_embed.add_field(name="Reason", value=reason, inline=False)
-                dm_embed.add_field(name="Banned by", value=interaction.user.mention, inline=True)
-                await member.send(embed=dm_embed)
-            except:
-                pass  # Member might have DMs disabled
+            # Queue the DM and give it a short head start, since it can't be delivered once they've left
+            dm_embed = create_embed(
+                title="You have been banned",
+                description=f"You were banned from **{interaction.guild.name}**",
+                color=self.config.COLORS["error"]
+            )
+            dm_embed.add_field(name="Reason", value=reason, inline=False)
+            dm_embed.add_field(name="Banned by", value=interaction.user.mention, inline=True)
+            await self.notifier.wait(self.notifier.notify(member, dm_embed), self.config.DM_NOTIFY_GRACE)
             
             await member.ban(reason=f"{reason} - Banned by {interaction.user}", delete_message_days=delete_messages)
+            case_number = self.cases.add_case(interaction.guild.id, 'ban', member.id, interaction.user.id, reason)
             
             embed = create_embed(
                 title="Member Banned",
@@ -126,6 +365,7 @@ class ModerationCog(commands.Cog):
             embed.add_field(name="Reason", value=reason, inline=False)
             embed.add_field(name="Banned by", value=interaction.user.mention, inline=True)
             embed.add_field(name="Messages deleted", value=f"{delete_messages} days", inline=True)
+            embed.set_footer(text=f"Case #{case_number}")
             
             await interaction.response.send_message(embed=embed)
             
@@ -154,6 +394,7 @@ class ModerationCog(commands.Cog):
         try:
             user = await self.bot.fetch_user(user_id)
             await interaction.guild.unban(user, reason=f"{reason} - Unbanned by {interaction.user}")
+            case_number = self.cases.add_case(interaction.guild.id, 'unban', user.id, interaction.user.id, reason)
             
             embed = create_embed(
                 title="Member Unbanned",
@@ -162,6 +403,7 @@ class ModerationCog(commands.Cog):
             )
             embed.add_field(name="Reason", value=reason, inline=False)
             embed.add_field(name="Unbanned by", value=interaction.user.mention, inline=True)
+            embed.set_footer(text=f"Case #{case_number}")
             
             await interaction.response.send_message(embed=embed)
             
@@ -174,50 +416,107 @@ class ModerationCog(commands.Cog):
     
     @app_commands.command(name="clear", description="Clear a specified number of messages")
     @app_commands.describe(
-        amount="Number of messages to delete (1-100)",
-        user="Only delete messages from this user"
+        amount="Number of matching messages to delete",
+        user="Only delete messages from this user",
+        bots_only="Only delete messages from bots",
+        contains="Only delete messages containing this text",
+        regex="Only delete messages matching this regular expression",
+        has_links="Only delete messages with links",
+        has_attachments="Only delete messages with attachments",
+        has_invites="Only delete messages with server invites",
+        before="Only delete messages before this message ID",
+        after="Only delete messages after this message ID"
     )
-    async def clear(self, interaction: discord.Interaction, amount: int, user: discord.Member = None):
+    async def clear(self, interaction: discord.Interaction, amount: int, user: discord.Member = None,
+                    bots_only: bool = False, contains: str = None, regex: str = None, has_links: bool = False,
+                    has_attachments: bool = False, has_invites: bool = False, before: str = None, after: str = None):
         """Clear messages from the channel."""
         if not has_moderation_permissions(interaction.user, interaction.guild):
-            await interaction.response.send_message("â You don't have permission to manage messages.", ephemeral=True)
+            await interaction.response.send_message("❌ You don't have permission to manage messages.", ephemeral=True)
             return
         
         if amount < 1 or amount > self.config.MAX_PURGE_AMOUNT:
-            await interaction.response.send_message(f"â Amount must be between 1 and {self.config.MAX_PURGE_AMOUNT}.", ephemeral=True)
+            await interaction.response.send_message(f"❌ Amount must be between 1 and {self.config.MAX_PURGE_AMOUNT}.", ephemeral=True)
             return
         
         try:
-            def check(message):
-                if user:
-                    return message.author == user
-                return True
-            
-            # Defer the response since this might take a while
-            await interaction.response.defer()
-            
-            deleted = await interaction.channel.purge(limit=amount, check=check)
-            
+            before_id = int(before) if before else interaction.id
+            after_id = int(after) if after else None
+        except ValueError:
+            await interaction.response.send_message("❌ Invalid message ID.", ephemeral=True)
+            return
+        
+        pattern = None
+        if regex:
+            try:
+                pattern = re.compile(regex, re.IGNORECASE)
+            except re.error as e:
+                await interaction.response.send_message(f"❌ Invalid regex: {e}", ephemeral=True)
+                return
+        
+        # Compiled once, applied to every message while streaming history
+        check = compile_purge_filter(
+            user=user,
+            bots_only=bots_only,
+            contains=contains,
+            pattern=pattern,
+            has_links=has_links,
+            has_attachments=has_attachments,
+            has_invites=has_invites
+        )
+        
+        def build_embed(stats, finished=False):
+            deleted = stats['bulk_deleted'] + stats['single_deleted']
             embed = create_embed(
-                title="Messages Cleared",
-                description=f"Successfully deleted {len(deleted)} messages",
-                color=self.config.COLORS["success"]
+                title="Messages Cleared" if finished else "Clearing Messages...",
+                description=f"Successfully deleted {deleted} messages" if finished else f"Deleted {deleted} of {amount} so far",
+                color=self.config.COLORS["success"] if finished else discord.Color.orange()
             )
-            
             if user:
                 embed.add_field(name="Target User", value=user.mention, inline=True)
-            
             embed.add_field(name="Cleared by", value=interaction.user.mention, inline=True)
-            
-            # Send a temporary message that will delete itself
-            message = await interaction.followup.send(embed=embed)
-            await asyncio.sleep(5)
-            await message.delete()
-            
+            embed.add_field(name="Scanned", value=str(stats['scanned']), inline=True)
+            if stats['single_deleted']:
+                embed.add_field(name="Older than 14 days", value=f"{stats['single_deleted']} deleted individually", inline=True)
+            if stats['failed']:
+                embed.add_field(name="Failed", value=str(stats['failed']), inline=True)
+            return embed
+        
+        async def report_progress(stats):
+            try:
+                await interaction.edit_original_response(embed=build_embed(stats))
+            except discord.HTTPException:
+                pass  # Interaction token expired; keep deleting
+        
+        # Progress goes to an ephemeral response, so nothing has to be cleaned up afterwards
+        await interaction.response.defer(ephemeral=True)
+        
+        try:
+            stats = await purge_channel(
+                interaction.channel,
+                amount,
+                check,
+                # Never past the moment this command was run
+                before=discord.Object(id=min(before_id, interaction.id)),
+                after=discord.Object(id=after_id) if after_id else None,
+                max_scan=self.config.MAX_PURGE_SCAN,
+                on_progress=report_progress,
+                progress_interval=self.config.PURGE_PROGRESS_INTERVAL
+            )
         except discord.Forbidden:
-            await interaction.followup.send("â I don't have permission to delete messages.", ephemeral=True)
+            stats, error = None, "❌ I don't have permission to delete messages."
         except Exception as e:
-            await interaction.followup.send(f"â An error occurred: {str(e)}", ephemeral=True)
+            stats, error = None, f"❌ An error occurred: {str(e)}"
+        
+        # A long purge can outlive the 15 minute interaction token, so the result may have nowhere to go
+        try:
+            if stats is not None:
+                await interaction.edit_original_response(embed=build_embed(stats, finished=True))
+            else:
+                await interaction.followup.send(error, ephemeral=True)
+        except discord.HTTPException as e:
+            outcome = f"deleted {stats['bulk_deleted'] + stats['single_deleted']} messages" if stats is not None else error
+            logger.info(f"Could not report /clear in channel {interaction.channel.id} ({outcome}): {e}")
     
     @app_commands.command(name="timeout", description="Timeout a member")
     @app_commands.describe(
@@ -246,6 +545,17 @@ class ModerationCog(commands.Cog):
         try:
             timeout_until = datetime.utcnow() + timedelta(minutes=duration)
             await member.timeout(timeout_until, reason=f"{reason} - Timed out by {interaction.user}")
+            case_number = self.cases.add_case(interaction.guild.id, 'timeout', member.id, interaction.user.id, reason, duration)
+            
+            # The member stays in the server, so the DM can go out in the background
+            dm_embed = create_embed(
+                title="You have been timed out",
+                description=f"You were timed out in **{interaction.guild.name}** for {duration} minutes",
+                color=discord.Color.orange()
+            )
+            dm_embed.add_field(name="Reason", value=reason, inline=False)
+            dm_embed.add_field(name="Timed out by", value=interaction.user.mention, inline=True)
+            self.notifier.notify(member, dm_embed)
             
             embed = create_embed(
     title="Member Timed Out",
@@ -255,6 +565,7 @@ class ModerationCog(commands.Cog):
             embed.add_field(name="Duration", value=f"{duration} minutes", inline=True)
             embed.add_field(name="Reason", value=reason, inline=False)
             embed.add_field(name="Timed out by", value=interaction.user.mention, inline=True)
+            embed.set_footer(text=f"Case #{case_number}")
             
             await interaction.response.send_message(embed=embed)
             
@@ -263,5 +574,266 @@ class ModerationCog(commands.Cog):
         except Exception as e:
             await interaction.response.send_message(f"â An error occurred: {str(e)}", ephemeral=True)
 
+    @app_commands.command(name="massban", description="Ban many users at once by ID list or filters")
+    @app_commands.describe(
+        user_ids="User IDs or mentions, separated by spaces or commas",
+        joined_after="Only members who joined after this time (YYYY-MM-DD HH:MM, UTC)",
+        max_account_age="Only accounts younger than this many days",
+        name_pattern="Only members whose name matches this regex",
+        reason="Reason for the ban",
+        delete_messages="Days of messages to delete (0-7)"
+    )
+    async def massban(self, interaction: discord.Interaction, user_ids: str = None, joined_after: str = None,
+                      max_account_age: int = None, name_pattern: str = None,
+                      reason: str = "No reason provided", delete_messages: int = 0):
+        """Ban many users through the mass action queue."""
+        if delete_messages < 0 or delete_messages > 7:
+            await interaction.response.send_message("❌ Delete messages days must be between 0 and 7.", ephemeral=True)
+            return
+        await self.start_mass_action(interaction, 'ban', reason, delete_messages, user_ids, joined_after, max_account_age, name_pattern)
+    
+    @app_commands.command(name="masskick", description="Kick many members at once by ID list or filters")
+    @app_commands.describe(
+        user_ids="User IDs or mentions, separated by spaces or commas",
+        joined_after="Only members who joined after this time (YYYY-MM-DD HH:MM, UTC)",
+        max_account_age="Only accounts younger than this many days",
+        name_pattern="Only members whose name matches this regex",
+        reason="Reason for the kick"
+    )
+    async def masskick(self, interaction: discord.Interaction, user_ids: str = None, joined_after: str = None,
+                       max_account_age: int = None, name_pattern: str = None, reason: str = "No reason provided"):
+        """Kick many members through the mass action queue."""
+        await self.start_mass_action(interaction, 'kick', reason, None, user_ids, joined_after, max_account_age, name_pattern)
+    
+    @app_commands.command(name="masstimeout", description="Timeout many members at once by ID list or filters")
+    @app_commands.describe(
+        duration="Duration in minutes",
+        user_ids="User IDs or mentions, separated by spaces or commas",
+        joined_after="Only members who joined after this time (YYYY-MM-DD HH:MM, UTC)",
+        max_account_age="Only accounts younger than this many days",
+        name_pattern="Only members whose name matches this regex",
+        reason="Reason for the timeout"
+    )
+    async def masstimeout(self, interaction: discord.Interaction, duration: int, user_ids: str = None,
+                          joined_after: str = None, max_account_age: int = None, name_pattern: str = None,
+                          reason: str = "No reason provided"):
+        """Timeout many members through the mass action queue."""
+        if duration < 1 or duration > 40320:  # Discord's max timeout is 28 days
+            await interaction.response.send_message("❌ Duration must be between 1 minute and 28 days (40320 minutes).", ephemeral=True)
+            return
+        await self.start_mass_action(interaction, 'timeout', reason, duration, user_ids, joined_after, max_account_age, name_pattern)
+    
+    @app_commands.command(name="bulkban", description="Ban up to thousands of user IDs using Discord's bulk ban endpoint")
+    @app_commands.describe(
+        user_ids="User IDs or mentions, separated by spaces, commas or new lines",
+        file="A text file of user IDs",
+        reason="Reason for the ban",
+        delete_messages="Days of messages to delete (0-7)"
+    )
+    async def bulkban(self, interaction: discord.Interaction, user_ids: str = None, file: discord.Attachment = None,
+                      reason: str = "No reason provided", delete_messages: int = 0):
+        """Ban a pasted or uploaded list of user IDs, 200 per request."""
+        if not interaction.user.guild_permissions.ban_members:
+            await interaction.response.send_message("❌ You don't have permission to ban members.", ephemeral=True)
+            return
+        
+        if delete_messages < 0 or delete_messages > 7:
+            await interaction.response.send_message("❌ Delete messages days must be between 0 and 7.", ephemeral=True)
+            return
+        
+        text = user_ids or ""
+        if file is not None:
+            if file.size > self.config.MAX_BULK_BAN_FILE_SIZE:
+                await interaction.response.send_message("❌ That file is too large.", ephemeral=True)
+                return
+            text += "\n" + (await file.read()).decode('utf-8', errors='ignore')
+        
+        ids = parse_user_ids(text)
+        if not ids:
+            await interaction.response.send_message("❌ No user IDs found.", ephemeral=True)
+            return
+        
+        targets, skipped = self.select_mass_targets(interaction, 'ban', ids, None, None, None)
+        if not targets:
+            await interaction.response.send_message("❌ None of those users can be banned.", ephemeral=True)
+            return
+        
+        chunk_size = self.config.BULK_BAN_CHUNK_SIZE
+        chunks = [targets[i:i + chunk_size] for i in range(0, len(targets), chunk_size)]
+        
+        preview = create_embed(
+            title="⚠️ Confirm bulk ban",
+            description=f"This will ban **{len(targets)}** users in {len(chunks)} request(s).",
+            color=self.config.COLORS["warning"]
+        )
+        preview.add_field(name="Reason", value=reason, inline=False)
+        duplicates = len(USER_ID_PATTERN.findall(text)) - len(ids)
+        if skipped or duplicates:
+            preview.add_field(name="Skipped", value=f"{skipped} protected users, {duplicates} duplicates", inline=False)
+        
+        view = ConfirmView(interaction)
+        await interaction.response.send_message(embed=preview, view=view, ephemeral=True)
+        await view.wait()
+        if not view.value:
+            return
+        
+        status_message = await interaction.channel.send(embed=create_embed(
+            title="🔨 Bulk Ban In Progress",
+            description=f"0/{len(chunks)} requests sent",
+            color=discord.Color.orange()
+        ))
+        
+        banned, failed = [], []
+        chunk_lines = []
+        for number, chunk in enumerate(chunks, start=1):
+            try:
+                result = await interaction.guild.bulk_ban(
+                    [discord.Object(id=user_id) for user_id in chunk],
+                    reason=f"{reason} - Bulk banned by {interaction.user}",
+                    delete_message_seconds=delete_messages * 86400
+                )
+                chunk_banned = [user.id for user in result.banned]
+                chunk_failed = [user.id for user in result.failed]
+            except discord.HTTPException as e:
+                logger.warning(f"Bulk ban chunk {number} failed: {e}")
+                chunk_banned, chunk_failed = [], chunk
+            banned.extend(chunk_banned)
+            failed.extend(chunk_failed)
+            self.cases.add_cases(interaction.guild.id, 'ban', chunk_banned, interaction.user.id, reason)
+            chunk_lines.append(f"Request {number}: {len(chunk_banned)} banned, {len(chunk_failed)} failed")
+            
+            progress = create_embed(
+                title="🔨 Bulk Ban In Progress" if number < len(chunks) else "🔨 Bulk Ban Complete",
+                description=f"{number}/{len(chunks)} requests sent",
+                color=discord.Color.orange() if number < len(chunks) else self.config.COLORS["success"]
+            )
+            progress.add_field(name="Banned", value=str(len(banned)), inline=True)
+            progress.add_field(name="Failed", value=str(len(failed)), inline=True)
+            progress.add_field(name="Requests", value="\n".join(chunk_lines[-10:]), inline=False)
+            progress.add_field(name="Reason", value=reason, inline=False)
+            progress.set_footer(text=f"Started by {interaction.user}")
+            await status_message.edit(embed=progress)
+        
+        if failed:
+            report = io.BytesIO("\n".join(str(user_id) for user_id in failed).encode())
+            await interaction.followup.send(
+                f"⚠️ {len(failed)} users could not be banned.",
+                file=discord.File(report, filename="bulkban_failed.txt"),
+                ephemeral=True
+            )
+    
+    @app_commands.command(name="masscancel", description="Stop a running mass action")
+    @app_commands.describe(job_id="The mass action number")
+    async def masscancel(self, interaction: discord.Interaction, job_id: int):
+        """Cancel a running mass action."""
+        job = self.jobs.get_job(job_id)
+        if job is None or job['guild_id'] != interaction.guild.id:
+            await interaction.response.send_message("❌ Mass action not found.", ephemeral=True)
+            return
+        
+        permission = MASS_ACTION_PERMISSIONS[job['action']]
+        if not getattr(interaction.user.guild_permissions, permission):
+            await interaction.response.send_message("❌ You don't have permission to do that.", ephemeral=True)
+            return
+        
+        if not await self.mass_runner.cancel(job_id):
+            await interaction.response.send_message("❌ That mass action is not running.", ephemeral=True)
+            return
+        
+        await interaction.response.send_message(f"🛑 Mass action #{job_id} cancelled.")
+
+    @app_commands.command(name="case", description="Look up a moderation case")
+    @app_commands.describe(case_number="The case number")
+    async def case(self, interaction: discord.Interaction, case_number: int):
+        """Show a single moderation case."""
+        if not has_moderation_permissions(interaction.user, interaction.guild):
+            await interaction.response.send_message("❌ You don't have permission to view cases.", ephemeral=True)
+            return
+        
+        row = self.cases.get_case(interaction.guild.id, case_number)
+        if row is None:
+            await interaction.response.send_message("❌ Case not found.", ephemeral=True)
+            return
+        
+        embed = create_embed(
+            title=f"📁 Case #{row['case_number']} • {row['action'].title()}",
+            color=self.config.COLORS["info"]
+        )
+        embed.add_field(name="User", value=f"<@{row['target_id']}> ({row['target_id']})", inline=True)
+        embed.add_field(name="Moderator", value=f"<@{row['moderator_id']}>", inline=True)
+        if row['duration']:
+            embed.add_field(name="Duration", value=f"{row['duration']} minutes", inline=True)
+        embed.add_field(name="Reason", value=row['reason'] or "No reason provided", inline=False)
+        embed.add_field(name="Date", value=f"<t:{int(row['created_at'])}:F>", inline=False)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="history", description="Show a user's moderation history")
+    @app_commands.describe(user="The user to look up", page="Page number")
+    async def history(self, interaction: discord.Interaction, user: discord.User, page: int = 1):
+        """Show a user's past moderation cases."""
+        if not has_moderation_permissions(interaction.user, interaction.guild):
+            await interaction.response.send_message("❌ You don't have permission to view cases.", ephemeral=True)
+            return
+        
+        counts = self.cases.history_counts(interaction.guild.id, user.id)
+        total = sum(counts.values())
+        page_size = self.config.CASES_PAGE_SIZE
+        pages = max(1, -(-total // page_size))
+        page = min(max(page, 1), pages)
+        
+        embed = create_embed(
+            title=f"📁 History for {user}",
+            color=self.config.COLORS["info"]
+        )
+        if not total:
+            embed.description = "No moderation cases on record."
+        else:
+            embed.description = " • ".join(f"{action.title()}: {count}" for action, count in sorted(counts.items()))
+            lines = []
+            for row in self.cases.history(interaction.guild.id, user.id, page_size, (page - 1) * page_size):
+                reason = row['reason'] or "No reason provided"
+                if len(reason) > 60:
+                    reason = reason[:57] + "..."
+                lines.append(f"`#{row['case_number']}` {row['action'].title()} <t:{int(row['created_at'])}:d> by <@{row['moderator_id']}> • {reason}")
+            embed.add_field(name="Cases", value="\n".join(lines)[:1024], inline=False)
+        embed.set_footer(text=f"Page {page}/{pages} • {total} cases")
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="modstats", description="Show moderation statistics for this server")
+    async def modstats(self, interaction: discord.Interaction):
+        """Show per-action and per-moderator case counts."""
+        if not has_moderation_permissions(interaction.user, interaction.guild):
+            await interaction.response.send_message("❌ You don't have permission to view cases.", ephemeral=True)
+            return
+        
+        totals = self.cases.action_totals(interaction.guild.id)
+        embed = create_embed(
+            title="📈 Moderation Statistics",
+            description=f"**{sum(totals.values())}** cases on record",
+            color=self.config.COLORS["info"]
+        )
+        if totals:
+            embed.add_field(
+                name="By Action",
+                value="\n".join(f"{action.title()}: {count}" for action, count in sorted(totals.items())),
+                inline=True
+            )
+            top = self.cases.top_moderators(interaction.guild.id, 5)
+            embed.add_field(
+                name="Top Moderators",
+                value="\n".join(f"<@{row['moderator_id']}>: {row['total']}" for row in top),
+                inline=True
+            )
+        
+        dm_stats = self.notifier.stats
+        embed.set_footer(
+            text=f"DMs delivered: {dm_stats['delivered']} • failed: {dm_stats['failed'] + dm_stats['timed_out']} • dropped: {dm_stats['dropped']}"
+        )
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 async def setup(bot):
+    bot.mark_setup_started(__name__)
     await bot.add_cog(ModerationCog(bot))
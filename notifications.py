@@ -0,0 +1,74 @@
+"""
+DM Notifier - Background queue for moderation DMs with bounded concurrency and timeouts
+"""
+
+import asyncio
+import logging
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+class DMNotifier:
+    """Sends direct messages from a bounded queue so moderation commands never wait on them."""
+
+    def __init__(self, concurrency: int, timeout: float, max_queue: int):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.stats = {'delivered': 0, 'failed': 0, 'timed_out': 0, 'dropped': 0}
+        self._workers = []
+
+    def start(self):
+        """Start the worker tasks."""
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        """Stop the workers; queued DMs are abandoned."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def notify(self, user: discord.abc.User, embed: discord.Embed) -> asyncio.Future:
+        """Queue a DM; the returned future resolves to whether it was delivered."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((user, embed, future))
+        except asyncio.QueueFull:
+            self.stats['dropped'] += 1
+            future.set_result(False)
+        return future
+
+    async def wait(self, future: asyncio.Future, grace: float) -> bool:
+        """Give a queued DM up to ``grace`` seconds to land; it keeps going in the background after that."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=grace)
+        except asyncio.TimeoutError:
+            return False
+
+    async def _worker(self):
+        while True:
+            user, embed, future = await self.queue.get()
+            delivered = False
+            try:
+                await asyncio.wait_for(user.send(embed=embed), timeout=self.timeout)
+                delivered = True
+                self.stats['delivered'] += 1
+            except asyncio.TimeoutError:
+                self.stats['timed_out'] += 1
+                logger.info(f"DM to {user.id} timed out")
+            except discord.Forbidden:
+                self.stats['failed'] += 1  # DMs closed or no mutual server
+            except discord.HTTPException as e:
+                self.stats['failed'] += 1
+                logger.info(f"DM to {user.id} failed: {e}")
+            except Exception:
+                # Keep the worker alive so the queue continues to drain
+                self.stats['failed'] += 1
+                logger.exception(f"Unexpected error sending DM to {getattr(user, 'id', user)}")
+            finally:
+                if not future.done():
+                    future.set_result(delivered)
+                self.queue.task_done()
@@ -0,0 +1,183 @@
+"""
+Poll Registry - Poll metadata and vote tallies fed by reaction gateway events, persisted in SQLite
+"""
+
+import json
+import time
+from database import close_database, open_database
+
+NUMBER_EMOJIS = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
+
+
+class PollTally:
+    """Running vote counts for one poll, updated one reaction event at a time."""
+
+    def __init__(self, option_count: int, single_choice: bool = False):
+        self.counts = [0] * option_count
+        self.single_choice = single_choice
+        self.voters = {}
+        self.dirty = set()
+
+    @property
+    def total_votes(self) -> int:
+        return sum(self.counts)
+
+    def add(self, user_id: int, option: int) -> list:
+        """Record a vote; returns options the user must be un-voted from (single-choice polls)."""
+        choices = self.voters.setdefault(user_id, set())
+        if option in choices:
+            return []
+
+        replaced = []
+        if self.single_choice:
+            replaced = list(choices)
+            for previous in replaced:
+                self.counts[previous] -= 1
+            choices.clear()
+
+        choices.add(option)
+        self.counts[option] += 1
+        self.dirty.add(user_id)
+        return replaced
+
+    def remove(self, user_id: int, option: int):
+        """Withdraw a vote if the user currently holds it."""
+        choices = self.voters.get(user_id)
+        if not choices or option not in choices:
+            return
+        choices.discard(option)
+        self.counts[option] -= 1
+        if not choices:
+            del self.voters[user_id]
+        self.dirty.add(user_id)
+
+    def load_vote(self, user_id: int, option: int):
+        """Restore a persisted vote without marking it dirty."""
+        if option < len(self.counts) and option not in self.voters.setdefault(user_id, set()):
+            self.voters[user_id].add(option)
+            self.counts[option] += 1
+
+
+class PollStore:
+    """SQLite storage for polls and their votes, indexed by message id and by guild."""
+
+    def __init__(self, path: str):
+        self.conn = open_database(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS polls (
+                message_id INTEGER PRIMARY KEY,
+                guild_id INTEGER,
+                channel_id INTEGER NOT NULL,
+                creator_id INTEGER NOT NULL,
+                question TEXT NOT NULL,
+                options TEXT NOT NULL,
+                single_choice INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                close_at REAL,
+                closed INTEGER NOT NULL DEFAULT 0,
+                buttons INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        # Databases created before button polls were stored lack the column
+        if 'buttons' not in {row['name'] for row in self.conn.execute("PRAGMA table_info(polls)")}:
+            self.conn.execute("ALTER TABLE polls ADD COLUMN buttons INTEGER NOT NULL DEFAULT 0")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_polls_guild ON polls (guild_id, closed, created_at)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_polls_close ON polls (closed, close_at)")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS poll_votes (
+                message_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                option INTEGER NOT NULL,
+                PRIMARY KEY (message_id, user_id, option)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        close_database(self.conn)
+
+    def add_poll(self, message_id: int, guild_id: int, channel_id: int, creator_id: int,
+                 question: str, options: list, single_choice: bool, close_at: float = None, buttons: bool = False):
+        """Register a new poll."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO polls (message_id, guild_id, channel_id, creator_id, question, options, "
+                "single_choice, created_at, close_at, buttons) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (message_id, guild_id, channel_id, creator_id, question, json.dumps(options),
+                 int(single_choice), time.time(), close_at, int(buttons))
+            )
+
+    def get_poll(self, message_id: int) -> dict:
+        """Load a poll and its votes, or None if it is not registered."""
+        row = self.conn.execute("SELECT * FROM polls WHERE message_id = ?", (message_id,)).fetchone()
+        if row is None:
+            return None
+        options = json.loads(row['options'])
+        tally = PollTally(len(options), bool(row['single_choice']))
+        self.load_votes(message_id, tally)
+        return {
+            'question': row['question'],
+            'options': options,
+            'creator': row['creator_id'],
+            'channel': row['channel_id'],
+            'guild': row['guild_id'],
+            'close_at': row['close_at'],
+            'closed': bool(row['closed']),
+            'buttons': bool(row['buttons']),
+            'tally': tally
+        }
+
+    def open_poll_ids(self) -> set:
+        """Message ids of polls still accepting votes."""
+        return {row[0] for row in self.conn.execute("SELECT message_id FROM polls WHERE closed = 0")}
+
+    def scheduled_closes(self) -> list:
+        """(message_id, guild_id, close_at) for open polls with a close time."""
+        return self.conn.execute(
+            "SELECT message_id, guild_id, close_at FROM polls WHERE closed = 0 AND close_at IS NOT NULL ORDER BY close_at"
+        ).fetchall()
+
+    def mark_closed(self, message_id: int):
+        """Stop a poll from accepting votes."""
+        with self.conn:
+            self.conn.execute("UPDATE polls SET closed = 1 WHERE message_id = ?", (message_id,))
+
+    def polls_for_guild(self, guild_id: int, limit: int) -> list:
+        """A guild's most recent polls, open polls first."""
+        return self.conn.execute(
+            "SELECT message_id, channel_id, question, close_at, closed FROM polls "
+            "WHERE guild_id = ? ORDER BY closed, created_at DESC LIMIT ?",
+            (guild_id, limit)
+        ).fetchall()
+
+    def flush(self, message_id: int, tally: PollTally):
+        """Write the votes of every user whose choices changed since the last flush."""
+        if not tally.dirty:
+            return
+        users = list(tally.dirty)
+        tally.dirty.clear()
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM poll_votes WHERE message_id = ? AND user_id = ?",
+                [(message_id, user_id) for user_id in users]
+            )
+            self.conn.executemany(
+                "INSERT INTO poll_votes (message_id, user_id, option) VALUES (?, ?, ?)",
+                [
+                    (message_id, user_id, option)
+                    for user_id in users
+                    for option in tally.voters.get(user_id, ())
+                ]
+            )
+
+    def load_votes(self, message_id: int, tally: PollTally):
+        """Fill a tally with the votes stored for a poll."""
+        rows = self.conn.execute(
+            "SELECT user_id, option FROM poll_votes WHERE message_id = ?", (message_id,)
+        ).fetchall()
+        for row in rows:
+            tally.load_vote(row['user_id'], row['option'])
@@ -0,0 +1,145 @@
+"""
+Purge Engine - Streams channel history and deletes matching messages in bulk where Discord allows
+"""
+
+import asyncio
+import logging
+import re
+import time
+from datetime import timedelta
+import discord
+from spam_filter import INVITE_PATTERN
+
+logger = logging.getLogger(__name__)
+
+LINK_PATTERN = re.compile(r"https?://\S+", re.IGNORECASE)
+
+# Discord only bulk-deletes messages younger than 14 days; keep a margin for clock skew
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+BULK_DELETE_MAX_MESSAGES = 100
+
+
+def compile_purge_filter(user=None, bots_only: bool = False, contains: str = None, pattern=None,
+                         has_links: bool = False, has_attachments: bool = False, has_invites: bool = False):
+    """Combine purge filters into one predicate; a message must pass every filter given.
+
+    Cheap attribute checks run before text scans, and the text checks are
+    grouped into a single content check with precompiled patterns.
+    """
+    checks = []
+    if user is not None:
+        user_id = user.id
+        checks.append(lambda message: message.author.id == user_id)
+    if bots_only:
+        checks.append(lambda message: message.author.bot)
+    if has_attachments:
+        checks.append(lambda message: bool(message.attachments))
+
+    text_patterns = []
+    if has_links:
+        text_patterns.append(LINK_PATTERN)
+    if has_invites:
+        text_patterns.append(INVITE_PATTERN)
+    if pattern is not None:
+        text_patterns.append(pattern)
+    needle = contains.casefold() if contains else None
+
+    if needle or text_patterns:
+        def text_check(message):
+            content = message.content
+            if needle and needle not in content.casefold():
+                return False
+            return all(p.search(content) for p in text_patterns)
+        checks.append(text_check)
+
+    if not checks:
+        return lambda message: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda message: all(check(message) for check in checks)
+
+
+async def purge_channel(channel, amount: int, check, before=None, after=None, max_scan: int = None,
+                        on_progress=None, progress_interval: float = 3.0) -> dict:
+    """Delete up to ``amount`` messages matching ``check``, newest first.
+
+    History is streamed page by page until enough matches are found or
+    ``max_scan`` messages have been read. Recent matches are bulk-deleted
+    100 at a time; older ones go to a single-delete queue that runs
+    alongside the scan. ``on_progress`` is awaited with the running stats
+    at most every ``progress_interval`` seconds.
+    """
+    stats = {'scanned': 0, 'matched': 0, 'bulk_deleted': 0, 'single_deleted': 0, 'failed': 0}
+    cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+    old_messages = asyncio.Queue()
+    batch = []
+
+    async def single_deleter():
+        while True:
+            message = await old_messages.get()
+            if message is None:
+                return
+            try:
+                await message.delete()
+                stats['single_deleted'] += 1
+            except discord.NotFound:
+                pass  # Already gone
+            except discord.HTTPException as e:
+                stats['failed'] += 1
+                logger.info(f"Failed to delete message {message.id}: {e}")
+
+    async def flush_batch():
+        if not batch:
+            return
+        try:
+            if len(batch) == 1:
+                await batch[0].delete()
+            else:
+                await channel.delete_messages(batch)
+            stats['bulk_deleted'] += len(batch)
+        except discord.Forbidden:
+            raise
+        except discord.NotFound:
+            pass  # Already gone
+        except discord.HTTPException as e:
+            logger.info(f"Bulk delete of {len(batch)} messages failed, retrying one by one: {e}")
+            for message in batch:
+                old_messages.put_nowait(message)
+        batch.clear()
+
+    deleter = asyncio.create_task(single_deleter())
+    last_report = time.monotonic()
+    try:
+        async for message in channel.history(limit=max_scan, before=before, after=after, oldest_first=False):
+            stats['scanned'] += 1
+            if not check(message):
+                continue
+
+            stats['matched'] += 1
+            if message.created_at > cutoff:
+                batch.append(message)
+                if len(batch) >= BULK_DELETE_MAX_MESSAGES:
+                    await flush_batch()
+            else:
+                old_messages.put_nowait(message)
+
+            if stats['matched'] >= amount:
+                break
+
+            if on_progress and time.monotonic() - last_report >= progress_interval:
+                last_report = time.monotonic()
+                await on_progress(stats)
+
+        await flush_batch()
+    finally:
+        old_messages.put_nowait(None)
+        if on_progress:
+            # Keep reporting while the slow single-delete queue drains
+            while not deleter.done():
+                await asyncio.wait([deleter], timeout=progress_interval)
+                if not deleter.done():
+                    await on_progress(stats)
+        else:
+            await deleter
+
+    return stats
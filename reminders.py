@@ -0,0 +1,140 @@
+"""
+Reminder Store - Durable SQLite storage for pending reminders
+"""
+
+import time
+from collections import defaultdict
+from database import close_database, open_database
+
+# Discord limits a single reminder batch message has to fit in
+MAX_MENTIONS_PER_MESSAGE = 25
+MAX_DESCRIPTION_LENGTH = 4096
+MAX_LINE_LENGTH = 300
+
+
+class ReminderStore:
+    """Pending reminders kept in SQLite so they survive restarts."""
+
+    def __init__(self, path: str):
+        self.conn = open_database(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS reminders (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                guild_id INTEGER,
+                channel_id INTEGER NOT NULL,
+                message TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                due_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders (due_at)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_user ON reminders (user_id, due_at)")
+        self.conn.commit()
+
+    def close(self):
+        close_database(self.conn)
+
+    def add(self, user_id: int, guild_id: int, channel_id: int, message: str, due_at: float) -> int:
+        """Store a reminder and return its id."""
+        cursor = self.conn.execute(
+            "INSERT INTO reminders (user_id, guild_id, channel_id, message, created_at, due_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (user_id, guild_id, channel_id, message, time.time(), due_at)
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def get(self, reminder_id: int):
+        """Return a reminder row, or None."""
+        return self.conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,)).fetchone()
+
+    def get_many(self, reminder_ids: list) -> list:
+        """Return the rows for every id that still exists, soonest first."""
+        if not reminder_ids:
+            return []
+        placeholders = ", ".join("?" * len(reminder_ids))
+        return self.conn.execute(
+            f"SELECT * FROM reminders WHERE id IN ({placeholders}) ORDER BY due_at, id",
+            list(reminder_ids)
+        ).fetchall()
+
+    def delete_many(self, reminder_ids: list):
+        """Remove several reminders in one transaction."""
+        self.conn.executemany("DELETE FROM reminders WHERE id = ?", [(reminder_id,) for reminder_id in reminder_ids])
+        self.conn.commit()
+
+    def delete(self, reminder_id: int, user_id: int = None) -> bool:
+        """Remove a reminder, optionally only if it belongs to ``user_id``; returns whether it existed."""
+        if user_id is None:
+            cursor = self.conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+        else:
+            cursor = self.conn.execute("DELETE FROM reminders WHERE id = ? AND user_id = ?", (reminder_id, user_id))
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def reschedule(self, reminder_id: int, user_id: int, due_at: float) -> bool:
+        """Move a user's reminder to a new due time; returns whether it existed."""
+        cursor = self.conn.execute(
+            "UPDATE reminders SET due_at = ? WHERE id = ? AND user_id = ?",
+            (due_at, reminder_id, user_id)
+        )
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def for_user(self, user_id: int, limit: int, offset: int = 0) -> list:
+        """One page of a user's reminders, soonest first."""
+        return self.conn.execute(
+            "SELECT * FROM reminders WHERE user_id = ? ORDER BY due_at LIMIT ? OFFSET ?",
+            (user_id, limit, offset)
+        ).fetchall()
+
+    def count_for_user(self, user_id: int) -> int:
+        """Number of reminders a user has pending."""
+        return self.conn.execute("SELECT COUNT(*) FROM reminders WHERE user_id = ?", (user_id,)).fetchone()[0]
+
+    def pending(self) -> list:
+        """Every stored reminder as (id, guild_id, due_at), soonest first."""
+        return self.conn.execute("SELECT id, guild_id, due_at FROM reminders ORDER BY due_at").fetchall()
+
+
+def format_reminder_line(reminder) -> str:
+    """One line of a batched reminder message."""
+    text = reminder['message']
+    if len(text) > MAX_LINE_LENGTH:
+        text = text[:MAX_LINE_LENGTH - 3] + "..."
+    return f"<@{reminder['user_id']}>: {text}"
+
+
+def batch_by_channel(reminders: list) -> dict:
+    """Group due reminders by channel and split each group into message-sized chunks.
+
+    Every chunk stays under Discord's mention and embed description limits,
+    so it can be delivered as a single message; the content holds only the
+    mentions, which the mention cap keeps well under 2000 characters.
+    """
+    by_channel = defaultdict(list)
+    for reminder in reminders:
+        by_channel[reminder['channel_id']].append(reminder)
+
+    batches = {}
+    for channel_id, channel_reminders in by_channel.items():
+        chunks = []
+        chunk, users, length = [], set(), 0
+        for reminder in channel_reminders:
+            line_length = len(format_reminder_line(reminder)) + 1
+            new_user = reminder['user_id'] not in users
+            if chunk and (
+                length + line_length > MAX_DESCRIPTION_LENGTH
+                or (new_user and len(users) >= MAX_MENTIONS_PER_MESSAGE)
+            ):
+                chunks.append(chunk)
+                chunk, users, length = [], set(), 0
+            chunk.append(reminder)
+            users.add(reminder['user_id'])
+            length += line_length
+        if chunk:
+            chunks.append(chunk)
+        batches[channel_id] = chunks
+    return batches
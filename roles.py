@@ -290,4 +290,5 @@ class RolesCog(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
 async def setup(bot):
+    bot.mark_setup_started(__name__)
     await bot.add_cog(RolesCog(bot))
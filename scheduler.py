@@ -0,0 +1,95 @@
+"""
+Timer Queue - One min-heap timer loop for scheduled bot work (reminders, poll closes, ...)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Never sleep longer than this, so wall-clock jumps are noticed reasonably soon
+MAX_SLEEP = 300
+
+
+class TimerQueue:
+    """Min-heap of (due time, key) served by a single task that sleeps until the next due item.
+
+    ``callback`` is awaited with the list of keys that fell due together.
+    With a ``coalesce_window``, the loop waits that many seconds after the
+    first item falls due so items due shortly after it share one callback.
+    Due times are Unix timestamps so they can be persisted and reloaded.
+    """
+
+    def __init__(self, callback, name: str = "timer", coalesce_window: float = 0):
+        self.callback = callback
+        self.name = name
+        self.coalesce_window = coalesce_window
+        self._heap = []
+        self._due = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def __len__(self):
+        return len(self._due)
+
+    def __contains__(self, key):
+        return key in self._due
+
+    def schedule(self, key, due_at: float):
+        """Schedule (or reschedule) ``key`` to fire at ``due_at``."""
+        self._due[key] = due_at
+        heapq.heappush(self._heap, (due_at, next(self._counter), key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()
+
+    def cancel(self, key) -> bool:
+        """Unschedule ``key``; its heap entry is discarded lazily when it surfaces."""
+        return self._due.pop(key, None) is not None
+
+    def start(self):
+        """Start the timer loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"{self.name}-timer")
+
+    async def stop(self):
+        """Stop the timer loop; scheduled keys are kept."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _pop_due(self, now: float) -> list:
+        keys = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, _, key = heapq.heappop(self._heap)
+            # Skip entries that were cancelled or superseded by a reschedule
+            if self._due.get(key) == due_at:
+                del self._due[key]
+                keys.append(key)
+        return keys
+
+    async def _run(self):
+        while True:
+            if self.coalesce_window and self._heap and self._heap[0][0] <= time.time():
+                await asyncio.sleep(self.coalesce_window)
+            keys = self._pop_due(time.time())
+            if keys:
+                try:
+                    await self.callback(keys)
+                except Exception as e:
+                    logger.error(f"{self.name} timer callback failed: {e}")
+                continue
+
+            self._wakeup.clear()
+            timeout = min(self._heap[0][0] - time.time(), MAX_SLEEP) if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -58,4 +58,5 @@ class ServerInfo(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
 async def setup(bot):
+    bot.mark_setup_started(__name__)
     await bot.add_cog(ServerInfo(bot))
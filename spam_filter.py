@@ -0,0 +1,114 @@
+"""
+Spam Filter - Per-user message scoring and strike escalation behind the automod cog
+"""
+
+import re
+from collections import OrderedDict, deque
+
+INVITE_PATTERN = re.compile(r"(?:discord(?:app)?\.com/invite|discord\.gg)/[\w-]+", re.IGNORECASE)
+
+
+class UserActivity:
+    """Fixed-size per-user state; nothing is allocated per message once a user is tracked."""
+
+    __slots__ = ('times', 'last_hash', 'repeats', 'last_at', 'mentions', 'mention_start',
+                 'strikes', 'strike_at', 'timeouts', 'timed_out_until')
+
+    def __init__(self, rate_limit: int):
+        self.times = deque(maxlen=rate_limit)
+        self.last_hash = None
+        self.repeats = 0
+        self.last_at = 0.0
+        self.mentions = 0
+        self.mention_start = 0.0
+        self.strikes = 0
+        self.strike_at = 0.0
+        self.timeouts = 0
+        self.timed_out_until = 0.0
+
+
+class SpamFilter:
+    """Scores each message against the sender's recent activity in O(1).
+
+    Tracked users live in an LRU capped at ``AUTOMOD_MAX_TRACKED_USERS``; the
+    least recently active are evicted first, so memory stays flat however many
+    people talk.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.users = OrderedDict()
+
+    def activity(self, key: tuple) -> UserActivity:
+        users = self.users
+        state = users.get(key)
+        if state is None:
+            state = users[key] = UserActivity(self.config.AUTOMOD_RATE_LIMIT)
+            if len(users) > self.config.AUTOMOD_MAX_TRACKED_USERS:
+                users.popitem(last=False)
+        else:
+            users.move_to_end(key)
+        return state
+
+    def check(self, message, now: float):
+        """Return (state, violation) where violation is None for a clean message."""
+        config = self.config
+        state = self.activity((message.guild.id, message.author.id))
+
+        times = state.times
+        times.append(now)
+        flooding = len(times) == times.maxlen and now - times[0] < config.AUTOMOD_RATE_WINDOW
+
+        # str caches its hash, so duplicate detection costs no extra allocation
+        content = message.content
+        content_hash = hash(content) if content else None
+        if content_hash is not None and content_hash == state.last_hash and now - state.last_at < config.AUTOMOD_DUPLICATE_WINDOW:
+            state.repeats += 1
+        else:
+            state.repeats = 1
+            state.last_hash = content_hash
+        state.last_at = now
+
+        if now - state.mention_start > config.AUTOMOD_MENTION_WINDOW:
+            state.mentions = 0
+            state.mention_start = now
+        mentions = len(message.raw_mentions) + len(message.raw_role_mentions)
+        state.mentions += mentions
+
+        # Only a message that mentions someone can push the window over the limit
+        if mentions and state.mentions >= config.AUTOMOD_MENTION_LIMIT:
+            return state, "mention spam"
+        if content and INVITE_PATTERN.search(content):
+            return state, "invite link"
+        if state.repeats >= config.AUTOMOD_DUPLICATE_LIMIT:
+            return state, "repeated messages"
+        if flooding:
+            return state, "message flood"
+        return state, None
+
+    def strike(self, state: UserActivity, now: float) -> int:
+        """Add a strike, forgetting old ones first; returns the timeout minutes due, or 0.
+
+        Violations while a timeout is active or being applied add no strikes,
+        so the rest of a burst cannot escalate the timeout it already earned.
+        """
+        config = self.config
+        if now < state.timed_out_until:
+            return 0
+        if now - state.strike_at > config.AUTOMOD_STRIKE_RESET:
+            state.strikes = 0
+        state.strikes += 1
+        state.strike_at = now
+        if state.strikes < config.AUTOMOD_STRIKES_BEFORE_TIMEOUT:
+            return 0
+        steps = config.AUTOMOD_TIMEOUT_STEPS
+        minutes = steps[min(state.timeouts, len(steps) - 1)]
+        state.strikes = 0
+        state.timeouts += 1
+        state.timed_out_until = now + minutes * 60
+        return minutes
+
+    def timeout_failed(self, state: UserActivity):
+        """Undo the escalation from the last strike after the timeout could not be applied."""
+        state.timed_out_until = 0.0
+        state.timeouts = max(0, state.timeouts - 1)
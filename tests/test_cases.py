@@ -0,0 +1,43 @@
+from cases import CaseStore
+
+
+def test_case_numbers_are_per_guild(tmp_path):
+    store = CaseStore(str(tmp_path / "bot.db"))
+    assert store.add_case(1, 'warn', 100, 9) == 1
+    assert store.add_cases(1, 'ban', [101, 102], 9) == [2, 3]
+    assert store.add_case(2, 'kick', 100, 9) == 1
+    assert store.get_case(1, 3)['target_id'] == 102
+    assert store.get_case(2, 2) is None
+    store.close()
+
+
+def test_moderator_counts_track_every_insert(tmp_path):
+    store = CaseStore(str(tmp_path / "bot.db"))
+    store.add_cases(1, 'ban', [101, 102, 103], 9)
+    store.add_case(1, 'warn', 101, 9)
+    store.add_case(1, 'warn', 101, 8)
+    store.add_case(2, 'warn', 101, 8)
+    assert store.action_totals(1) == {'ban': 3, 'warn': 2}
+    assert [tuple(row) for row in store.top_moderators(1, 5)] == [(9, 4), (8, 1)]
+    counts = store.conn.execute(
+        "SELECT action, count FROM mod_case_counts WHERE guild_id = 1 AND moderator_id = 9 ORDER BY action"
+    ).fetchall()
+    assert [tuple(row) for row in counts] == [('ban', 3), ('warn', 1)]
+    store.close()
+
+
+def test_history_is_per_target(tmp_path):
+    store = CaseStore(str(tmp_path / "bot.db"))
+    store.add_case(1, 'warn', 101, 9)
+    store.add_case(1, 'timeout', 101, 9, duration=10)
+    store.add_case(1, 'warn', 102, 9)
+    assert store.history_counts(1, 101) == {'warn': 1, 'timeout': 1}
+    assert len(store.history(1, 101, limit=10)) == 2
+    store.close()
+
+
+def test_empty_batch_records_nothing(tmp_path):
+    store = CaseStore(str(tmp_path / "bot.db"))
+    assert store.add_cases(1, 'ban', [], 9) == []
+    assert store.action_totals(1) == {}
+    store.close()
@@ -0,0 +1,21 @@
+import pytest
+
+from config import check_shard_settings, parse_shard_ids
+
+
+def test_parse_shard_ids():
+    assert parse_shard_ids("") is None
+    assert parse_shard_ids("0-3,8") == [0, 1, 2, 3, 8]
+    assert parse_shard_ids("5, 4,4") == [4, 5]
+
+
+def test_shard_ids_need_a_shard_count():
+    check_shard_settings(None, None)
+    check_shard_settings([0, 1], 2)
+    with pytest.raises(ValueError, match="SHARD_COUNT"):
+        check_shard_settings([0, 1], None)
+
+
+def test_shard_ids_must_fit_the_shard_count():
+    with pytest.raises(ValueError, match=r"\[4\]"):
+        check_shard_settings([3, 4], 4)
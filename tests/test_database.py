@@ -0,0 +1,22 @@
+from database import close_database, open_database
+from polls import PollStore
+from reminders import ReminderStore
+
+
+def test_stores_on_one_file_share_a_connection(tmp_path):
+    path = str(tmp_path / "bot.db")
+    reminders = ReminderStore(path)
+    polls = PollStore(path)
+    assert reminders.conn is polls.conn
+
+    reminders.close()
+    # Still open for the other store
+    polls.add_poll(1, 2, 3, 4, "Question?", ["a", "b"], False)
+    assert polls.get_poll(1)['question'] == "Question?"
+    polls.close()
+
+    # Everyone released it, so the next store gets a fresh connection
+    conn = open_database(path)
+    assert conn is not reminders.conn
+    assert conn.execute("SELECT COUNT(*) FROM polls").fetchone()[0] == 1
+    close_database(conn)
@@ -0,0 +1,43 @@
+from fixture_search import FixtureIndex
+
+
+def fixture(fixture_id, home, away):
+    return {'fixture': {'id': fixture_id}, 'teams': {'home': {'name': home}, 'away': {'name': away}}}
+
+
+INDEX = FixtureIndex([
+    fixture(1, "Manchester City", "Arsenal"),
+    fixture(2, "Real Sociedad", "Atlético Madrid"),
+    fixture(3, "Manchester United", "Chelsea"),
+    fixture(4, "Real Madrid", "Sevilla"),
+])
+
+
+def ids(fixtures):
+    return [f['fixture']['id'] for f in fixtures]
+
+
+def test_find_team_requires_every_term_in_one_team_name():
+    assert ids(INDEX.find_team("Manchester United")) == [3]
+    assert ids(INDEX.find_team("Real Madrid")) == [4]
+
+
+def test_find_team_matches_prefixes_and_accents():
+    assert ids(INDEX.find_team("man utd")) == []
+    assert ids(INDEX.find_team("man united")) == [3]
+    assert ids(INDEX.find_team("atletico")) == [2]
+
+
+def test_find_team_returns_nothing_for_partial_hits():
+    assert INDEX.find_team("Manchester Rovers") == []
+    assert INDEX.find_team("vs") == []
+
+
+def test_search_still_ranks_partial_matches():
+    assert ids(INDEX.search("Manchester United"))[0] == 3
+
+
+def test_search_ranks_a_whole_team_name_above_scattered_terms():
+    assert ids(INDEX.search("Real Madrid"))[:2] == [4, 2]
+    assert ids(INDEX.search("Real Madrid vs Barcelona"))[0] == 4
+    assert ids(INDEX.search("Manchester City vs Arsenal"))[0] == 1
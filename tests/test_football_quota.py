@@ -0,0 +1,161 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from football_quota import QuotaExhaustedError, QuotaGovernor, next_utc_midnight
+
+NOON = datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+class FakeClock:
+    """Monotonic and wall clocks that only move when told to, or when something sleeps."""
+
+    def __init__(self):
+        self.monotonic = 1000.0
+        self.wall = NOON
+        self.sleeps = []
+
+    def advance(self, seconds):
+        self.monotonic += seconds
+        self.wall += seconds
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.advance(seconds)
+
+
+def make_governor(clock, per_minute=60, daily_reserve=5, max_wait=10, probe_interval=300):
+    return QuotaGovernor(
+        per_minute, daily_reserve, max_wait, probe_interval=probe_interval,
+        clock=lambda: clock.monotonic, wall_clock=lambda: clock.wall, sleep=clock.sleep
+    )
+
+
+def acquire(governor):
+    asyncio.run(governor.acquire())
+
+
+def test_bucket_allows_burst_then_waits_for_refill():
+    clock = FakeClock()
+    governor = make_governor(clock, per_minute=60)
+    for _ in range(60):
+        acquire(governor)
+    assert clock.sleeps == []
+
+    acquire(governor)
+    assert clock.sleeps == [pytest.approx(1.0)]
+    assert governor.requests_made == 61
+
+
+def test_waiting_callers_queue_behind_reserved_slots():
+    clock = FakeClock()
+    governor = make_governor(clock, per_minute=60, max_wait=10)
+    governor.tokens = 0
+
+    async def burst():
+        # Sleeps are recorded without advancing so every caller sees the same instant
+        waits = []
+
+        async def record(seconds):
+            waits.append(seconds)
+        governor.sleep = record
+        await asyncio.gather(*(governor.acquire() for _ in range(3)))
+        return waits
+
+    assert asyncio.run(burst()) == [pytest.approx(1.0), pytest.approx(2.0), pytest.approx(3.0)]
+
+
+def test_wait_beyond_max_wait_is_refused():
+    clock = FakeClock()
+    governor = make_governor(clock, per_minute=6, max_wait=5)
+    governor.tokens = 0
+    with pytest.raises(QuotaExhaustedError):
+        acquire(governor)
+    assert governor.requests_throttled == 1
+    assert governor.requests_made == 0
+
+
+def test_headers_clamp_tokens_and_set_limits():
+    clock = FakeClock()
+    governor = make_governor(clock)
+    governor.update({'X-RateLimit-Limit': '30', 'X-RateLimit-Remaining': '2',
+                     'x-ratelimit-requests-limit': '100', 'x-ratelimit-requests-remaining': '50'})
+    assert governor.per_minute == 30
+    assert governor.tokens == 2
+    assert governor.daily_limit == 100
+    assert governor.daily_remaining == 50
+    assert not governor.is_low
+
+
+def test_reserve_marks_quota_low():
+    clock = FakeClock()
+    governor = make_governor(clock, daily_reserve=5)
+    governor.update({'x-ratelimit-requests-remaining': '5'})
+    assert governor.is_low
+    # Low is not exhausted: requests still go out
+    acquire(governor)
+
+
+def test_daily_quota_resets_at_utc_midnight():
+    clock = FakeClock()
+    governor = make_governor(clock)
+    governor.exhaust(daily=True)
+    assert governor.daily_reset_at == next_utc_midnight(NOON)
+    with pytest.raises(QuotaExhaustedError):
+        acquire(governor)
+
+    clock.advance(12 * 3600)
+    assert not governor.is_low
+    assert governor.daily_remaining is None
+    acquire(governor)
+
+
+def test_reset_header_overrides_midnight():
+    clock = FakeClock()
+    governor = make_governor(clock)
+    governor.update({'x-ratelimit-requests-remaining': '0', 'x-ratelimit-requests-reset': '600'})
+    assert governor.daily_reset_at == NOON + 600
+    clock.advance(601)
+    assert not governor.is_exhausted
+
+
+def test_probe_lets_one_request_through_per_interval():
+    clock = FakeClock()
+    governor = make_governor(clock, probe_interval=300)
+    governor.exhaust(daily=True)
+    with pytest.raises(QuotaExhaustedError):
+        acquire(governor)
+
+    clock.advance(300)
+    acquire(governor)
+    with pytest.raises(QuotaExhaustedError):
+        acquire(governor)
+
+    # The probe's headers show the provider restored the budget early
+    governor.update({'x-ratelimit-requests-remaining': '90'})
+    acquire(governor)
+
+
+def test_checking_for_a_probe_does_not_claim_it():
+    clock = FakeClock()
+    governor = make_governor(clock, probe_interval=300)
+    governor.exhaust(daily=True)
+    clock.advance(300)
+    # A caller that checks but then answers from cache leaves the slot for a real request
+    assert governor.probe_due
+    assert governor.probe_due
+    acquire(governor)
+    assert not governor.probe_due
+    with pytest.raises(QuotaExhaustedError):
+        acquire(governor)
+
+
+def test_requests_while_low_use_up_the_probe_slot():
+    clock = FakeClock()
+    governor = make_governor(clock, daily_reserve=5, probe_interval=300)
+    governor.update({'x-ratelimit-requests-remaining': '3'})
+    acquire(governor)
+    assert not governor.probe_due
+    # Low but not spent: other requests still go out
+    acquire(governor)
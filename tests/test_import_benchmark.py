@@ -0,0 +1,12 @@
+from import_benchmark import measure
+
+
+def test_modules_loaded_at_startup_are_reported_as_already_loaded():
+    assert measure('os', runs=1) is None
+    assert measure('sys', runs=1) is None
+
+
+def test_measures_a_fresh_import():
+    result = measure('json', runs=1)
+    assert result['total_ms'] > 0
+    assert any(name == 'json.decoder' for name, _ in result['dependencies'])
@@ -0,0 +1,46 @@
+from polls import PollTally
+
+
+def test_multi_choice_votes_accumulate():
+    tally = PollTally(3)
+    assert tally.add(1, 0) == []
+    assert tally.add(1, 2) == []
+    assert tally.add(2, 0) == []
+    assert tally.counts == [2, 0, 1]
+    assert tally.total_votes == 3
+    assert tally.dirty == {1, 2}
+
+
+def test_single_choice_replaces_the_previous_vote():
+    tally = PollTally(3, single_choice=True)
+    tally.add(1, 0)
+    assert tally.add(1, 2) == [0]
+    assert tally.counts == [0, 0, 1]
+    assert tally.voters == {1: {2}}
+
+
+def test_repeated_vote_is_ignored():
+    tally = PollTally(2, single_choice=True)
+    tally.add(1, 1)
+    assert tally.add(1, 1) == []
+    assert tally.counts == [0, 1]
+
+
+def test_remove_only_withdraws_held_votes():
+    tally = PollTally(2)
+    tally.add(1, 0)
+    tally.remove(1, 1)
+    tally.remove(2, 0)
+    assert tally.counts == [1, 0]
+    tally.remove(1, 0)
+    assert tally.counts == [0, 0]
+    assert tally.voters == {}
+
+
+def test_load_vote_restores_without_marking_dirty():
+    tally = PollTally(2)
+    tally.load_vote(1, 0)
+    tally.load_vote(1, 0)
+    tally.load_vote(2, 5)  # Option no longer exists
+    assert tally.counts == [1, 0]
+    assert tally.dirty == set()
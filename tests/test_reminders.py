@@ -0,0 +1,41 @@
+from reminders import (
+    MAX_DESCRIPTION_LENGTH, MAX_LINE_LENGTH, MAX_MENTIONS_PER_MESSAGE, batch_by_channel, format_reminder_line
+)
+
+
+def reminder(reminder_id, user_id, channel_id=1, message="ping"):
+    return {'id': reminder_id, 'user_id': user_id, 'channel_id': channel_id, 'message': message}
+
+
+def test_reminders_are_grouped_by_channel():
+    batches = batch_by_channel([reminder(1, 10, channel_id=1), reminder(2, 11, channel_id=2), reminder(3, 12, channel_id=1)])
+    assert {channel: [[r['id'] for r in chunk] for chunk in chunks] for channel, chunks in batches.items()} == {
+        1: [[1, 3]],
+        2: [[2]]
+    }
+
+
+def test_chunks_split_at_the_mention_limit():
+    reminders = [reminder(i, user_id=i) for i in range(MAX_MENTIONS_PER_MESSAGE + 5)]
+    chunks = batch_by_channel(reminders)[1]
+    assert [len(chunk) for chunk in chunks] == [MAX_MENTIONS_PER_MESSAGE, 5]
+
+
+def test_repeat_users_do_not_count_against_the_mention_limit():
+    reminders = [reminder(i, user_id=i % 2) for i in range(MAX_MENTIONS_PER_MESSAGE + 5)]
+    assert len(batch_by_channel(reminders)[1]) == 1
+
+
+def test_chunks_split_before_the_description_limit():
+    long_text = "x" * 1000
+    reminders = [reminder(i, user_id=1, message=long_text) for i in range(30)]
+    chunks = batch_by_channel(reminders)[1]
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert len("\n".join(format_reminder_line(r) for r in chunk)) <= MAX_DESCRIPTION_LENGTH
+    assert sum(len(chunk) for chunk in chunks) == 30
+
+
+def test_long_messages_are_truncated_in_batch_lines():
+    line = format_reminder_line(reminder(1, 10, message="y" * 1000))
+    assert line == f"<@10>: {'y' * (MAX_LINE_LENGTH - 3)}..."
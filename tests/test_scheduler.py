@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from scheduler import TimerQueue
+
+
+def run_timer(schedule, duration, coalesce_window=0):
+    """Run a TimerQueue for ``duration`` seconds and return the key batches it delivered."""
+    batches = []
+
+    async def main():
+        async def callback(keys):
+            batches.append(keys)
+
+        timer = TimerQueue(callback, coalesce_window=coalesce_window)
+        timer.start()
+        schedule(timer, time.time())
+        await asyncio.sleep(duration)
+        await timer.stop()
+        return timer
+
+    timer = asyncio.run(main())
+    return batches, timer
+
+
+def test_keys_fire_in_due_order():
+    def schedule(timer, now):
+        timer.schedule('late', now + 0.06)
+        timer.schedule('early', now + 0.02)
+
+    batches, timer = run_timer(schedule, 0.15)
+    assert batches == [['early'], ['late']]
+    assert len(timer) == 0
+
+
+def test_cancelled_keys_never_fire():
+    def schedule(timer, now):
+        timer.schedule('kept', now + 0.02)
+        timer.schedule('cancelled', now + 0.02)
+        assert timer.cancel('cancelled')
+        assert not timer.cancel('missing')
+
+    batches, _ = run_timer(schedule, 0.1)
+    assert batches == [['kept']]
+
+
+def test_reschedule_replaces_the_earlier_due_time():
+    def schedule(timer, now):
+        timer.schedule('moved', now + 0.02)
+        timer.schedule('moved', now + 0.5)
+
+    batches, timer = run_timer(schedule, 0.1)
+    assert batches == []
+    assert 'moved' in timer
+
+
+def test_coalesce_window_groups_items_due_close_together():
+    def schedule(timer, now):
+        timer.schedule('a', now + 0.01)
+        timer.schedule('b', now + 0.03)
+        timer.schedule('c', now + 0.5)
+
+    batches, _ = run_timer(schedule, 0.15, coalesce_window=0.05)
+    assert batches == [['a', 'b']]
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+from config import BotConfig
+from spam_filter import SpamFilter
+
+
+def message(content="hello", mentions=0, author_id=1):
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=100),
+        author=SimpleNamespace(id=author_id),
+        content=content,
+        raw_mentions=list(range(mentions)),
+        raw_role_mentions=[]
+    )
+
+
+def test_clean_messages_pass():
+    spam_filter = SpamFilter(BotConfig())
+    for i in range(3):
+        _, violation = spam_filter.check(message(f"message {i}"), now=i * 10.0)
+        assert violation is None
+
+
+def test_message_flood():
+    config = BotConfig()
+    spam_filter = SpamFilter(config)
+    violations = [spam_filter.check(message(f"message {i}"), now=i * 0.1)[1] for i in range(config.AUTOMOD_RATE_LIMIT)]
+    assert violations[:-1] == [None] * (config.AUTOMOD_RATE_LIMIT - 1)
+    assert violations[-1] == "message flood"
+
+
+def test_repeated_messages():
+    config = BotConfig()
+    spam_filter = SpamFilter(config)
+    violations = [spam_filter.check(message("same"), now=i * 2.0)[1] for i in range(config.AUTOMOD_DUPLICATE_LIMIT)]
+    assert violations[-1] == "repeated messages"
+    assert None in violations[:-1]
+
+
+def test_invite_link():
+    _, violation = SpamFilter(BotConfig()).check(message("join discord.gg/abc123"), now=0.0)
+    assert violation == "invite link"
+
+
+def test_mention_spam_only_flags_messages_with_mentions():
+    config = BotConfig()
+    spam_filter = SpamFilter(config)
+    _, violation = spam_filter.check(message("@everyone", mentions=config.AUTOMOD_MENTION_LIMIT), now=0.0)
+    assert violation == "mention spam"
+    # Later messages in the same window without mentions are not mention spam
+    _, violation = spam_filter.check(message("sorry"), now=1.0)
+    assert violation is None
+    _, violation = spam_filter.check(message("again", mentions=1), now=2.0)
+    assert violation == "mention spam"
+
+
+def test_mentions_accumulate_within_window_and_reset_after():
+    config = BotConfig()
+    spam_filter = SpamFilter(config)
+    half = config.AUTOMOD_MENTION_LIMIT // 2
+    assert spam_filter.check(message("a", mentions=half), now=0.0)[1] is None
+    assert spam_filter.check(message("b", mentions=half), now=1.0)[1] == "mention spam"
+    later = config.AUTOMOD_MENTION_WINDOW + 5.0
+    assert spam_filter.check(message("c", mentions=half), now=later)[1] is None
+
+
+def test_strikes_escalate_timeouts():
+    config = BotConfig()
+    spam_filter = SpamFilter(config)
+    state = spam_filter.activity((100, 1))
+    now = 0.0
+    timeouts = []
+    for _ in range(len(config.AUTOMOD_TIMEOUT_STEPS) + 1):
+        minutes = 0
+        for _ in range(config.AUTOMOD_STRIKES_BEFORE_TIMEOUT):
+            minutes = spam_filter.strike(state, now)
+            now += 1
+        timeouts.append(minutes)
+        now += minutes * 60  # Wait the timeout out
+    assert timeouts == config.AUTOMOD_TIMEOUT_STEPS + config.AUTOMOD_TIMEOUT_STEPS[-1:]
+
+
+def test_burst_during_timeout_does_not_escalate():
+    config = BotConfig()
+    spam_filter = SpamFilter(config)
+    state = spam_filter.activity((100, 1))
+    minutes = [spam_filter.strike(state, now=i * 0.1) for i in range(14)]
+    assert [m for m in minutes if m] == config.AUTOMOD_TIMEOUT_STEPS[:1]
+
+
+def test_failed_timeout_is_retried_at_the_same_step():
+    config = BotConfig()
+    spam_filter = SpamFilter(config)
+    state = spam_filter.activity((100, 1))
+    for i in range(config.AUTOMOD_STRIKES_BEFORE_TIMEOUT):
+        minutes = spam_filter.strike(state, now=float(i))
+    assert minutes == config.AUTOMOD_TIMEOUT_STEPS[0]
+    spam_filter.timeout_failed(state)
+    for i in range(config.AUTOMOD_STRIKES_BEFORE_TIMEOUT):
+        minutes = spam_filter.strike(state, now=10.0 + i)
+    assert minutes == config.AUTOMOD_TIMEOUT_STEPS[0]
+
+
+def test_tracked_users_are_capped():
+    config = BotConfig()
+    config.AUTOMOD_MAX_TRACKED_USERS = 3
+    spam_filter = SpamFilter(config)
+    for author_id in range(5):
+        spam_filter.check(message(author_id=author_id), now=0.0)
+    assert list(spam_filter.users) == [(100, 2), (100, 3), (100, 4)]
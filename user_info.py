@@ -33,4 +33,5 @@ class UserInfo(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
 async def setup(bot):
+    bot.mark_setup_started(__name__)
     await bot.add_cog(UserInfo(bot))
@@ -3,13 +3,13 @@ Utilities Cog - Various utility commands like polls, reminders, weather, etc.
 """
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 import asyncio
-import aiohttp
-import json
-import requests
-from datetime import datetime, timedelta
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 # from utils.helpers import create_embed
 
 def create_embed(title=None, description=None, color=discord.Color.blue()):
@@ -21,6 +21,12 @@ def create_embed(title=None, description=None, color=discord.Color.blue()):
     return embed
 
 from config import BotConfig
+from football_api import FootballAPIError
+from polls import NUMBER_EMOJIS, PollStore, PollTally
+from reminders import ReminderStore, batch_by_channel, format_reminder_line
+from scheduler import TimerQueue
+
+logger = logging.getLogger(__name__)
 
 
 class MatchDetailsView(discord.ui.View):
@@ -261,17 +267,9 @@ class MatchActionsView(discord.ui.View):
             match = self.matches[self.current_match_index]
             fixture_id = match['fixture']['id']
             
-            # API endpoint for lineups
-            lineup_url = f"https://v3.football.api-sports.io/fixtures/lineups"
-            headers = {
-                'X-RapidAPI-Key': '2a1eb675326c4e4ec655221a750b1cfb',
-                'X-RapidAPI-Host': 'v3.football.api-sports.io'
-            }
-            params = {'fixture': fixture_id}
-            
-            response = requests.get(lineup_url, headers=headers, params=params)
-            
-            if response.status_code != 200:
+            try:
+                lineups = await interaction.client.football_api.lineups(fixture_id)
+            except FootballAPIError:
                 embed = create_embed(
                     title="❌ Lineup Information Unavailable",
                     description="Unable to fetch lineup data at this time.",
@@ -281,9 +279,6 @@ class MatchActionsView(discord.ui.View):
                 await interaction.followup.edit_message(interaction.message.id, embed=embed, view=back_view)
                 return
             
-            lineup_data = response.json()
-            lineups = lineup_data.get('response', [])
-            
             if not lineups or len(lineups) < 2:
                 embed = create_embed(
                     title="📋 Lineups Not Available",
@@ -383,21 +378,326 @@ class MatchActionsView(discord.ui.View):
             await interaction.followup.edit_message(interaction.message.id, embed=embed, view=back_view)
 
 
+class PollButtonsView(discord.ui.View):
+    """Persistent button-based poll voting; votes go straight into the poll tally."""
+    
+    def __init__(self, cog, options):
+        super().__init__(timeout=None)
+        self.cog = cog
+        
+        for i, option in enumerate(options):
+            button = discord.ui.Button(
+                label=option[:80] if option else None,
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"poll_vote:{i}",
+                emoji=NUMBER_EMOJIS[i]
+            )
+            button.callback = self.create_vote_callback(i)
+            self.add_item(button)
+    
+    def create_vote_callback(self, option):
+        """Create a callback function for a specific option button."""
+        async def vote_callback(interaction: discord.Interaction):
+            await self.cog.record_button_vote(interaction, option)
+        return vote_callback
+
+
 class UtilitiesCog(commands.Cog):
     """Cog containing utility commands."""
     
+    reminders_group = app_commands.Group(name="reminders", description="Manage your reminders")
+    
     def __init__(self, bot):
         self.bot = bot
         self.config = BotConfig()
-        self.active_polls = {}
-        self.reminders = {}
+        self.active_polls = OrderedDict()  # LRU of open polls, loaded lazily from the poll store
+        self.open_poll_ids = set()
+        self.background_tasks = set()  # Strong references so fire-and-forget tasks are not collected
+        self.poll_store = PollStore(os.path.join(self.config.DATA_DIR, self.config.DATABASE_FILE))
+        self.poll_timer = TimerQueue(self.close_polls, name="polls")
+        self.flush_poll_tallies.change_interval(seconds=self.config.POLL_FLUSH_INTERVAL)
+        self.reminders = ReminderStore(os.path.join(self.config.DATA_DIR, self.config.DATABASE_FILE))
+        self.reminder_timer = TimerQueue(
+            self.deliver_reminders,
+            name="reminders",
+            coalesce_window=self.config.REMINDER_BATCH_WINDOW
+        )
+    
+    async def cog_load(self):
+        # Reload reminders that were pending when the bot last stopped
+        for row in self.reminders.pending():
+            if self.bot.owns_guild(row['guild_id']):
+                self.reminder_timer.schedule(row['id'], row['due_at'])
+        self.reminder_timer.start()
+        
+        # Only poll ids and close times are read up front; polls load on first access
+        self.open_poll_ids = self.poll_store.open_poll_ids()
+        for row in self.poll_store.scheduled_closes():
+            if self.bot.owns_guild(row['guild_id']):
+                self.poll_timer.schedule(row['message_id'], row['close_at'])
+        self.poll_timer.start()
+        self.flush_poll_tallies.start()
+        
+        # One catch-all view routes button votes for every button poll, including ones from before a restart
+        self.bot.add_view(PollButtonsView(self, [None] * self.config.MAX_POLL_OPTIONS))
+    
+    async def cog_unload(self):
+        for task in self.background_tasks:
+            task.cancel()
+        await self.reminder_timer.stop()
+        self.reminders.close()
+        await self.poll_timer.stop()
+        self.flush_poll_tallies.cancel()
+        self.save_poll_tallies()
+        self.poll_store.close()
+    
+    def save_poll_tallies(self):
+        """Persist votes that changed since the last flush."""
+        for message_id, poll_info in self.active_polls.items():
+            self.poll_store.flush(message_id, poll_info['tally'])
+    
+    @tasks.loop(seconds=30)
+    async def flush_poll_tallies(self):
+        """Periodically persist in-memory poll tallies."""
+        self.save_poll_tallies()
+    
+    def get_poll(self, message_id: int):
+        """Return a poll's info, loading it from the poll store if it is not in memory yet."""
+        poll_info = self.active_polls.get(message_id)
+        if poll_info is not None:
+            self.active_polls.move_to_end(message_id)
+            return poll_info
+        poll_info = self.poll_store.get_poll(message_id)
+        # Closed polls no longer change, so reading their results does not cache them
+        if poll_info is not None and not poll_info['closed']:
+            self.cache_poll(message_id, poll_info)
+        return poll_info
+    
+    def cache_poll(self, message_id: int, poll_info: dict):
+        """Keep an open poll in memory, flushing and dropping the least recently used past the cache size."""
+        self.active_polls[message_id] = poll_info
+        while len(self.active_polls) > self.config.POLL_CACHE_SIZE:
+            evicted_id, evicted = self.active_polls.popitem(last=False)
+            self.poll_store.flush(evicted_id, evicted['tally'])
+    
+    async def close_polls(self, message_ids):
+        """Close polls whose time is up and post their final results."""
+        await self.bot.wait_until_ready()
+        for message_id in message_ids:
+            poll_info = self.get_poll(message_id)
+            if poll_info is None or poll_info['closed']:
+                continue
+            
+            poll_info['closed'] = True
+            self.open_poll_ids.discard(message_id)
+            self.poll_store.flush(message_id, poll_info['tally'])
+            self.poll_store.mark_closed(message_id)
+            
+            channel = self.bot.get_channel(poll_info['channel'])
+            if channel:
+                try:
+                    await channel.send(
+                        embed=self.build_poll_results_embed(poll_info, final=True),
+                        reference=discord.MessageReference(
+                            message_id=message_id,
+                            channel_id=poll_info['channel'],
+                            fail_if_not_exists=False
+                        )
+                    )
+                except discord.HTTPException as e:
+                    logger.warning(f"Failed to post final results for poll {message_id}: {e}")
+            
+            # Closed polls no longer need to stay in memory
+            self.active_polls.pop(message_id, None)
+    
+    def build_poll_results_embed(self, poll_info, final: bool = False) -> discord.Embed:
+        """Build the results embed for a poll from its tally."""
+        tally = poll_info['tally']
+        
+        embed = create_embed(
+            title="📊 Final Poll Results" if final else "📊 Poll Results",
+            description=f"**{poll_info['question']}**",
+            color=self.config.COLORS["success"]
+        )
+        
+        total_votes = tally.total_votes
+        results = list(zip(poll_info['options'], tally.counts))
+        
+        # Sort by vote count
+        results.sort(key=lambda x: x[1], reverse=True)
+        
+        if total_votes == 0:
+            embed.add_field(name="Results", value="No votes yet!", inline=False)
+        else:
+            results_text = ""
+            for i, (option, votes) in enumerate(results):
+                percentage = (votes / total_votes) * 100 if total_votes > 0 else 0
+                bar_length = int(percentage / 10)
+                bar = "█" * bar_length + "░" * (10 - bar_length)
+                results_text += f"**{option}**\n{bar} {votes} votes ({percentage:.1f}%)\n\n"
+            
+            embed.add_field(name="Results", value=results_text, inline=False)
+        
+        embed.add_field(name="Total Votes", value=str(total_votes), inline=True)
+        embed.add_field(name="Voters", value=str(len(tally.voters)), inline=True)
+        if poll_info['closed']:
+            embed.add_field(name="Status", value="Closed", inline=True)
+        elif poll_info.get('close_at'):
+            embed.add_field(name="Closes", value=f"<t:{int(poll_info['close_at'])}:R>", inline=True)
+        embed.set_footer(text=f"Poll created by {self.bot.get_user(poll_info['creator'])}")
+        return embed
+    
+    async def record_button_vote(self, interaction: discord.Interaction, option: int):
+        """Toggle a voter's choice from a poll button press."""
+        message_id = interaction.message.id
+        poll_info = self.get_poll(message_id) if message_id in self.open_poll_ids else None
+        if poll_info is None or option >= len(poll_info['options']):
+            await interaction.response.send_message("❌ This poll is closed.", ephemeral=True)
+            return
+        
+        tally = poll_info['tally']
+        choice = poll_info['options'][option]
+        if option in tally.voters.get(interaction.user.id, ()):
+            tally.remove(interaction.user.id, option)
+            await interaction.response.send_message(f"🗑️ Removed your vote for **{choice}**.", ephemeral=True)
+        else:
+            tally.add(interaction.user.id, option)
+            await interaction.response.send_message(f"✅ Voted for **{choice}**.", ephemeral=True)
+    
+    async def seed_poll_reactions(self, message: discord.Message, option_count: int):
+        """Add the number reactions to a reaction poll in the background."""
+        # The reaction route allows one request per ~250ms per message, so requests are
+        # issued in order and paced by discord.py's bucket rather than fired concurrently
+        for i in range(option_count):
+            try:
+                await message.add_reaction(NUMBER_EMOJIS[i])
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to seed reactions on poll {message.id}: {e}")
+                return
+    
+    def poll_vote_from_payload(self, payload: discord.RawReactionActionEvent):
+        """Map a raw reaction event to (poll info, option index), or None if it is not a poll vote."""
+        if payload.message_id not in self.open_poll_ids or payload.user_id == self.bot.user.id:
+            return None
+        poll_info = self.get_poll(payload.message_id)
+        if poll_info is None or poll_info['buttons']:
+            return None  # Button polls only count button votes
+        try:
+            option = NUMBER_EMOJIS.index(str(payload.emoji))
+        except ValueError:
+            return None
+        if option >= len(poll_info['options']):
+            return None
+        return poll_info, option
+    
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """Count a poll vote straight from the gateway event."""
+        vote = self.poll_vote_from_payload(payload)
+        if vote is None:
+            return
+        poll_info, option = vote
+        replaced = poll_info['tally'].add(payload.user_id, option)
+        
+        # Single-choice polls: take back the reaction for the user's previous choice
+        if replaced:
+            channel = self.bot.get_channel(payload.channel_id)
+            if channel:
+                message = channel.get_partial_message(payload.message_id)
+                for previous in replaced:
+                    try:
+                        await message.remove_reaction(NUMBER_EMOJIS[previous], discord.Object(id=payload.user_id))
+                    except discord.HTTPException:
+                        pass  # Missing Manage Messages; the tally is already correct
+    
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        """Withdraw a poll vote straight from the gateway event."""
+        vote = self.poll_vote_from_payload(payload)
+        if vote is None:
+            return
+        poll_info, option = vote
+        poll_info['tally'].remove(payload.user_id, option)
+    
+    async def deliver_reminders(self, reminder_ids):
+        """Send reminders that have fallen due, one message per channel batch."""
+        await self.bot.wait_until_ready()
+        due = []
+        now = datetime.now(timezone.utc).timestamp()
+        for reminder in self.reminders.get_many(reminder_ids):  # Cancelled reminders are simply missing
+            if reminder['due_at'] <= now:
+                due.append(reminder)
+            elif self.bot.owns_guild(reminder['guild_id']):
+                # Snoozed from another cluster process after this timer was set
+                self.reminder_timer.schedule(reminder['id'], reminder['due_at'])
+        
+        for channel_id, chunks in batch_by_channel(due).items():
+            # DM channels are not cached after a restart, so fetch what the cache is missing
+            channel = self.bot.get_channel(channel_id)
+            try:
+                if channel is None:
+                    channel = await self.bot.fetch_channel(channel_id)
+            except (discord.NotFound, discord.Forbidden) as e:
+                logger.warning(f"Dropping {sum(map(len, chunks))} reminders for unreachable channel {channel_id}: {e}")
+                self.reminders.delete_many([reminder['id'] for chunk in chunks for reminder in chunk])
+                continue
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to fetch channel {channel_id} for reminders, retrying later: {e}")
+                self.retry_reminders([reminder for chunk in chunks for reminder in chunk])
+                continue
+            
+            for chunk in chunks:
+                try:
+                    await channel.send(**self.build_reminder_message(chunk))
+                except (discord.NotFound, discord.Forbidden) as e:
+                    logger.warning(f"Dropping {len(chunk)} reminders that cannot be sent to channel {channel_id}: {e}")
+                except discord.HTTPException as e:
+                    logger.warning(f"Failed to deliver {len(chunk)} reminders to channel {channel_id}, retrying later: {e}")
+                    self.retry_reminders(chunk)
+                    continue
+                # Only delivered or undeliverable reminders are removed
+                self.reminders.delete_many([reminder['id'] for reminder in chunk])
+    
+    def retry_reminders(self, reminders):
+        """Schedule another delivery attempt for reminders that failed transiently."""
+        retry_at = datetime.now(timezone.utc).timestamp() + self.config.REMINDER_RETRY_DELAY
+        for reminder in reminders:
+            self.reminder_timer.schedule(reminder['id'], retry_at)
+    
+    def build_reminder_message(self, chunk) -> dict:
+        """Build send() arguments for a batch of reminders in one channel."""
+        mentions = " ".join(dict.fromkeys(f"<@{reminder['user_id']}>" for reminder in chunk))
+        allowed_mentions = discord.AllowedMentions(everyone=False, roles=False, users=True)
+        
+        if len(chunk) == 1:
+            reminder_embed = create_embed(
+                title="⏰ Reminder",
+                description=f"You asked me to remind you:",
+                color=self.config.COLORS["warning"]
+            )
+            reminder_embed.add_field(name="Message", value=chunk[0]['message'][:1024], inline=False)
+        else:
+            reminder_embed = create_embed(
+                title=f"⏰ {len(chunk)} Reminders",
+                description="\n".join(format_reminder_line(reminder) for reminder in chunk),
+                color=self.config.COLORS["warning"]
+            )
+        
+        return {'content': mentions, 'embed': reminder_embed, 'allowed_mentions': allowed_mentions}
     
     @app_commands.command(name="poll", description="Create a poll with multiple options")
     @app_commands.describe(
         question="The poll question",
-        options="Poll options separated by commas (max 10)"
+        options="Poll options separated by commas (max 10)",
+        single_choice="Only count each voter's latest choice",
+        duration="Close the poll and post results after this many minutes",
+        style="Vote with buttons (instant) or reactions"
     )
-    async def poll(self, interaction: discord.Interaction, question: str, options: str):
+    @app_commands.choices(style=[
+        app_commands.Choice(name="Buttons", value="buttons"),
+        app_commands.Choice(name="Reactions", value="reactions")
+    ])
+    async def poll(self, interaction: discord.Interaction, question: str, options: str, single_choice: bool = False, duration: int = None, style: str = "reactions"):
         """Create a poll with reactions."""
         option_list = [opt.strip() for opt in options.split(',') if opt.strip()]
         
@@ -409,8 +709,13 @@ class UtilitiesCog(commands.Cog):
             await interaction.response.send_message(f"❌ Maximum {self.config.MAX_POLL_OPTIONS} options allowed.", ephemeral=True)
             return
         
+        if duration is not None and (duration < 1 or duration > self.config.MAX_POLL_DURATION // 60):
+            await interaction.response.send_message(f"❌ Duration must be between 1 and {self.config.MAX_POLL_DURATION // 60} minutes.", ephemeral=True)
+            return
+        close_at = datetime.now(timezone.utc).timestamp() + duration * 60 if duration else None
+        
         # Emoji numbers for reactions
-        number_emojis = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
+        number_emojis = NUMBER_EMOJIS
         
         embed = create_embed(
             title="📊 Poll",
@@ -424,27 +729,59 @@ class UtilitiesCog(commands.Cog):
             options_text += f"{number_emojis[i]} {option}\n"
         
         embed.add_field(name="Options", value=options_text, inline=False)
-        embed.add_field(name="Instructions", value="React with the corresponding emoji to vote!", inline=False)
+        if style == "buttons":
+            instructions = "Click a button to vote, click it again to remove your vote!"
+        else:
+            instructions = "React with the corresponding emoji to vote!"
+        if single_choice:
+            instructions += "\nOnly your latest choice counts."
+        embed.add_field(name="Instructions", value=instructions, inline=False)
+        if close_at:
+            embed.add_field(name="Closes", value=f"<t:{int(close_at)}:R>", inline=False)
         
         embed.set_footer(
             text=f"Poll created by {interaction.user}",
             icon_url=interaction.user.display_avatar.url
         )
         
-        await interaction.response.send_message(embed=embed)
+        if style == "buttons":
+            await interaction.response.send_message(embed=embed, view=PollButtonsView(self, option_list))
+        else:
+            await interaction.response.send_message(embed=embed)
         message = await interaction.original_response()
         
-        # Add reactions
-        for i in range(len(option_list)):
-            await message.add_reaction(number_emojis[i])
-        
-        # Store poll info
-        self.active_polls[message.id] = {
+        # Store poll info before seeding reactions so early votes are counted
+        self.cache_poll(message.id, {
             'question': question,
             'options': option_list,
             'creator': interaction.user.id,
-            'channel': interaction.channel.id
-        }
+            'channel': interaction.channel.id,
+            'guild': interaction.guild.id if interaction.guild else None,
+            'close_at': close_at,
+            'closed': False,
+            'buttons': style == "buttons",
+            'tally': PollTally(len(option_list), single_choice)
+        })
+        self.poll_store.add_poll(
+            message.id,
+            interaction.guild.id if interaction.guild else None,
+            interaction.channel.id,
+            interaction.user.id,
+            question,
+            option_list,
+            single_choice,
+            close_at,
+            buttons=style == "buttons"
+        )
+        self.open_poll_ids.add(message.id)
+        if close_at:
+            self.poll_timer.schedule(message.id, close_at)
+        
+        # Add reactions without holding up the command
+        if style != "buttons":
+            task = asyncio.create_task(self.seed_poll_reactions(message, len(option_list)))
+            self.background_tasks.add(task)
+            task.add_done_callback(self.background_tasks.discard)
     
     @app_commands.command(name="pollresults", description="Get results of a poll")
     @app_commands.describe(message_id="The ID of the poll message")
@@ -456,53 +793,48 @@ class UtilitiesCog(commands.Cog):
             await interaction.response.send_message("❌ Invalid message ID.", ephemeral=True)
             return
         
-        if msg_id not in self.active_polls:
+        # Read without caching until the poll is known to belong here; other servers' polls stay hidden
+        poll_info = self.active_polls.get(msg_id) or self.poll_store.get_poll(msg_id)
+        guild_id = interaction.guild.id if interaction.guild else None
+        if poll_info is None or poll_info['guild'] != guild_id or (
+            guild_id is None and poll_info['channel'] != interaction.channel.id
+        ):
             await interaction.response.send_message("❌ Poll not found or not created by this bot.", ephemeral=True)
             return
         
-        try:
-            message = await interaction.channel.fetch_message(msg_id)
-        except discord.NotFound:
-            await interaction.response.send_message("❌ Poll message not found.", ephemeral=True)
+        # Results come from the live tally, no message fetch needed
+        await interaction.response.send_message(embed=self.build_poll_results_embed(poll_info))
+    
+    @app_commands.command(name="polls", description="List recent polls in this server")
+    async def polls_list(self, interaction: discord.Interaction):
+        """List this server's recent polls."""
+        if not interaction.guild:
+            await interaction.response.send_message("❌ This command must be used in a server.", ephemeral=True)
             return
         
-        poll_info = self.active_polls[msg_id]
-        number_emojis = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
+        rows = self.poll_store.polls_for_guild(interaction.guild.id, self.config.MAX_POLLS_LISTED)
         
         embed = create_embed(
-            title="📊 Poll Results",
-            description=f"**{poll_info['question']}**",
-            color=self.config.COLORS["success"]
+            title="📊 Server Polls",
+            color=self.config.COLORS["info"]
         )
-        
-        total_votes = 0
-        results = []
-        
-        for i, option in enumerate(poll_info['options']):
-            reaction = discord.utils.get(message.reactions, emoji=number_emojis[i])
-            votes = (reaction.count - 1) if reaction else 0  # Subtract bot's reaction
-            total_votes += votes
-            results.append((option, votes))
-        
-        # Sort by vote count
-        results.sort(key=lambda x: x[1], reverse=True)
-        
-        if total_votes == 0:
-            embed.add_field(name="Results", value="No votes yet!", inline=False)
+        if not rows:
+            embed.description = "No polls have been created in this server."
         else:
-            results_text = ""
-            for i, (option, votes) in enumerate(results):
-                percentage = (votes / total_votes) * 100 if total_votes > 0 else 0
-                bar_length = int(percentage / 10)
-                bar = "█" * bar_length + "░" * (10 - bar_length)
-                results_text += f"**{option}**\n{bar} {votes} votes ({percentage:.1f}%)\n\n"
-            
-            embed.add_field(name="Results", value=results_text, inline=False)
-        
-        embed.add_field(name="Total Votes", value=str(total_votes), inline=True)
-        embed.set_footer(text=f"Poll created by {self.bot.get_user(poll_info['creator'])}")
+            lines = []
+            for row in rows:
+                link = f"https://discord.com/channels/{interaction.guild.id}/{row['channel_id']}/{row['message_id']}"
+                if row['closed']:
+                    status = "Closed"
+                elif row['close_at']:
+                    status = f"Closes <t:{int(row['close_at'])}:R>"
+                else:
+                    status = "Open"
+                question = row['question'] if len(row['question']) <= 60 else row['question'][:57] + "..."
+                lines.append(f"[{question}]({link}) • `{row['message_id']}` • {status}")
+            embed.description = "\n".join(lines)
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @app_commands.command(name="remind", description="Set a reminder")
     @app_commands.describe(
@@ -515,7 +847,21 @@ class UtilitiesCog(commands.Cog):
             await interaction.response.send_message(f"❌ Time must be between 1 minute and {self.config.MAX_REMINDER_TIME // 60} minutes.", ephemeral=True)
             return
         
-        reminder_time = datetime.utcnow() + timedelta(minutes=time)
+        if self.reminders.count_for_user(interaction.user.id) >= self.config.MAX_REMINDERS_PER_USER:
+            await interaction.response.send_message(f"❌ You already have {self.config.MAX_REMINDERS_PER_USER} pending reminders.", ephemeral=True)
+            return
+        
+        reminder_time = datetime.now(timezone.utc) + timedelta(minutes=time)
+        
+        # Store reminder; the scheduler delivers it, so this handler returns immediately
+        reminder_id = self.reminders.add(
+            interaction.user.id,
+            interaction.guild.id if interaction.guild else None,
+            interaction.channel.id,
+            message,
+            reminder_time.timestamp()
+        )
+        self.reminder_timer.schedule(reminder_id, reminder_time.timestamp())
         
         embed = create_embed(
             title="⏰ Reminder Set",
@@ -524,38 +870,70 @@ class UtilitiesCog(commands.Cog):
         )
         embed.add_field(name="Message", value=message, inline=False)
         embed.add_field(name="Reminder Time", value=f"<t:{int(reminder_time.timestamp())}:F>", inline=False)
+        embed.set_footer(text=f"Reminder ID: {reminder_id} • Manage with /reminders")
         
         await interaction.response.send_message(embed=embed)
+    
+    @reminders_group.command(name="list", description="List your pending reminders")
+    @app_commands.describe(page="Page number")
+    async def reminders_list(self, interaction: discord.Interaction, page: int = 1):
+        """List the user's pending reminders, one page at a time."""
+        page_size = self.config.REMINDERS_PAGE_SIZE
+        total = self.reminders.count_for_user(interaction.user.id)
+        pages = max(1, -(-total // page_size))
+        page = min(max(page, 1), pages)
         
-        # Store reminder
-        reminder_id = f"{interaction.user.id}_{int(datetime.utcnow().timestamp())}"
-        self.reminders[reminder_id] = {
-            'user_id': interaction.user.id,
-            'channel_id': interaction.channel.id,
-            'message': message,
-            'time': reminder_time
-        }
+        embed = create_embed(
+            title="⏰ Your Reminders",
+            color=self.config.COLORS["info"]
+        )
         
-        # Wait and send reminder
-        await asyncio.sleep(time * 60)
+        rows = self.reminders.for_user(interaction.user.id, page_size, (page - 1) * page_size)
+        if not rows:
+            embed.description = "You have no pending reminders."
+        else:
+            lines = []
+            for row in rows:
+                preview = row['message'] if len(row['message']) <= 60 else row['message'][:57] + "..."
+                lines.append(f"`{row['id']}` • <t:{int(row['due_at'])}:R> • {preview}")
+            embed.description = "\n".join(lines)
         
-        if reminder_id in self.reminders:  # Check if reminder wasn't cancelled
-            reminder_embed = create_embed(
-                title="⏰ Reminder",
-                description=f"You asked me to remind you:",
-                color=self.config.COLORS["warning"]
-            )
-            reminder_embed.add_field(name="Message", value=message, inline=False)
-            
-            try:
-                user = self.bot.get_user(interaction.user.id)
-                channel = self.bot.get_channel(interaction.channel.id)
-                if channel:
-                    await channel.send(f"{user.mention}", embed=reminder_embed)
-            except:
-                pass  # Channel might be deleted or bot removed
-            
-            del self.reminders[reminder_id]
+        embed.set_footer(text=f"Page {page}/{pages} • {total} pending")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @reminders_group.command(name="cancel", description="Cancel one of your reminders")
+    @app_commands.describe(reminder_id="The reminder ID shown by /reminders list")
+    async def reminders_cancel(self, interaction: discord.Interaction, reminder_id: int):
+        """Cancel a pending reminder."""
+        if not self.reminders.delete(reminder_id, user_id=interaction.user.id):
+            await interaction.response.send_message("❌ Reminder not found.", ephemeral=True)
+            return
+        
+        self.reminder_timer.cancel(reminder_id)
+        await interaction.response.send_message(f"✅ Reminder `{reminder_id}` cancelled.", ephemeral=True)
+    
+    @reminders_group.command(name="snooze", description="Push one of your reminders back")
+    @app_commands.describe(
+        reminder_id="The reminder ID shown by /reminders list",
+        minutes="Minutes to push the reminder back by"
+    )
+    async def reminders_snooze(self, interaction: discord.Interaction, reminder_id: int, minutes: int):
+        """Snooze a pending reminder."""
+        if minutes < 1 or minutes > (self.config.MAX_REMINDER_TIME // 60):
+            await interaction.response.send_message(f"❌ Minutes must be between 1 and {self.config.MAX_REMINDER_TIME // 60}.", ephemeral=True)
+            return
+        
+        reminder = self.reminders.get(reminder_id)
+        if reminder is None or reminder['user_id'] != interaction.user.id:
+            await interaction.response.send_message("❌ Reminder not found.", ephemeral=True)
+            return
+        
+        due_at = max(reminder['due_at'], datetime.now(timezone.utc).timestamp()) + minutes * 60
+        self.reminders.reschedule(reminder_id, interaction.user.id, due_at)
+        if self.bot.owns_guild(reminder['guild_id']):
+            self.reminder_timer.schedule(reminder_id, due_at)
+        
+        await interaction.response.send_message(f"😴 Reminder `{reminder_id}` snoozed until <t:{int(due_at)}:F>.", ephemeral=True)
     
     @app_commands.command(name="weather", description="Get weather search links for a city")
     @app_commands.describe(city="The city to get weather links for")
@@ -666,20 +1044,16 @@ class UtilitiesCog(commands.Cog):
     @app_commands.describe(match="Search for a specific team or match (e.g. 'Arsenal', 'Real Madrid vs Barcelona')")
     async def football_scores(self, interaction: discord.Interaction, match: str = None):
         """Get live football scores using API-Football."""
+        if not self.bot.football_api.enabled:
+            await interaction.response.send_message("❌ Football scores are not configured on this bot.", ephemeral=True)
+            return
+        
         await interaction.response.defer()
         
         try:
-            # API-Football config
-            API_KEY = '2a1eb675326c4e4ec655221a750b1cfb'
-            API_URL = 'https://v3.football.api-sports.io/fixtures?live=all'
-            
-            headers = {
-                'x-apisports-key': API_KEY
-            }
-            
-            response = requests.get(API_URL, headers=headers)
-            
-            if response.status_code != 200:
+            try:
+                live_index = await self.bot.football_api.live_index()
+            except FootballAPIError:
                 embed = create_embed(
                     title="❌ Could not fetch live scores",
                     description="Unable to connect to the football API.",
@@ -688,29 +1062,9 @@ class UtilitiesCog(commands.Cog):
                 await interaction.followup.send(embed=embed)
                 return
 
-            data = response.json()
-            all_matches = data.get('response', [])
-
             # Filter matches if specific match search is provided
             if match:
-                filtered_matches = []
-                search_terms = match.lower().split()
-                
-                for game in all_matches:
-                    home_team = game['teams']['home']['name'].lower()
-                    away_team = game['teams']['away']['name'].lower()
-                    
-                    # Check if any search term matches either team
-                    match_found = False
-                    for term in search_terms:
-                        if term in home_team or term in away_team:
-                            match_found = True
-                            break
-                    
-                    if match_found:
-                        filtered_matches.append(game)
-                
-                matches = filtered_matches
+                matches = live_index.search(match)
                 if not matches:
                     embed = create_embed(
                         title=f"⚽ No matches found for '{match}'",
@@ -728,7 +1082,7 @@ class UtilitiesCog(commands.Cog):
                     await interaction.followup.send(embed=embed)
                     return
             else:
-                matches = all_matches
+                matches = live_index.fixtures
 
             if not matches:
                 embed = create_embed(
@@ -802,6 +1156,33 @@ class UtilitiesCog(commands.Cog):
             )
             await interaction.followup.send(embed=embed)
     
+    @app_commands.command(name="apiquota", description="Show remaining football API quota (bot owner only)")
+    async def api_quota(self, interaction: discord.Interaction):
+        """Show the football API quota governor's current state."""
+        if not await self.bot.is_owner(interaction.user):
+            await interaction.response.send_message("❌ Only the bot owner can view API quota.", ephemeral=True)
+            return
+        
+        quota = self.bot.football_api.quota.snapshot()
+        
+        def show(value):
+            return "Unknown" if value is None else str(value)
+        
+        embed = create_embed(
+            title="📈 Football API Quota",
+            color=self.config.COLORS["warning"] if quota['low'] else self.config.COLORS["info"]
+        )
+        embed.add_field(name="Daily Remaining", value=f"{show(quota['daily_remaining'])} / {show(quota['daily_limit'])}", inline=True)
+        embed.add_field(name="Minute Remaining", value=f"{show(quota['minute_remaining'])} / {quota['per_minute_limit']}", inline=True)
+        embed.add_field(name="Bucket Tokens", value=str(quota['tokens']), inline=True)
+        embed.add_field(name="Requests Made", value=str(quota['requests_made']), inline=True)
+        embed.add_field(name="Requests Throttled", value=str(quota['requests_throttled']), inline=True)
+        embed.add_field(name="Mode", value="Serving cached data" if quota['low'] else "Normal", inline=True)
+        if quota['daily_reset_at']:
+            embed.add_field(name="Daily Reset", value=f"<t:{int(quota['daily_reset_at'])}:R>", inline=True)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
     @app_commands.command(name="help", description="Get help with bot commands")
     async def help_command(self, interaction: discord.Interaction):
         """Display help information."""
@@ -818,7 +1199,12 @@ class UtilitiesCog(commands.Cog):
                   "• `/ban` - Ban a member\n"
                   "• `/unban` - Unban a user\n"
                   "• `/timeout` - Timeout a member\n"
-                  "• `/clear` - Clear messages",
+                  "• `/clear` - Clear messages\n"
+                  "• `/massban` `/masskick` `/masstimeout` - Raid cleanup\n"
+                  "• `/bulkban` - Ban a list of IDs\n"
+                  "• `/case` `/history` `/modstats` - Case log\n"
+                  "• `/antiraid` - Join raid protection\n"
+                  "• `/automod` - Spam filter",
             inline=True
         )
         
@@ -846,9 +1232,12 @@ class UtilitiesCog(commands.Cog):
             name="🔧 Utility Commands",
             value="• `/poll` - Create a poll\n"
                   "• `/pollresults` - Get poll results\n"
+                  "• `/polls` - List server polls\n"
                   "• `/remind` - Set a reminder\n"
+                  "• `/reminders` - List, cancel or snooze reminders\n"
                   "• `/weather` - Get weather info\n"
                   "• `/football` - Live football scores\n"
+                  "• `/livescores follow` - Live score updates\n"
                   "• `/timestamp` - Generate timestamps",
             inline=True
         )
@@ -878,4 +1267,5 @@ class UtilitiesCog(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
 async def setup(bot):
+    bot.mark_setup_started(__name__)
     await bot.add_cog(UtilitiesCog(bot))